@@ -0,0 +1,235 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Declarative achievement rules, indexed by the event type that can
+#          unlock them, with achievements represented as bitsets.
+
+# Standard library imports
+import operator
+from collections import Counter, namedtuple
+from collections.abc import MutableSet
+
+
+# Fields each event type carries; rules may only test these
+EVENT_FIELDS = {
+    # A choice's outcome was drawn: the scene, the option chosen (None for
+    # automatic scenes), whether it won or lost the game (None if the game
+    # goes on) and the name of the scene it leads to (None if it ends)
+    "outcome": ("scene", "choice", "won", "next"),
+    # A game ended, with its final result
+    "game_over": ("won", "score", "turns"),
+}
+
+
+def _ordered(compare):
+    """Wrap an ordering comparison so a missing (None) field never matches."""
+    return lambda value, operand: value is not None and compare(value, operand)
+
+
+# A rule's conditions map event fields to a required value, or to an
+# (operator, operand) pair such as (">=", 100)
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": _ordered(operator.lt),
+    "<=": _ordered(operator.le),
+    ">": _ordered(operator.gt),
+    ">=": _ordered(operator.ge),
+    "in": lambda value, options: value in options,
+}
+
+Rule = namedtuple("Rule", ["achievement", "event", "when"])
+
+RULES = (
+    Rule("Riddle Master", "outcome", {"scene": "riddle", "choice": "2"}),
+    Rule("Forest Explorer", "outcome", {"scene": "final_path", "won": True}),
+    Rule("Friend of the Forest", "outcome", {"scene": "squirrel", "won": True}),
+    Rule("Monster Slayer", "outcome", {"scene": "monster", "won": True}),
+    Rule("Treasure Hunter", "outcome", {"scene": "vault", "won": True}),
+    Rule("Ghost Whisperer", "outcome", {"scene": "ghost", "won": True}),
+)
+
+
+class AchievementEngine:
+    """Evaluates achievement rules against events and tracks them as bits.
+
+    Each achievement gets one bit, in the order rules first name it. The
+    table is fixed when the engine is built, so a bitset means the same in
+    every process and run; names no rule grants are rejected rather than
+    given a bit. Rules are indexed by event type and, when they test it, by
+    scene, so firing an event only evaluates the rules that could match it.
+    """
+
+    def __init__(self, rules=RULES):
+        self.names = tuple(dict.fromkeys(rule.achievement for rule in rules))
+        self.bits = {name: 1 << index for index, name in enumerate(self.names)}
+        self._index = {}
+        for rule in rules:
+            fields = EVENT_FIELDS.get(rule.event)
+            if fields is None:
+                raise ValueError(
+                    f"Rule for '{rule.achievement}' uses unknown event "
+                    f"'{rule.event}'"
+                )
+            conditions = []
+            for field, expected in rule.when.items():
+                if field not in fields:
+                    raise ValueError(
+                        f"Rule for '{rule.achievement}' tests '{field}', "
+                        f"which '{rule.event}' events do not carry"
+                    )
+                if isinstance(expected, tuple):
+                    if expected[0] not in OPERATORS:
+                        raise ValueError(
+                            f"Rule for '{rule.achievement}' uses unknown "
+                            f"operator '{expected[0]}'"
+                        )
+                    conditions.append(
+                        (field, OPERATORS[expected[0]], expected[1])
+                    )
+                else:
+                    conditions.append((field, operator.eq, expected))
+            # Rules pinned to one scene are only tried for that scene
+            scene = rule.when.get("scene")
+            if not isinstance(scene, str):
+                scene = None
+            by_scene = self._index.setdefault(rule.event, {})
+            by_scene.setdefault(scene, []).append(
+                (tuple(conditions), self.bits[rule.achievement])
+            )
+
+    def fire(self, event, **fields):
+        """Evaluate the rules an event can trigger.
+
+        Args:
+            event (str): The event type, a key of EVENT_FIELDS.
+            **fields: The event's fields.
+
+        Returns:
+            int: Bitset of the achievements the event unlocks.
+        """
+        by_scene = self._index.get(event)
+        if not by_scene:
+            return 0
+        mask = 0
+        for scene in (fields.get("scene"), None):
+            for conditions, bit in by_scene.get(scene, ()):
+                for field, test, operand in conditions:
+                    if not test(fields.get(field), operand):
+                        break
+                else:
+                    mask |= bit
+            if scene is None:
+                break
+        return mask
+
+    def bit(self, name):
+        """Return an achievement's bit.
+
+        Raises:
+            ValueError: If no rule grants the achievement.
+        """
+        bit = self.bits.get(name)
+        if bit is None:
+            raise ValueError(f"Unknown achievement: '{name}'")
+        return bit
+
+    def mask(self, achievements):
+        """Return the bitset for an iterable of achievement names.
+
+        Raises:
+            ValueError: If a name has no rule.
+        """
+        mask = 0
+        for achievement in achievements:
+            mask |= self.bit(achievement)
+        return mask
+
+    def names_of(self, mask):
+        """Return the achievement names in a bitset, in bit order."""
+        return tuple(
+            name for index, name in enumerate(self.names) if mask >> index & 1
+        )
+
+    def union(self, masks):
+        """Return the bitset of achievements anyone in masks has unlocked."""
+        union = 0
+        for mask in masks:
+            union |= mask
+        return union
+
+    def counts(self, masks):
+        """Count how many bitsets in masks contain each achievement.
+
+        Players are grouped by identical bitsets first, so large populations
+        with few distinct combinations are counted in one pass.
+
+        Returns:
+            Counter: Achievement name -> number of players holding it.
+        """
+        counts = Counter()
+        for mask, players in Counter(masks).items():
+            for name in self.names_of(mask):
+                counts[name] += players
+        return counts
+
+
+ENGINE = AchievementEngine()
+
+
+class AchievementSet(MutableSet):
+    """Set of achievement names stored as a bitset over ENGINE's bits.
+
+    Only achievements a rule grants can be added; add raises ValueError for
+    any other name.
+
+    Subclasses can keep the bits elsewhere by overriding mask with a
+    property, as compact.CompactGameState does.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, achievements=()):
+        self.mask = 0
+        if achievements:
+            for achievement in achievements:
+                self.add(achievement)
+
+    def __contains__(self, achievement):
+        bit = ENGINE.bits.get(achievement)
+        return bit is not None and bool(self.mask & bit)
+
+    def __iter__(self):
+        mask = self.mask
+        return iter(ENGINE.names_of(mask) if mask else ())
+
+    def __len__(self):
+        return bin(self.mask).count("1")
+
+    def add(self, achievement):
+        self.mask |= ENGINE.bit(achievement)
+
+    def discard(self, achievement):
+        bit = ENGINE.bits.get(achievement)
+        if bit is not None:
+            self.mask &= ~bit
+
+    def __repr__(self):
+        return repr(set(self))
@@ -0,0 +1,322 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: One-pass, constant-memory funnel reports over telemetry logs:
+#          choice counts, success rates, win rates and score distributions.
+
+# Standard library imports
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+# Local imports
+from scenes import GRAPH
+from telemetry import (
+    FILE_HEADER, MAGIC, OUTCOME, check_header, iter_binary, result_tag
+)
+
+
+# Scene names by the IDs binary records store
+SCENE_NAMES = tuple(scene.name for scene in GRAPH.by_id)
+
+# JSONL files larger than this are split into ranges across workers
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+class Funnel:
+    """Running totals over a stream of telemetry events.
+
+    Memory depends only on how many distinct scenes, choices, endings and
+    scores exist, never on how many events are read, and two Funnels built
+    from different parts of a log merge into the totals for the whole log.
+    """
+
+    def __init__(self):
+        self.events = 0
+        # (scene, choice, alternative index) -> times drawn
+        self.outcomes = Counter()
+        # (ending scene, won) -> games or encounters finished
+        self.results = Counter()
+        # ending scene -> Counter of final scores
+        self.scores = {}
+
+    def add_outcome(self, scene, choice, index):
+        self.events += 1
+        self.outcomes[(scene, choice, index)] += 1
+
+    def add_result(self, ending, won, score):
+        self.events += 1
+        self.results[(ending, won)] += 1
+        scores = self.scores.get(ending)
+        if scores is None:
+            scores = self.scores[ending] = Counter()
+        scores[score] += 1
+
+    def add_event(self, event):
+        """Count one event dict in the read_events layout."""
+        if event["type"] == "outcome":
+            self.add_outcome(event["scene"], event["choice"], event["outcome"])
+        else:
+            self.add_result(_ending(event), event["won"], event["score"])
+
+    def merge(self, other):
+        """Add another Funnel's totals to this one and return self."""
+        self.events += other.events
+        self.outcomes.update(other.outcomes)
+        self.results.update(other.results)
+        for ending, scores in other.scores.items():
+            self.scores.setdefault(ending, Counter()).update(scores)
+        return self
+
+    def report(self):
+        """Summarize the totals as a JSON-serializable dict.
+
+        Scenes list visits, how often each choice was picked, how often each
+        random alternative came up and the share of visits that did not end
+        in a loss (e.g. the riddle's success rate). Endings list, for each
+        scene games and encounters finished in, how many did, their win rate
+        and their score distribution; "-" collects those that timed out
+        before drawing any outcome.
+        """
+        scenes = {}
+        for (name, choice, index), count in sorted(
+                self.outcomes.items(), key=_outcome_order):
+            entry = scenes.setdefault(name, {
+                "visits": 0, "choices": {}, "outcomes": {}, "succeeded": 0
+            })
+            entry["visits"] += count
+            if choice is not None:
+                entry["choices"][choice] = (
+                    entry["choices"].get(choice, 0) + count
+                )
+            label = f"{choice or '-'}:{index}"
+            entry["outcomes"][label] = count
+            outcome = GRAPH[name].choices[choice][index]
+            if outcome.won is not False:
+                entry["succeeded"] += count
+        for entry in scenes.values():
+            entry["success_rate"] = entry.pop("succeeded") / entry["visits"]
+
+        endings = {}
+        for ending, scores in sorted(
+                self.scores.items(), key=lambda item: item[0] or ""):
+            games = sum(scores.values())
+            total = sum(score * count for score, count in scores.items())
+            endings[ending or "-"] = {
+                "games": games,
+                "win_rate": self.results[(ending, True)] / games,
+                "mean_score": total / games,
+                "scores": {
+                    str(score): count
+                    for score, count in sorted(scores.items())
+                },
+            }
+        return {"events": self.events, "scenes": scenes, "endings": endings}
+
+
+def _ending(event):
+    """Return the scene a result event ended in; version 1 logs tagged
+    results with the function that returned them instead."""
+    return event["scene"] if "scene" in event else event["source"]
+
+
+def _outcome_order(item):
+    (name, choice, index), _ = item
+    return name, choice or "", index
+
+
+def _aggregate_jsonl(data, start, end):
+    funnel = Funnel()
+    # Lines differ mostly by timestamp, so count each line with its "t"
+    # field cut out and parse every distinct remainder only once
+    lines = Counter()
+    position = start
+    while position < end:
+        newline = data.find(b"\n", position, end)
+        if newline < 0:
+            # A line without its newline was cut short by a crash
+            break
+        line = data[position:newline]
+        position = newline + 1
+        if not line:
+            continue
+        timestamp = line.find(b'"t":')
+        if timestamp >= 0:
+            comma = line.find(b",", timestamp)
+            if comma >= 0:
+                line = line[:timestamp] + line[comma + 1:]
+        lines[line] += 1
+
+    for line, count in lines.items():
+        event = json.loads(line)
+        funnel.events += count
+        if event["type"] == "outcome":
+            key = (event["scene"], event["choice"], event["outcome"])
+            funnel.outcomes[key] += count
+        else:
+            ending = _ending(event)
+            funnel.results[(ending, event["won"])] += count
+            scores = funnel.scores.setdefault(ending, Counter())
+            scores[event["score"]] += count
+    return funnel
+
+
+def _aggregate_binary(data):
+    version = check_header(data)
+    outcomes = Counter()
+    results = Counter()
+    scores = Counter()
+    events = 0
+    # Count raw IDs in the hot loop and translate to names once at the end
+    for kind, _, first, second, third, *_ in iter_binary(data):
+        events += 1
+        if kind == OUTCOME:
+            outcomes[(first, second, third)] += 1
+        else:
+            results[(first, second)] += 1
+            scores[(first, third)] += 1
+
+    named = Funnel()
+    named.events = events
+    for (scene_id, choice, index), count in outcomes.items():
+        key = (SCENE_NAMES[scene_id], str(choice) if choice else None, index)
+        named.outcomes[key] += count
+    endings = {}
+    for (tag_id, won), count in results.items():
+        if tag_id not in endings:
+            endings[tag_id] = result_tag(version, tag_id)[1]
+        named.results[(endings[tag_id], won)] += count
+    for (tag_id, score), count in scores.items():
+        named.scores.setdefault(endings[tag_id], Counter())[score] += count
+    return named
+
+
+def aggregate_range(task):
+    """Aggregate one file, or one line-aligned byte range of a JSONL file.
+
+    Args:
+        task (tuple): (filename, start, end); end None means to the end.
+
+    Returns:
+        Funnel: Totals for that part of the log.
+    """
+    filename, start, end = task
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return Funnel()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(MAGIC)] == MAGIC:
+                return _aggregate_binary(data)
+            return _aggregate_jsonl(
+                data, start, len(data) if end is None else end
+            )
+
+
+def plan(filenames, chunk_bytes=CHUNK_BYTES):
+    """Split logs into aggregate_range tasks.
+
+    Binary files are one task each, since their records differ in size and
+    cannot be found from an arbitrary offset; JSONL files are cut into
+    chunks at line boundaries.
+
+    Args:
+        filenames (list): Telemetry files of either format.
+        chunk_bytes (int): Target size of each JSONL chunk.
+
+    Returns:
+        list: (filename, start, end) tuples.
+    """
+    tasks = []
+    for filename in filenames:
+        size = os.path.getsize(filename)
+        with open(filename, "rb") as f:
+            binary = f.read(FILE_HEADER.size).startswith(MAGIC)
+            if binary or size <= chunk_bytes:
+                tasks.append((filename, 0, None))
+                continue
+            start = 0
+            while start < size:
+                f.seek(min(start + chunk_bytes, size))
+                f.readline()
+                end = min(f.tell(), size)
+                tasks.append((filename, start, end))
+                start = end
+    return tasks
+
+
+def aggregate(filenames, workers=1, chunk_bytes=CHUNK_BYTES):
+    """Aggregate telemetry logs in one pass, optionally across processes.
+
+    Args:
+        filenames (list): Telemetry files of either format.
+        workers (int): Processes to fan out over; 1 runs in this process.
+        chunk_bytes (int): Target size of each JSONL chunk.
+
+    Returns:
+        Funnel: Totals for every event in the logs.
+    """
+    tasks = plan(filenames, chunk_bytes)
+    funnel = Funnel()
+    if workers > 1 and len(tasks) > 1:
+        with Pool(workers) as pool:
+            for part in pool.imap_unordered(aggregate_range, tasks):
+                funnel.merge(part)
+    else:
+        for task in tasks:
+            funnel.merge(aggregate_range(task))
+    return funnel
+
+
+def main():
+    """Print a funnel report for telemetry logs as JSON."""
+    parser = argparse.ArgumentParser(
+        description="Summarize telemetry logs written by game.py --telemetry."
+    )
+    parser.add_argument("logs", nargs="+", help="telemetry files")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="processes to spread the files and chunks over"
+    )
+    parser.add_argument(
+        "--chunk-mb", type=float, default=CHUNK_BYTES / (1024 * 1024),
+        help="size of the pieces large JSONL files are split into"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    funnel = aggregate(
+        args.logs, args.workers, int(args.chunk_mb * 1024 * 1024)
+    )
+    elapsed = time.perf_counter() - start
+    print(json.dumps(funnel.report(), indent=2, ensure_ascii=False))
+    print(
+        f"Aggregated {funnel.events:,} events in {elapsed:.3f}s "
+        f"({funnel.events / max(elapsed, 1e-9):,.0f} events/sec)",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Benchmark memory per live game state for GameState versus
+#          CompactGameState after random playthroughs.
+
+# Standard library imports
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from compact import CompactGameState  # noqa: E402
+from gamestate import GameState  # noqa: E402
+from scenes import play  # noqa: E402
+from simulation import RandomPolicy  # noqa: E402
+
+
+def measure(state_class, count, seed):
+    """Play count games and return (bytes per state, seconds per game)."""
+    rng = random.Random(seed)
+    policy = RandomPolicy(rng)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    states = []
+    for _ in range(count):
+        game_state = state_class()
+        play(game_state, policy, rng)
+        states.append(game_state)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / count, elapsed / count
+
+
+def main():
+    """Print memory and play time per state for both representations."""
+    parser = argparse.ArgumentParser(
+        description="Compare memory used by GameState and CompactGameState."
+    )
+    parser.add_argument("-n", "--states", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for state_class in (GameState, CompactGameState):
+        per_state, per_game = measure(state_class, args.states, args.seed)
+        print(
+            f"{state_class.__name__:<17} bytes/state={per_state:7.1f} "
+            f"us/game={per_game * 1e6:6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Benchmark write syscalls and render time per playthrough for the
+#          per-line print path versus the buffered, pre-colored renderer.
+
+# Standard library imports
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Third-party imports
+from colorama import Fore, Style  # noqa: E402
+
+# Local imports
+from gamestate import GameState  # noqa: E402
+from render import BufferedRenderer  # noqa: E402
+from scenes import play  # noqa: E402
+from simulation import RandomPolicy  # noqa: E402
+
+
+class CountingSink(io.RawIOBase):
+    """Unbuffered byte sink that counts write() calls, i.e. syscalls."""
+
+    def __init__(self):
+        self.writes = 0
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes += 1
+        self.bytes += len(data)
+        return len(data)
+
+
+def terminal_stream(sink):
+    """Wrap a sink like an interactive stdout: line-buffered text."""
+    return io.TextIOWrapper(sink, encoding="utf-8", line_buffering=True)
+
+
+def run_per_line(games, seed):
+    """Render games the way print_sleep does: one colored print per line."""
+    sink = CountingSink()
+    stream = terminal_stream(sink)
+
+    def render(color, text):
+        print(getattr(Fore, color) + text + Style.RESET_ALL, file=stream)
+
+    rng = random.Random(seed)
+    policy = RandomPolicy(rng)
+    for _ in range(games):
+        play(GameState(), policy, rng, render)
+    stream.flush()
+    return sink
+
+
+def run_buffered(games, seed):
+    """Render games through BufferedRenderer, flushing once per scene."""
+    sink = CountingSink()
+    renderer = BufferedRenderer(terminal_stream(sink))
+    rng = random.Random(seed)
+    policy = renderer.wrap_policy(RandomPolicy(rng))
+    for _ in range(games):
+        play(GameState(), policy, rng, renderer)
+        renderer.flush()
+    return sink
+
+
+def main():
+    """Compare both render paths and print writes and time per playthrough."""
+    parser = argparse.ArgumentParser(
+        description="Compare per-line and buffered rendering."
+    )
+    parser.add_argument("-n", "--games", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for name, runner in (("per-line", run_per_line),
+                         ("buffered", run_buffered)):
+        start = time.perf_counter()
+        sink = runner(args.games, args.seed)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<9} writes/game={sink.writes / args.games:6.2f} "
+            f"bytes/game={sink.bytes / args.games:7.1f} "
+            f"us/game={elapsed / args.games * 1e6:7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
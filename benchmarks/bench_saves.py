@@ -0,0 +1,98 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Benchmark save file size and load time for the JSON save format
+#          versus the compact binary format.
+
+# Standard library imports
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from gamestate import GameState  # noqa: E402
+from savefile import decode  # noqa: E402
+from scenes import play  # noqa: E402
+from simulation import RandomPolicy  # noqa: E402
+
+
+def played_states(count, seed):
+    """Return game states from random playthroughs, as saves would hold."""
+    rng = random.Random(seed)
+    policy = RandomPolicy(rng)
+    states = []
+    for _ in range(count):
+        game_state = GameState()
+        play(game_state, policy, rng)
+        states.append(game_state)
+    return states
+
+
+def write_saves(states, directory, binary):
+    """Save every state to its own file; return the file names."""
+    filenames = []
+    for index, game_state in enumerate(states):
+        filename = os.path.join(directory, f"player{index}.sav")
+        game_state.save(filename, binary=binary)
+        filenames.append(filename)
+    return filenames
+
+
+def main():
+    """Write saves in both formats; print size, load and decode time."""
+    parser = argparse.ArgumentParser(
+        description="Compare JSON and binary save files."
+    )
+    parser.add_argument("-n", "--saves", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    states = played_states(args.saves, args.seed)
+    for name, binary in (("json", False), ("binary", True)):
+        with tempfile.TemporaryDirectory() as directory:
+            filenames = write_saves(states, directory, binary)
+            size = sum(os.path.getsize(filename) for filename in filenames)
+            start = time.perf_counter()
+            for filename in filenames:
+                GameState.load(filename)
+            elapsed = time.perf_counter() - start
+            contents = []
+            for filename in filenames:
+                with open(filename, "rb") as f:
+                    contents.append(f.read())
+        # Decoding alone, without the file system, isolates parsing cost
+        start = time.perf_counter()
+        for data in contents:
+            decode(data)
+        decode_elapsed = time.perf_counter() - start
+        print(
+            f"{name:<7} bytes/save={size / args.saves:6.1f} "
+            f"us/load={elapsed / args.saves * 1e6:7.2f} "
+            f"us/decode={decode_elapsed / args.saves * 1e6:6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
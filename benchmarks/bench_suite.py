@@ -0,0 +1,233 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Repeatable benchmark suite for encounter handlers, full games,
+#          save/load and startup, compared against a stored baseline.
+
+# Standard library imports
+import argparse
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Local imports
+import game  # noqa: E402
+from achievements import ENGINE, AchievementSet  # noqa: E402
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "baseline.json")
+
+HANDLERS = (
+    "handle_riddle",
+    "handle_squirrel_encounter",
+    "handle_monster_encounter",
+    "handle_final_path",
+    "handle_treasure_vault",
+    "handle_ghostly_encounter",
+)
+
+# (items, achievements) held by the saved state
+SAVE_SIZES = ((0, 0), (10, 6), (100, 6))
+
+
+def stub_io():
+    """Silence output; prompts are answered by reset_inputs().
+
+    Returns:
+        callable: Undoes the stubbing.
+    """
+    saved = game.print_sleep, game.render_line, game.read_input
+    game.print_sleep = lambda message, color="", sleep_duration=0.5: None
+    game.render_line = lambda color, text: None
+    reset_inputs()
+
+    def restore():
+        game.print_sleep, game.render_line, game.read_input = saved
+
+    return restore
+
+
+def reset_inputs():
+    """Restart the stubbed answers (cycling 1, 2, 3) and the global RNG.
+
+    Called before each benchmark so every run takes the same paths through
+    the encounters, whatever ran before it.
+    """
+    answers = itertools.cycle("123")
+    game.read_input = lambda prompt="": next(answers)
+    random.seed(0)
+
+
+def best_time(function, number, repeat):
+    """Return the fastest per-call time of function over repeat runs."""
+    timer = timeit.Timer(function)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bench_handlers(number, repeat):
+    results = {}
+    for name in HANDLERS:
+        handler = getattr(game, name)
+        reset_inputs()
+        results[f"handler.{name}"] = best_time(
+            lambda: handler(0), number, repeat
+        )
+    return results
+
+
+def bench_play_game(number, repeat):
+    reset_inputs()
+    return {
+        "play_game": best_time(lambda: game.play_game(0, 0, 10), number, repeat)
+    }
+
+
+def sized_state(items, achievements):
+    """Return a GameState holding the given numbers of items/achievements."""
+    game_state = game.GameState()
+    game_state.inventory.items = {f"item{i}": i + 1 for i in range(items)}
+    game_state.achievements = AchievementSet(ENGINE.names[:achievements])
+    return game_state
+
+
+def bench_saves(number, repeat):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for items, achievements in SAVE_SIZES:
+            game_state = sized_state(items, achievements)
+            for binary in (False, True):
+                kind = "binary" if binary else "json"
+                filename = os.path.join(directory, f"save-{kind}")
+                label = f"{kind}.items{items}.achievements{achievements}"
+                results[f"save.{label}"] = best_time(
+                    lambda: game_state.save(filename, binary=binary),
+                    max(1, number // 10), repeat
+                )
+                results[f"load.{label}"] = best_time(
+                    lambda: game.GameState.load(filename), number, repeat
+                )
+    return results
+
+
+def bench_import(repeat):
+    """Time a fresh interpreter importing game, minus bare startup."""
+    def run(code):
+        return best_time(
+            lambda: subprocess.run(
+                [sys.executable, "-c", code], cwd=ROOT, check=True
+            ),
+            1, repeat
+        )
+
+    return {"import.game": max(0.0, run("import game") - run("pass"))}
+
+
+def run_suite(number=2000, repeat=5):
+    """Run every benchmark; return {name: seconds per operation}."""
+    results = {}
+    restore = stub_io()
+    try:
+        results.update(bench_handlers(number, repeat))
+        results.update(bench_play_game(number, repeat))
+    finally:
+        restore()
+    results.update(bench_saves(number, repeat))
+    results.update(bench_import(repeat))
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return (name, baseline, current) for results slower than allowed.
+
+    Args:
+        results (dict): Current {name: seconds}.
+        baseline (dict): Baseline {name: seconds}.
+        threshold (float): Allowed slowdown, e.g. 0.25 for 25%.
+    """
+    return [
+        (name, baseline[name], seconds)
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)
+    ]
+
+
+def main():
+    """Run the suite, print results, and check them against the baseline."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the game and flag regressions."
+    )
+    parser.add_argument("-n", "--number", type=int, default=2000,
+                        help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing runs per benchmark; the fastest counts")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="full passes over the suite; the fastest counts")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown that counts as a regression")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    # Interleaved rounds ride out noise (e.g. fsync stalls) better than
+    # more repeats of one benchmark in a row
+    results = {}
+    for _ in range(args.rounds):
+        for name, seconds in run_suite(args.number, args.repeat).items():
+            results[name] = min(seconds, results.get(name, seconds))
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    for name, seconds in results.items():
+        line = f"{name:<50} {seconds * 1e6:10.2f} us"
+        if name in baseline:
+            change = seconds / baseline[name] - 1 if baseline[name] else 0.0
+            line += f"  ({change:+.0%} vs baseline)"
+        print(line)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(
+            f"REGRESSION {name}: {before * 1e6:.2f} us -> "
+            f"{after * 1e6:.2f} us"
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
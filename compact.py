@@ -0,0 +1,307 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Memory-compact GameState and Inventory for servers holding very
+#          many live sessions, with the same API and save format.
+
+# Standard library imports
+from array import array
+from collections.abc import MutableMapping
+
+# Local imports
+from achievements import AchievementSet
+from gamestate import GameState
+from scenes import GRAPH
+
+
+class Interner:
+    """Assigns small integer IDs to names, in first-seen order."""
+
+    __slots__ = ("names", "ids")
+
+    def __init__(self, names=()):
+        self.names = []
+        self.ids = {}
+        for name in names:
+            self.id(name)
+
+    def id(self, name):
+        """Return the name's ID, assigning the next free one if it is new."""
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+
+def _graph_items(graph=GRAPH):
+    """Collect the items outcomes grant, in scene-graph order."""
+    return [
+        item
+        for scene in graph.by_id
+        for outcomes in scene.choices.values()
+        for outcome in outcomes
+        for item in outcome.items
+    ]
+
+
+# Shared by every compact state, so IDs agree across sessions. Achievement
+# bits come from the achievement engine's table, so masks can go straight to
+# ENGINE.union() and ENGINE.counts().
+ITEMS = Interner(_graph_items())
+
+STATS = ("health", "strength", "magic", "luck")
+
+
+class ItemsView(MutableMapping):
+    """Dict view of a CompactInventory's item counts.
+
+    Writes go straight to the count array. A count of zero is the same as no
+    entry, so setting an item to 0 removes it.
+    """
+
+    __slots__ = ("inventory",)
+
+    def __init__(self, inventory):
+        self.inventory = inventory
+
+    def __getitem__(self, item_name):
+        quantity = self.inventory._count(item_name)
+        if not quantity:
+            raise KeyError(item_name)
+        return quantity
+
+    def __setitem__(self, item_name, quantity):
+        self.inventory._set(ITEMS.id(item_name), quantity)
+
+    def __delitem__(self, item_name):
+        if not self.inventory._count(item_name):
+            raise KeyError(item_name)
+        self.inventory._set(ITEMS.ids[item_name], 0)
+
+    def __iter__(self):
+        counts = self.inventory._counts
+        if counts is None:
+            return iter(())
+        names = ITEMS.names
+        return (
+            names[item_id]
+            for item_id, quantity in enumerate(counts)
+            if quantity
+        )
+
+    def __len__(self):
+        return len(self.inventory)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class CompactInventory:
+    """Inventory storing item counts in an array indexed by interned item ID.
+
+    Behaves like Inventory, including the capacity check; items is a live
+    dict view and accepts a dict on assignment.
+    """
+
+    __slots__ = ("capacity", "_counts")
+
+    def __init__(self):
+        self.capacity = 10
+        self._counts = None
+
+    @property
+    def items(self):
+        return ItemsView(self)
+
+    @items.setter
+    def items(self, items):
+        # Copy first, in case items is this inventory's own view
+        items = list(items.items())
+        self._counts = None
+        for item_name, quantity in items:
+            self._set(ITEMS.id(item_name), quantity)
+
+    def _set(self, item_id, quantity):
+        counts = self._counts
+        if counts is None:
+            counts = self._counts = array("i")
+        if item_id >= len(counts):
+            counts.extend([0] * (item_id + 1 - len(counts)))
+        counts[item_id] = quantity
+
+    def _count(self, item_name):
+        item_id = ITEMS.ids.get(item_name)
+        counts = self._counts
+        if item_id is None or counts is None or item_id >= len(counts):
+            return 0
+        return counts[item_id]
+
+    def __len__(self):
+        if self._counts is None:
+            return 0
+        return sum(1 for quantity in self._counts if quantity)
+
+    def add_item(self, item_name, quantity=1):
+        if len(self) >= self.capacity:
+            return False
+        self._set(ITEMS.id(item_name), self._count(item_name) + quantity)
+        return True
+
+    def remove_item(self, item_name, quantity=1):
+        current = self._count(item_name)
+        if current and current >= quantity:
+            self._set(ITEMS.ids[item_name], current - quantity)
+            return True
+        return False
+
+    def has_item(self, item_name):
+        return self._count(item_name) > 0
+
+    def get_items(self):
+        if self._counts is None:
+            return {}
+        names = ITEMS.names
+        return {
+            names[item_id]: quantity
+            for item_id, quantity in enumerate(self._counts)
+            if quantity
+        }
+
+
+class AchievementView(AchievementSet):
+    """Set view of a CompactGameState's achievement bitmask."""
+
+    __slots__ = ("state",)
+
+    def __init__(self, state):
+        self.state = state
+
+    @property
+    def mask(self):
+        return self.state.achievement_mask
+
+    @mask.setter
+    def mask(self, mask):
+        self.state.achievement_mask = mask
+
+
+class StatsView(MutableMapping):
+    """Dict view of a CompactGameState's character stats.
+
+    The four fixed stats are plain fields; any other stat, such as one from a
+    save written by a newer version, goes in an overflow dict that is only
+    created when needed.
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, state):
+        self.state = state
+
+    def __getitem__(self, name):
+        if name in STATS:
+            return getattr(self.state, name)
+        extra_stats = self.state.extra_stats
+        if extra_stats is None:
+            raise KeyError(name)
+        return extra_stats[name]
+
+    def __setitem__(self, name, value):
+        if name in STATS:
+            setattr(self.state, name, value)
+        elif self.state.extra_stats is None:
+            self.state.extra_stats = {name: value}
+        else:
+            self.state.extra_stats[name] = value
+
+    def __delitem__(self, name):
+        if name in STATS:
+            raise KeyError(f"Character stats cannot be removed: {name}")
+        extra_stats = self.state.extra_stats
+        if extra_stats is None:
+            raise KeyError(name)
+        del extra_stats[name]
+        if not extra_stats:
+            self.state.extra_stats = None
+
+    def __iter__(self):
+        yield from STATS
+        if self.state.extra_stats is not None:
+            yield from list(self.state.extra_stats)
+
+    def __len__(self):
+        extra_stats = self.state.extra_stats
+        return len(STATS) + (len(extra_stats) if extra_stats else 0)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class CompactGameState:
+    """GameState with __slots__, stats as plain fields and an achievement mask.
+
+    achievements and character_stats are live set and dict views, so code
+    written against GameState works unchanged, and saves use the same
+    format, so either class can load the other's saves.
+    """
+
+    __slots__ = (
+        "score", "turns", "max_turns", "inventory", "achievement_mask",
+        "health", "strength", "magic", "luck", "extra_stats"
+    )
+
+    def __init__(self):
+        self.score = 0
+        self.turns = 0
+        self.max_turns = 10
+        self.inventory = CompactInventory()
+        self.achievement_mask = 0
+        self.health = 100
+        self.strength = 10
+        self.magic = 5
+        self.luck = 5
+        self.extra_stats = None
+
+    @property
+    def achievements(self):
+        return AchievementView(self)
+
+    @achievements.setter
+    def achievements(self, achievements):
+        self.achievement_mask = AchievementSet(achievements).mask
+
+    @property
+    def character_stats(self):
+        return StatsView(self)
+
+    @character_stats.setter
+    def character_stats(self, stats):
+        # Replaces the extra stats, like assigning GameState's dict; the
+        # fixed stats cannot be removed, so missing ones keep their values
+        self.extra_stats = None
+        for name, value in stats.items():
+            self.character_stats[name] = value
+
+    # Saving only goes through the public attributes, so share GameState's
+    to_save_data = GameState.to_save_data
+    save = GameState.save
+    from_save_data = classmethod(GameState.from_save_data.__func__)
+    load = classmethod(GameState.load.__func__)
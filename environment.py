@@ -0,0 +1,177 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Gym-style vectorized environment that steps thousands of games in
+#          lockstep for policy training.
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+from vectorized import default_arrays, draw_outcomes
+
+
+# Columns of the observation array
+OBS_SCENE = 0
+OBS_TURNS_LEFT = 1
+OBS_SCORE = 2
+
+
+class VectorEnv:
+    """N games held in arrays and advanced together with reset()/step().
+
+    Each game waits at a scene that prompts the player. An action is the
+    0-based index of an option at that scene. Turn costs, automatic scenes
+    and random outcomes between prompts are applied inside step(). Finished
+    games are reset automatically unless autoreset is False.
+    """
+
+    def __init__(self, num_envs, max_turns=10, seed=None, autoreset=True,
+                 arrays=None):
+        self.num_envs = num_envs
+        self.max_turns = max_turns
+        self.autoreset = autoreset
+        self.arrays = arrays or default_arrays()
+        self.rng = np.random.default_rng(seed)
+        self.max_options = self.arrays.offset.shape[1]
+
+        self.scene = np.zeros(num_envs, dtype=np.int64)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.turns = np.zeros(num_envs, dtype=np.int64)
+        self.achievements = np.zeros(num_envs, dtype=np.uint64)
+        self.done = np.zeros(num_envs, dtype=bool)
+        self.won = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed=None):
+        """Start a fresh game in every environment.
+
+        Args:
+            seed (int): Optional new seed for the environments' RNG.
+
+        Returns:
+            numpy.ndarray: Observations, shape (num_envs, 3).
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset(np.arange(self.num_envs))
+        return self.observations()
+
+    def step(self, actions):
+        """Apply one action per environment and advance to the next prompt.
+
+        Args:
+            actions (array-like): Option index per environment. Ignored for
+                                  finished games when autoreset is False.
+
+        Returns:
+            tuple: (observations, rewards, dones, info). Rewards are the score
+                   deltas earned during the step. dones marks games that
+                   ended during the step. info holds "won", "final_score"
+                   and "final_turns" arrays, valid where dones is True.
+
+        Raises:
+            ValueError: If an action is not a valid option for its scene.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        rewards = np.zeros(self.num_envs, dtype=np.float64)
+        live = np.flatnonzero(~self.done)
+        current = self.scene[live]
+        chosen = actions[live]
+        valid = self.arrays.option_count[current]
+        if np.any((chosen < 0) | (chosen >= valid)):
+            raise ValueError("Action out of range for the current scene")
+
+        outcome = draw_outcomes(self.arrays, current, chosen, self.rng)
+        moving = self._apply(live, outcome, rewards)
+        self._arrive(moving, rewards)
+
+        dones = self.done.copy()
+        info = {
+            "won": self.won.copy(),
+            "final_score": self.score.copy(),
+            "final_turns": self.turns.copy(),
+        }
+        if self.autoreset and dones.any():
+            self._reset(np.flatnonzero(dones))
+        return self.observations(), rewards, dones, info
+
+    def observations(self):
+        """Return the (scene id, turns left, score) observation array."""
+        obs = np.empty((self.num_envs, 3), dtype=np.int64)
+        obs[:, OBS_SCENE] = self.scene
+        obs[:, OBS_TURNS_LEFT] = self.max_turns - self.turns
+        obs[:, OBS_SCORE] = self.score
+        return obs
+
+    def action_mask(self):
+        """Return a (num_envs, max_options) mask of valid actions."""
+        counts = self.arrays.option_count[self.scene]
+        mask = np.arange(self.max_options) < counts[:, None]
+        mask[self.done] = False
+        return mask
+
+    def _reset(self, index):
+        """Put the given environments back at the start of a new game."""
+        self.scene[index] = self.arrays.start
+        self.score[index] = 0
+        self.turns[index] = 0
+        self.achievements[index] = 0
+        self.done[index] = False
+        self.won[index] = False
+        self._arrive(index, np.zeros(self.num_envs, dtype=np.float64))
+
+    def _apply(self, index, outcome, rewards):
+        """Apply drawn outcomes; return the games that moved to a new scene."""
+        delta = self.arrays.score[outcome]
+        self.score[index] += delta
+        rewards[index] += delta
+        self.achievements[index] |= self.arrays.achievements[outcome]
+        following = self.arrays.next[outcome]
+        finished = following < 0
+        ended = index[finished]
+        self.done[ended] = True
+        self.won[ended] = self.arrays.won[outcome[finished]]
+        moving = index[~finished]
+        self.scene[moving] = following[~finished]
+        return moving
+
+    def _arrive(self, index, rewards):
+        """Charge turn costs and resolve automatic scenes up to a prompt."""
+        arrays = self.arrays
+        while index.size:
+            current = self.scene[index]
+            ticking = arrays.tick[current]
+            self.turns[index] += ticking
+            timed_out = ticking & (self.turns[index] >= self.max_turns)
+            if timed_out.any():
+                self.done[index[timed_out]] = True
+                self.won[index[timed_out]] = False
+                index = index[~timed_out]
+                current = current[~timed_out]
+
+            automatic = arrays.option_count[current] == 0
+            index = index[automatic]
+            if not index.size:
+                break
+            outcome = draw_outcomes(
+                arrays, current[automatic],
+                np.zeros(index.size, dtype=np.int64), self.rng
+            )
+            index = self._apply(index, outcome, rewards)
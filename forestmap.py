@@ -0,0 +1,416 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: The monster's map: a large generated grid of forest tiles with
+#          points of interest, and A* routes over it guided by precomputed
+#          landmark distance tables, with a cache of recent routes.
+
+# Standard library imports
+import argparse
+import heapq
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+
+# Cost of entering each terrain; 0 is impassable (rivers and cliffs). A step
+# costs the sum of the two tiles' costs, so routes are the same both ways.
+TERRAIN = {
+    "river": 0,
+    "trail": 1,
+    "forest": 2,
+    "thicket": 4,
+}
+# Share of tiles of each cost, out of 256
+TERRAIN_SHARES = ((0, 20), (1, 90), (2, 102), (4, 44))
+# Maps a random byte to a tile cost in one bytes.translate() call
+_COST_TABLE = bytes(
+    cost for cost, share in TERRAIN_SHARES for _ in range(share)
+)
+
+POINTS_OF_INTEREST = ("castle", "village", "vault")
+
+# Larger than any real distance; marks tiles a landmark cannot reach
+UNREACHABLE = 2 ** 62
+
+MAP_FILE_VERSION = 1
+
+
+class ForestMap:
+    """A width x height grid of forest tiles generated from a seed.
+
+    Tiles are numbered row by row (index = y * width + x). The start is
+    the middle of the map; points of interest are placed at random
+    passable tiles. The same seed and size always give the same map.
+
+    Landmark tables hold the exact distance from a landmark to every tile.
+    They make A*'s heuristic much tighter than straight-line distance, and
+    when the goal is itself a landmark (every point of interest is one) the
+    heuristic is exact and A* only expands tiles along the route.
+    """
+
+    def __init__(self, seed, width=1024, height=1024, cache_size=1024):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        rng = random.Random(f"forestmap:{seed}:{width}:{height}")
+        self.costs = bytearray(
+            rng.randbytes(width * height).translate(_COST_TABLE)
+        )
+        self.start = self._clear(width // 2, height // 2)
+        self.points = {}
+        for name in POINTS_OF_INTEREST:
+            self.points[name] = self._clear(
+                rng.randrange(width), rng.randrange(height)
+            )
+        # tile index -> array of distances from that tile
+        self.landmarks = {}
+        self.cache_size = cache_size
+        self._routes = OrderedDict()
+
+    def _clear(self, x, y):
+        """Make a tile and its neighbours passable; return its index."""
+        index = y * self.width + x
+        for neighbour in (index, *self._neighbours(index)):
+            if not self.costs[neighbour]:
+                self.costs[neighbour] = TERRAIN["trail"]
+        return index
+
+    def _neighbours(self, index):
+        width = self.width
+        x = index % width
+        if x:
+            yield index - 1
+        if x < width - 1:
+            yield index + 1
+        if index >= width:
+            yield index - width
+        if index < len(self.costs) - width:
+            yield index + width
+
+    def index(self, x, y):
+        """Return the tile index of a coordinate."""
+        return y * self.width + x
+
+    def coordinates(self, index):
+        """Return the (x, y) coordinate of a tile index."""
+        return index % self.width, index // self.width
+
+    def distances_from(self, source):
+        """Run Dijkstra from a tile over the whole map.
+
+        Args:
+            source (int): Tile index to measure from.
+
+        Returns:
+            array: Distance to every tile, UNREACHABLE where there is no
+                   route.
+        """
+        costs = self.costs
+        width = self.width
+        last_row = len(costs) - width
+        distances = array("q", [UNREACHABLE]) * len(costs)
+        distances[source] = 0
+        heap = [(0, source)]
+        while heap:
+            distance, index = heapq.heappop(heap)
+            if distance > distances[index]:
+                continue
+            cost = costs[index]
+            x = index % width
+            for neighbour in (
+                index - 1 if x else -1,
+                index + 1 if x < width - 1 else -1,
+                index - width,
+                index + width if index < last_row else -1,
+            ):
+                if neighbour < 0 or not costs[neighbour]:
+                    continue
+                candidate = distance + cost + costs[neighbour]
+                if candidate < distances[neighbour]:
+                    distances[neighbour] = candidate
+                    heapq.heappush(heap, (candidate, neighbour))
+        return distances
+
+    def add_landmarks(self, sources=None):
+        """Precompute landmark tables, by default for every point of interest.
+
+        Args:
+            sources (list): Tile indexes to use as landmarks.
+        """
+        if sources is None:
+            sources = self.points.values()
+        for source in sources:
+            if source not in self.landmarks:
+                self.landmarks[source] = self.distances_from(source)
+        self._routes.clear()
+
+    def save_landmarks(self, filename):
+        """Write the landmark tables to a file, to skip recomputing them."""
+        header = array("q", [
+            MAP_FILE_VERSION, self.seed, self.width, self.height,
+            len(self.landmarks)
+        ])
+        with open(filename, "wb") as f:
+            header.tofile(f)
+            array("q", self.landmarks).tofile(f)
+            for table in self.landmarks.values():
+                table.tofile(f)
+
+    def load_landmarks(self, filename):
+        """Read landmark tables saved for this exact map.
+
+        Returns:
+            bool: True if the file existed and matched this map's seed and
+                  size; False leaves the landmarks unchanged.
+        """
+        try:
+            with open(filename, "rb") as f:
+                header = array("q")
+                header.fromfile(f, 5)
+                version, seed, width, height, count = header
+                if (version != MAP_FILE_VERSION or seed != self.seed
+                        or (width, height) != (self.width, self.height)):
+                    return False
+                sources = array("q")
+                sources.fromfile(f, count)
+                # Read every table before touching self.landmarks, so a
+                # file cut short leaves them as they were
+                tables = []
+                for _ in sources:
+                    table = array("q")
+                    table.fromfile(f, len(self.costs))
+                    tables.append(table)
+        except (FileNotFoundError, EOFError):
+            return False
+        self.landmarks.update(zip(sources, tables))
+        self._routes.clear()
+        return True
+
+    def _heuristic(self, goal):
+        """Build an admissible estimate of the distance from a tile to goal.
+
+        With landmarks, the triangle inequality gives
+        |d(L, goal) - d(L, tile)| <= d(tile, goal) for every landmark L;
+        the largest of these bounds is used. Without landmarks, each step
+        costs at least 2, so twice the Manhattan distance is a bound.
+        """
+        if goal in self.landmarks:
+            return self.landmarks[goal].__getitem__
+        if self.landmarks:
+            tables = [
+                (table, table[goal]) for table in self.landmarks.values()
+            ]
+
+            def estimate(index):
+                return max(abs(to_goal - table[index])
+                           for table, to_goal in tables)
+
+            return estimate
+
+        width = self.width
+        goal_x, goal_y = goal % width, goal // width
+
+        def manhattan(index):
+            return 2 * (abs(index % width - goal_x)
+                        + abs(index // width - goal_y))
+
+        return manhattan
+
+    def route(self, start, goal):
+        """Find the cheapest route between two tiles with A*.
+
+        Recent routes are cached, in both directions, so repeated queries
+        are a dictionary lookup.
+
+        Args:
+            start (int): Tile index to start from.
+            goal (int): Tile index to reach.
+
+        Returns:
+            tuple: (cost, path) where path lists tile indexes from start to
+                   goal inclusive, or None if goal cannot be reached.
+        """
+        key = (start, goal)
+        cached = self._routes.get(key)
+        if cached is None and (goal, start) in self._routes:
+            reverse = self._routes[(goal, start)]
+            cached = reverse and (reverse[0], reverse[1][::-1])
+            self._routes[key] = cached
+        if cached is not None or key in self._routes:
+            self._routes.move_to_end(key)
+            return cached
+
+        found = self._search(start, goal)
+        self._routes[key] = found
+        if len(self._routes) > self.cache_size:
+            self._routes.popitem(last=False)
+        return found
+
+    def _search(self, start, goal):
+        costs = self.costs
+        if not costs[start] or not costs[goal]:
+            return None
+        width = self.width
+        last_row = len(costs) - width
+        estimate = self._heuristic(goal)
+        best = {start: 0}
+        parents = {start: None}
+        # Ties on f go to the deeper entry, which follows an exact
+        # heuristic straight down the route
+        heap = [(estimate(start), 0, start)]
+        while heap:
+            _, negative_distance, index = heapq.heappop(heap)
+            distance = -negative_distance
+            if index == goal:
+                path = []
+                while index is not None:
+                    path.append(index)
+                    index = parents[index]
+                return distance, path[::-1]
+            if distance > best[index]:
+                continue
+            cost = costs[index]
+            x = index % width
+            for neighbour in (
+                index - 1 if x else -1,
+                index + 1 if x < width - 1 else -1,
+                index - width,
+                index + width if index < last_row else -1,
+            ):
+                if neighbour < 0 or not costs[neighbour]:
+                    continue
+                candidate = distance + cost + costs[neighbour]
+                if candidate < best.get(neighbour, UNREACHABLE):
+                    best[neighbour] = candidate
+                    parents[neighbour] = index
+                    heapq.heappush(heap, (
+                        candidate + estimate(neighbour), -candidate, neighbour
+                    ))
+        return None
+
+    def route_to(self, name, start=None):
+        """Route from start (the middle of the map by default) to a point of
+        interest by name; see route()."""
+        return self.route(self.start if start is None else start,
+                          self.points[name])
+
+
+def directions(forest_map, path, limit=3, stride=8):
+    """Summarize the first legs of a path as compass directions.
+
+    Routes weave between thickets and rivers, so naming every single step
+    reads as noise ("2 east, 1 south, 2 east"). Instead the path is cut into
+    stretches of stride steps, each named after the way it mostly heads, and
+    neighbouring stretches heading the same way are merged into one leg.
+
+    Args:
+        forest_map (ForestMap): The map the path is on.
+        path (list): Tile indexes, as returned by ForestMap.route.
+        limit (int): How many legs to describe.
+        stride (int): Steps per stretch; 1 names every step exactly.
+
+    Returns:
+        list: (direction, steps) pairs, e.g. [("north", 12), ("east", 8)].
+    """
+    width = forest_map.width
+    legs = []
+    last = len(path) - 1
+    for begin in range(0, last, stride):
+        end = min(begin + stride, last)
+        dx = path[end] % width - path[begin] % width
+        dy = path[end] // width - path[begin] // width
+        if abs(dx) >= abs(dy):
+            name = "east" if dx > 0 else "west"
+        else:
+            name = "south" if dy > 0 else "north"
+        if dx == dy == 0 and legs:
+            # A stretch that loops back to where it began
+            name = legs[-1][0]
+        if legs and legs[-1][0] == name:
+            legs[-1][1] += end - begin
+        elif len(legs) == limit:
+            break
+        else:
+            legs.append([name, end - begin])
+    return [tuple(leg) for leg in legs]
+
+
+def main():
+    """Generate a map and time route queries from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Find routes to the castle, village and vault."
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--size", type=int, default=1024,
+                        help="width and height of the map in tiles")
+    parser.add_argument(
+        "--landmarks", metavar="PATH", default=None,
+        help="load landmark tables from this file, computing and saving "
+             "them if it is missing or for a different map"
+    )
+    parser.add_argument("--queries", type=int, default=100,
+                        help="random starts to route from")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    forest_map = ForestMap(args.seed, args.size, args.size)
+    print(f"Generated {args.size}x{args.size} map in "
+          f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+    started = time.perf_counter()
+    loaded = args.landmarks and forest_map.load_landmarks(args.landmarks)
+    if not loaded:
+        forest_map.add_landmarks()
+        if args.landmarks:
+            forest_map.save_landmarks(args.landmarks)
+    print(f"{'Loaded' if loaded else 'Computed'} "
+          f"{len(forest_map.landmarks)} landmark tables in "
+          f"{time.perf_counter() - started:.2f} s")
+
+    for name in POINTS_OF_INTEREST:
+        found = forest_map.route_to(name)
+        if found is None:
+            print(f"{name:<8} unreachable")
+            continue
+        cost, path = found
+        legs = ", ".join(
+            f"{steps} {direction}"
+            for direction, steps in directions(forest_map, path)
+        )
+        print(f"{name:<8} {len(path) - 1} steps, cost {cost}: {legs}, ...")
+
+    rng = random.Random(args.seed)
+    timings = []
+    for _ in range(args.queries):
+        start = rng.randrange(len(forest_map.costs))
+        name = rng.choice(POINTS_OF_INTEREST)
+        query_started = time.perf_counter()
+        forest_map.route_to(name, start)
+        timings.append(time.perf_counter() - query_started)
+    timings.sort()
+    print(f"{args.queries} random route queries: "
+          f"p50 {timings[len(timings) // 2] * 1000:.2f} ms, "
+          f"max {timings[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,91 +22,58 @@
 #          paths, scoring, and colored text output.
 
 # Standard library imports
-import random
-import time
+import argparse
+import contextlib
+import itertools
 import json
+import random
 import os
-from datetime import datetime
+import sys
+import threading
 
 # Third-party imports
 from colorama import init, Fore, Style
 
+# Local imports
+from forestmap import POINTS_OF_INTEREST, ForestMap, directions
+from gamestate import GameState
+from hints import HintTable
+from leaderboard import Leaderboard
+from metrics import Metrics, install as install_metrics
+from pacing import Pacer
+from render import default_cache
+from savejournal import SaveJournal
+from scenes import GRAPH, WELCOME_LINES, play
+from sessionlog import RecordingPolicy, SessionLog, new_seed
+from telemetry import EventStream, install as install_telemetry
+from world import MOVE_PROMPT, MOVE_RETRY, MOVE_SCENE, World, explore
+
 
 # Initialize colorama for cross-platform colored text output
 init()
 
+# Shared pacer that schedules all story output and collects player input
+pacer = Pacer()
 
-class Inventory:
-    def __init__(self):
-        self.items = {}
-        self.capacity = 10
-    
-    def add_item(self, item_name, quantity=1):
-        if len(self.items) >= self.capacity:
-            return False
-        if item_name in self.items:
-            self.items[item_name] += quantity
-        else:
-            self.items[item_name] = quantity
-        return True
-    
-    def remove_item(self, item_name, quantity=1):
-        if item_name in self.items:
-            if self.items[item_name] >= quantity:
-                self.items[item_name] -= quantity
-                if self.items[item_name] == 0:
-                    del self.items[item_name]
-                return True
-        return False
-    
-    def has_item(self, item_name):
-        return item_name in self.items
-    
-    def get_items(self):
-        return self.items.copy()
-
-
-class GameState:
-    def __init__(self):
-        self.score = 0
-        self.turns = 0
-        self.max_turns = 10
-        self.inventory = Inventory()
-        self.achievements = set()
-        self.character_stats = {
-            "health": 100,
-            "strength": 10,
-            "magic": 5,
-            "luck": 5
-        }
-    
-    def save(self, filename="save_game.json"):
-        save_data = {
-            "score": self.score,
-            "turns": self.turns,
-            "max_turns": self.max_turns,
-            "inventory": self.inventory.items,
-            "achievements": list(self.achievements),
-            "character_stats": self.character_stats,
-            "save_date": datetime.now().isoformat()
-        }
-        with open(filename, 'w') as f:
-            json.dump(save_data, f)
-    
-    @classmethod
-    def load(cls, filename="save_game.json"):
-        if not os.path.exists(filename):
-            return None
-        with open(filename, 'r') as f:
-            save_data = json.load(f)
-        game_state = cls()
-        game_state.score = save_data["score"]
-        game_state.turns = save_data["turns"]
-        game_state.max_turns = save_data["max_turns"]
-        game_state.inventory.items = save_data["inventory"]
-        game_state.achievements = set(save_data["achievements"])
-        game_state.character_stats = save_data["character_stats"]
-        return game_state
+# Callbacks called as observer(scene, choice, outcome, seconds) for every
+# outcome drawn in play_game, the encounter handlers and world mode (e.g.
+# metrics or telemetry)
+observers = []
+
+# HintTable shown before each prompt when hints are turned on, else None
+hint_table = None
+
+# The monster's map is the same million-tile forest in every game. Its
+# routes from the heart of the forest are worked out once, on a background
+# thread started when the map is first won, and then shown from memory.
+# main() sets map_landmarks to the file the landmark tables are kept in;
+# while it is None (driver mode, tests, simulations) no map is drawn.
+MAP_SEED = 2025
+MAP_SIZE = 1024
+map_landmarks = None
+map_route_lines = None
+_map_lock = threading.Lock()
+_map_thread = None
 
 
 def print_sleep(message, color=Fore.RESET, sleep_duration=0.5):
@@ -115,7 +82,9 @@ def print_sleep(message, color=Fore.RESET, sleep_duration=0.5):
     This function is used throughout the game to display text with a consistent
     visual style, applying color to enhance the user experience and pausing to
     control the pacing of the narrative. It resets the color after each message
-    to prevent color bleed into subsequent outputs.
+    to prevent color bleed into subsequent outputs. The line is handed to the
+    shared pacer, which renders it in the background so the pause never
+    blocks the game and can be skipped or sped up by the player.
 
     Args:
         message (str): The text to display to the player.
@@ -126,8 +95,141 @@ def print_sleep(message, color=Fore.RESET, sleep_duration=0.5):
     Returns:
         None
     """
-    print(color + message + Style.RESET_ALL)
-    time.sleep(sleep_duration)
+    pacer.emit(color + message + Style.RESET_ALL, sleep_duration)
+
+
+def read_input(prompt=""):
+    """Read a line of player input once the queued story text has printed.
+
+    Args:
+        prompt (str): The prompt to display.
+
+    Returns:
+        str: The player's input, possibly typed ahead during the story text.
+    """
+    return pacer.read(prompt)
+
+
+def notify_observers(scene, choice, outcome, seconds):
+    """Pass an outcome drawn by the interpreter to every registered observer.
+
+    Args:
+        scene (Scene): The scene the outcome belongs to.
+        choice (str): The option chosen, or None for an automatic scene.
+        outcome (Outcome): The outcome drawn.
+        seconds (float): Time spent in the scene before the draw.
+
+    Returns:
+        None
+    """
+    for observer in observers:
+        observer(scene, choice, outcome, seconds)
+
+
+def game_trace(game_state, journal=None):
+    """Return the trace callback for a game: observers, plus any autosave.
+
+    With a journal, the state is recorded at every outcome draw, so a crash
+    loses at most the scene in progress. The draw comes before the outcome
+    is applied, so the caller records once more when the game ends.
+
+    Args:
+        game_state (GameState): The state being played.
+        journal (SaveJournal): Journal to autosave to, or None.
+
+    Returns:
+        callable: A trace(scene, choice, outcome, seconds) callback, or None
+                  when there is nothing to call.
+    """
+    if journal is None:
+        return notify_observers if observers else None
+
+    def autosave(scene, choice, outcome, seconds):
+        for observer in observers:
+            observer(scene, choice, outcome, seconds)
+        journal.record(game_state)
+
+    return autosave
+
+
+def render_line(color, text):
+    """Render one line of scene text, resolving its colorama color by name.
+
+    Static scene text comes pre-colored and interned from the shared
+    ColorCache, so no strings are built per line; in zero-delay mode the
+    pacer buffers the lines and writes each scene out in one call.
+
+    Args:
+        color (str): Name of a colorama Fore attribute (e.g. "GREEN").
+        text (str): The text to display to the player.
+
+    Returns:
+        None
+    """
+    pacer.emit(default_cache().colored(color, text))
+
+
+def prompt_choice(scene_name, options):
+    """Prompt the player for a choice at a scene until the input is valid.
+
+    Args:
+        scene_name (str): Name of the scene in the scene graph.
+        options (tuple): The valid option strings (e.g. ("1", "2", "3")).
+
+    Returns:
+        str: The option the player entered.
+    """
+    scene = GRAPH[scene_name]
+    while True:
+        choice = read_input(Fore.MAGENTA + scene.prompt + Style.RESET_ALL)
+        if choice in options:
+            return choice
+        print_sleep(scene.retry, Fore.RED)
+
+
+def show_hint(text):
+    """Display one hint line before a prompt."""
+    print_sleep(text, Fore.CYAN)
+
+
+def player_policy(game_state):
+    """Return the policy that asks the player, showing hints if enabled.
+
+    Args:
+        game_state (GameState): The state being played.
+
+    Returns:
+        callable: A policy(scene_name, options) function for play().
+    """
+    if hint_table is None:
+        return prompt_choice
+    return hint_table.wrap_policy(prompt_choice, game_state, show_hint)
+
+
+def run_encounter(scene_name, score):
+    """Play a single encounter scene interactively and report its outcome.
+
+    Args:
+        scene_name (str): Name of the encounter in the scene graph.
+        score (int): The player's current score.
+
+    Returns:
+        tuple: (game_won, updated_score) where game_won is True for a win or a
+               scene that continues the quest; updated_score is the new score.
+    """
+    game_state = GameState()
+    game_state.score = score
+    result = play(
+        game_state,
+        player_policy(game_state),
+        random,
+        render_line,
+        GRAPH[scene_name],
+        single=True,
+        trace=notify_observers if observers else None
+    )
+    show_map_routes(game_state)
+    return result, game_state.score
 
 
 def display_welcome():
@@ -145,18 +247,8 @@ def display_welcome():
     Returns:
         None
     """
-    print_sleep("🌟 Welcome to Arcane Echoes! 🌟", Fore.YELLOW)
-    print_sleep(
-        "You wake up in a mystical forest 🌲🌳, the air shimmering with "
-        "magic ✨.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "A glow in the distance catches your eye, but you hear "
-        "rustling nearby 🐾.",
-        Fore.GREEN
-    )
-    print_sleep("Your adventure begins now. Choose wisely!", Fore.YELLOW)
+    for color, text in WELCOME_LINES:
+        print_sleep(text, getattr(Fore, color))
 
 
 def handle_riddle(score):
@@ -178,72 +270,7 @@ def handle_riddle(score):
         tuple: (game_won, updated_score) where game_won is True if the riddle is
                solved correctly, False otherwise; updated_score is the new score.
     """
-    game_state = GameState()
-    game_state.score = score
-    
-    print_sleep(
-        "You follow the glowing light to a magical clearing 🌼.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "A wise old wizard 🧙‍♂️ appears, his eyes twinkling with mischief.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "He says, 'Solve my riddle to gain a magical artifact! 🪄'",
-        Fore.GREEN
-    )
-    print_sleep(
-        "Riddle: 'I speak without a mouth and hear without ears. I "
-        "have no body, but I come alive with wind. What am I?'",
-        Fore.YELLOW
-    )
-    print_sleep("1️⃣ Answer: A ghost 👻.", Fore.CYAN)
-    print_sleep("2️⃣ Answer: An echo 🗣️.", Fore.CYAN)
-    print_sleep("3️⃣ Answer: A bird 🐦.", Fore.CYAN)
-    
-    # Prompt for player's answer and validate input
-    while True:
-        riddle_choice = input(
-            Fore.MAGENTA + "Answer? (1/2/3): " + Style.RESET_ALL
-        )
-        if riddle_choice in ["1", "2", "3"]:
-            break
-        print_sleep("Please enter 1, 2, or 3.", Fore.RED)
-    
-    # Process the riddle answer
-    if riddle_choice == "2":
-        game_state.score += 50
-        print_sleep(
-            "'Correct!' the wizard exclaims, handing you a glowing amulet 💎.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "The amulet pulses with power, making you feel invincible.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "You thank the wizard and prepare to continue your quest.",
-            Fore.GREEN
-        )
-        game_state.inventory.add_item("amulet")
-        game_state.achievements.add("Riddle Master")
-        return True, game_state.score
-    else:
-        game_state.score -= 20
-        print_sleep(
-            "'Wrong!' the wizard says, his voice cold. The clearing fades.",
-            Fore.RED
-        )
-        print_sleep(
-            "Shadow creatures attack from the darkness 🌑!",
-            Fore.RED
-        )
-        print_sleep(
-            "You barely escape, wounded and defeated. You lose! 😢",
-            Fore.RED
-        )
-        return False, game_state.score
+    return run_encounter("riddle", score)
 
 
 def handle_squirrel_encounter(score):
@@ -264,82 +291,7 @@ def handle_squirrel_encounter(score):
         tuple: (game_won, updated_score) where game_won is True for a win,
                False for a loss; updated_score is the new score.
     """
-    print_sleep(
-        "A friendly squirrel 🐿️ pops out, chattering excitedly.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "It seems to offer guidance through the forest.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "1️⃣ Follow the squirrel to a sunny meadow 🌞.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "2️⃣ Head toward a creepy cave nearby 🕸️.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "3️⃣ Decline and explore a riverbank instead 🌊.",
-        Fore.CYAN
-    )
-    
-    # Prompt for player's choice and validate input
-    while True:
-        squirrel_choice = input(
-            Fore.MAGENTA + "What do you do? (1/2/3): " + Style.RESET_ALL
-        )
-        if squirrel_choice in ["1", "2", "3"]:
-            break
-        print_sleep("Please enter 1, 2, or 3.", Fore.RED)
-    
-    # Process the squirrel encounter choice
-    if squirrel_choice == "1":
-        score += 50
-        print_sleep(
-            "The squirrel leads you to a meadow bathed in sunlight.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "You find a hidden treasure chest filled with riches! 🎁",
-            Fore.GREEN
-        )
-        print_sleep(
-            "Gold coins and jewels sparkle in your hands. You win! 🎉",
-            Fore.GREEN
-        )
-        return True, score
-    elif squirrel_choice == "2":
-        score -= 30
-        print_sleep(
-            "The cave is dark, with eerie whispers echoing around 👻.",
-            Fore.RED
-        )
-        print_sleep(
-            "You stumble in the darkness and fall into a deep pit.",
-            Fore.RED
-        )
-        print_sleep(
-            "You lose consciousness. You lose! 😱",
-            Fore.RED
-        )
-        return False, score
-    else:
-        score += 40
-        print_sleep(
-            "At the riverbank, you find a sturdy boat waiting 🚤.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "You sail down the river, arriving at a peaceful village.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "The villagers welcome you warmly. You win! 🥳",
-            Fore.GREEN
-        )
-        return True, score
+    return run_encounter("squirrel", score)
 
 
 def handle_monster_encounter(score):
@@ -359,112 +311,7 @@ def handle_monster_encounter(score):
         tuple: (game_won, updated_score) where game_won is True for a win,
                False for a loss; updated_score is the new score.
     """
-    print_sleep(
-        "A monster 🐺 bursts from the bushes, growling fiercely!",
-        Fore.RED
-    )
-    print_sleep(
-        "Its eyes glow with menace as it charges toward you!",
-        Fore.RED
-    )
-    print_sleep(
-        "1️⃣ Fight the monster with a nearby stick 🪵.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "2️⃣ Run away as fast as you can 🏃‍♂️.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "3️⃣ Try to hide behind a tree 🌳.",
-        Fore.CYAN
-    )
-    
-    # Prompt for player's choice and validate input
-    while True:
-        monster_choice = input(
-            Fore.MAGENTA + "What do you do? (1/2/3): " + Style.RESET_ALL
-        )
-        if monster_choice in ["1", "2", "3"]:
-            break
-        print_sleep("Please enter 1, 2, or 3.", Fore.RED)
-    
-    # Process the monster encounter choice
-    if monster_choice == "1":
-        fight_result = random.choice(["win", "lose"])
-        if fight_result == "win":
-            score += 60
-            print_sleep(
-                "You swing the stick with all your might!",
-                Fore.GREEN
-            )
-            print_sleep(
-                "The monster falls, defeated by your bravery! 💪",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You find a map 🗺️ on the monster, leading to a castle.",
-                Fore.GREEN
-            )
-            print_sleep(
-                "At the castle, you're crowned a hero! You win! 👑",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 40
-            print_sleep(
-                "The monster overpowers you, its claws slashing.",
-                Fore.RED
-            )
-            print_sleep(
-                "You collapse, defeated. You lose! 😵",
-                Fore.RED
-            )
-            return False, score
-    elif monster_choice == "2":
-        score += 30
-        print_sleep(
-            "You sprint away, heart pounding, and escape! 🏃‍♂️💨",
-            Fore.GREEN
-        )
-        print_sleep(
-            "You stumble upon a friendly village, safe at last.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "The villagers offer you shelter. You win! 🏡",
-            Fore.GREEN
-        )
-        return True, score
-    else:
-        hide_result = random.choice(["success", "fail"])
-        if hide_result == "success":
-            score += 30
-            print_sleep(
-                "You hide silently behind the tree, holding your breath.",
-                Fore.GREEN
-            )
-            print_sleep(
-                "The monster leaves, and you find a safe path.",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You reach a village and are welcomed. You win! 🥰",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 30
-            print_sleep(
-                "The monster sniffs you out and attacks! 😱",
-                Fore.RED
-            )
-            print_sleep(
-                "You try to flee but are overwhelmed. You lose!",
-                Fore.RED
-            )
-            return False, score
+    return run_encounter("monster", score)
 
 
 def handle_final_path(score):
@@ -484,80 +331,7 @@ def handle_final_path(score):
         tuple: (game_won, updated_score) where game_won is True for a win,
                False for a loss; updated_score is the new score.
     """
-    print_sleep(
-        "With the amulet's power, you venture deeper into the forest.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "The path splits, presenting a crucial choice:",
-        Fore.GREEN
-    )
-    print_sleep(
-        "1️⃣ A rickety bridge over a roaring river 🌉.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "2️⃣ A narrow trail leading to a towering mountain ⛰️.",
-        Fore.CYAN
-    )
-    
-    # Prompt for player's choice and validate input
-    while True:
-        final_choice = input(
-            Fore.MAGENTA + "Which path? (1/2): " + Style.RESET_ALL
-        )
-        if final_choice in ["1", "2"]:
-            break
-        print_sleep("Please enter 1 or 2.", Fore.RED)
-    
-    # Process the final path choice
-    if final_choice == "1":
-        bridge_result = random.choice(["safe", "break"])
-        if bridge_result == "safe":
-            score += 50
-            print_sleep(
-                "You carefully cross the bridge, which holds strong.",
-                Fore.GREEN
-            )
-            print_sleep(
-                "Beyond lies a grand kingdom, its gates open wide! 🏰",
-                Fore.GREEN
-            )
-            print_sleep(
-                "The king rewards your bravery. You win! 🎊",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 40
-            print_sleep(
-                "The bridge creaks and snaps beneath you!",
-                Fore.RED
-            )
-            print_sleep(
-                "You fall into the raging river below. 🌊",
-                Fore.RED
-            )
-            print_sleep(
-                "You're swept away, defeated. You lose! 😢",
-                Fore.RED
-            )
-            return False, score
-    else:
-        score += 60
-        print_sleep(
-            "You climb the steep trail, reaching a dragon's lair! 🐉",
-            Fore.GREEN
-        )
-        print_sleep(
-            "The dragon, awed by your amulet, bows respectfully.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "It offers you a hoard of treasure. You win! 💰🎉",
-            Fore.GREEN
-        )
-        return True, score
+    return run_encounter("final_path", score)
 
 
 def handle_treasure_vault(score):
@@ -577,108 +351,7 @@ def handle_treasure_vault(score):
         tuple: (game_won, updated_score) where game_won is True for a win,
                False for a loss; updated_score is the new score.
     """
-    print_sleep(
-        "You stumble upon a hidden vault, its door glowing with runes.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "A magical lock bars your entry, pulsing with energy.",
-        Fore.GREEN
-    )
-    print_sleep(
-        "1️⃣ Try to pick the lock with your skills 🔓.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "2️⃣ Search the area for a hidden key 🗝️.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "3️⃣ Attempt to cast a spell to unlock it 🪄.",
-        Fore.CYAN
-    )
-    
-    # Prompt for player's choice and validate input
-    while True:
-        vault_choice = input(
-            Fore.MAGENTA + "What do you do? (1/2/3): " + Style.RESET_ALL
-        )
-        if vault_choice in ["1", "2", "3"]:
-            break
-        print_sleep("Please enter 1, 2, or 3.", Fore.RED)
-    
-    # Process the vault encounter choice
-    if vault_choice == "1":
-        lock_result = random.choice(["success", "trap"])
-        if lock_result == "success":
-            score += 70
-            print_sleep(
-                "Your nimble fingers unlock the vault with a click!",
-                Fore.GREEN
-            )
-            print_sleep(
-                "Inside, you find piles of gold and gems! 💎",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You're now a legend of wealth. You win! 🎉",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 50
-            print_sleep(
-                "A trap springs! Darts shoot from the walls! 🏹",
-                Fore.RED
-            )
-            print_sleep(
-                "You're wounded and retreat in defeat. You lose! 😢",
-                Fore.RED
-            )
-            return False, score
-    elif vault_choice == "2":
-        score += 60
-        print_sleep(
-            "You search carefully and find a golden key hidden nearby.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "The key unlocks the vault, revealing treasures galore!",
-            Fore.GREEN
-        )
-        print_sleep(
-            "You claim the riches and win! 💰",
-            Fore.GREEN
-        )
-        return True, score
-    else:
-        spell_result = random.choice(["success", "fail"])
-        if spell_result == "success":
-            score += 80
-            print_sleep(
-                "Your spell glows brightly, and the lock melts away!",
-                Fore.GREEN
-            )
-            print_sleep(
-                "The vault opens, filled with magical artifacts! 🪄",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You're hailed as a master mage. You win! 🎉",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 40
-            print_sleep(
-                "The spell backfires, zapping you with energy! ⚡",
-                Fore.RED
-            )
-            print_sleep(
-                "You collapse, defeated by your own magic. You lose!",
-                Fore.RED
-            )
-            return False, score
+    return run_encounter("vault", score)
 
 
 def handle_ghostly_encounter(score):
@@ -698,111 +371,80 @@ def handle_ghostly_encounter(score):
         tuple: (game_won, updated_score) where game_won is True for a win,
                False for a loss; updated_score is the new score.
     """
+    return run_encounter("ghost", score)
+
+
+def load_map_routes():
+    """Work out the lines describing the monster's map, once.
+
+    Every point of interest is a landmark, so with the landmark tables
+    loaded from map_landmarks each route is an A* search with an exact
+    heuristic. The tables are computed and saved there the first time,
+    which takes a few seconds. A caller that gets here while the
+    background thread is working waits for it instead of routing twice.
+
+    Returns:
+        list: The route lines shown under the map's heading.
+    """
+    global map_route_lines
+    with _map_lock:
+        if map_route_lines is None:
+            forest_map = ForestMap(MAP_SEED, MAP_SIZE, MAP_SIZE)
+            loaded = (map_landmarks is not None
+                      and forest_map.load_landmarks(map_landmarks))
+            if not loaded:
+                forest_map.add_landmarks()
+                try:
+                    if map_landmarks is not None:
+                        forest_map.save_landmarks(map_landmarks)
+                except OSError:
+                    pass  # Route from memory; try saving again next run
+            lines = []
+            for name in POINTS_OF_INTEREST:
+                found = forest_map.route_to(name)
+                if found is None:
+                    lines.append(f"- {name}: no way through")
+                    continue
+                legs = ", ".join(
+                    f"{steps} {direction}"
+                    for direction, steps in directions(forest_map, found[1])
+                )
+                lines.append(
+                    f"- {name}: {len(found[1]) - 1} steps (mostly {legs})"
+                )
+            map_route_lines = lines
+    return map_route_lines
+
+
+def start_map_routes(scene, choice, outcome, seconds):
+    """Observer that starts routing the map as soon as it is first won.
+
+    The routes are worked out on a background thread while the rest of the
+    game plays, so showing them at the end rarely waits.
+    """
+    global _map_thread
+    if "map" in outcome.items and _map_thread is None:
+        _map_thread = threading.Thread(target=load_map_routes, daemon=True)
+        _map_thread.start()
+
+
+def show_map_routes(game_state):
+    """Show the monster's map routes if the player is carrying the map.
+
+    Args:
+        game_state (GameState): The state of the game that just ended.
+    """
+    if map_landmarks is None or not game_state.inventory.has_item("map"):
+        return
     print_sleep(
-        "A ghostly figure 👻 materializes, its voice echoing eerily.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "It offers a challenge to prove your worth.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "1️⃣ Answer its cryptic question.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "2️⃣ Offer a tribute to appease it.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "3️⃣ Flee from the ghostly presence.",
+        "\n🗺️ The monster's map marks routes from the heart of the forest:",
         Fore.CYAN
     )
-    
-    # Prompt for player's choice and validate input
-    while True:
-        ghost_choice = input(
-            Fore.MAGENTA + "What do you do? (1/2/3): " + Style.RESET_ALL
-        )
-        if ghost_choice in ["1", "2", "3"]:
-            break
-        print_sleep("Please enter 1, 2, or 3.", Fore.RED)
-    
-    # Process the ghostly encounter choice
-    if ghost_choice == "1":
-        question_result = random.choice(["correct", "wrong"])
-        if question_result == "correct":
-            score += 65
-            print_sleep(
-                "You answer wisely: 'The moon guides the lost.'",
-                Fore.GREEN
-            )
-            print_sleep(
-                "The ghost nods and grants you passage to a shrine.",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You're blessed with wisdom. You win! 🌟",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 45
-            print_sleep(
-                "Your answer falters, angering the ghost!",
-                Fore.RED
-            )
-            print_sleep(
-                "It curses you, draining your strength. You lose! 😢",
-                Fore.RED
-            )
-            return False, score
-    elif ghost_choice == "2":
-        score += 55
-        print_sleep(
-            "You offer a shiny trinket, and the ghost accepts.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "It vanishes, leaving a path to a sacred grove.",
-            Fore.GREEN
-        )
-        print_sleep(
-            "You're honored as a peacemaker. You win! 🌿",
-            Fore.GREEN
-        )
-        return True, score
-    else:
-        flee_result = random.choice(["escape", "capture"])
-        if flee_result == "escape":
-            score += 35
-            print_sleep(
-                "You run swiftly, evading the ghost's grasp!",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You find a safe haven in a nearby village.",
-                Fore.GREEN
-            )
-            print_sleep(
-                "You're safe at last. You win! 🏡",
-                Fore.GREEN
-            )
-            return True, score
-        else:
-            score -= 35
-            print_sleep(
-                "The ghost catches you, its touch freezing!",
-                Fore.RED
-            )
-            print_sleep(
-                "You're trapped in its realm. You lose! 👻",
-                Fore.RED
-            )
-            return False, score
+    for line in map_route_lines or load_map_routes():
+        print_sleep(line, Fore.CYAN)
 
 
-def play_game(score, turns, max_turns):
+def play_game(score, turns, max_turns, log=None, seed=None, journal=None):
     """Run the main game, presenting initial choices and directing the flow.
 
     This function orchestrates the game by displaying the welcome scene and
@@ -813,10 +455,16 @@ def play_game(score, turns, max_turns):
     appropriate encounter. Random encounters add variety to the bush and trail
     paths.
 
+    Each game draws its outcomes from its own freshly seeded random.Random,
+    so with a log the seed and the choices made reproduce it exactly.
+
     Args:
         score (int): The player's current score.
         turns (int): The current number of turns taken.
         max_turns (int): The maximum number of turns allowed.
+        log (SessionLog): Optional log to record the game in for replay.
+        seed (int): Seed for the game's outcomes; a fresh one by default.
+        journal (SaveJournal): Optional journal to autosave every turn to.
 
     Returns:
         tuple: (game_won, updated_score, updated_turns) where game_won is True for a win,
@@ -827,156 +475,131 @@ def play_game(score, turns, max_turns):
     game_state.turns = turns
     game_state.max_turns = max_turns
     
-    display_welcome()
-    print_sleep(
-        f"⏳ You have {game_state.max_turns - game_state.turns} turns remaining.",
-        Fore.YELLOW
-    )
-    print_sleep(
-        "1️⃣ Follow the glowing light to the west 🌅.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "2️⃣ Investigate the rustling in the bushes to the east 🐿️.",
-        Fore.CYAN
-    )
-    print_sleep(
-        "3️⃣ Explore a faint trail to the north 🛤️.",
-        Fore.CYAN
+    if seed is None:
+        seed = new_seed()
+    policy = RecordingPolicy(player_policy(game_state))
+    result = play(
+        game_state, policy, random.Random(seed), render_line,
+        trace=game_trace(game_state, journal)
     )
-    
-    # Prompt for player's initial choice and validate input
-    while True:
-        choice = input(
-            Fore.MAGENTA + "What will you do? (1/2/3): " + Style.RESET_ALL
-        )
-        if choice in ["1", "2", "3"]:
-            break
-        print_sleep("Please enter 1, 2, or 3.", Fore.RED)
-    
-    game_state.turns += 1
-    
-    if game_state.turns >= game_state.max_turns:
-        print_sleep(
-            "⏳ Time runs out! The forest's magic fades.",
-            Fore.RED
-        )
-        print_sleep(
-            "You're lost in the woods forever. You lose! 😢",
-            Fore.RED
-        )
-        return False, game_state.score, game_state.turns
-    
-    if choice == "1":
-        game_state.score += 10
-        print_sleep(
-            "You head toward the glowing light, feeling drawn to it.",
-            Fore.GREEN
-        )
-        result, game_state.score = handle_riddle(game_state.score)
-        if result:
-            game_state.inventory.add_item("amulet")
-            game_state.achievements.add("Riddle Master")
-            game_state.score += 20
-            print_sleep(
-                "The amulet guides you to a final challenge.",
-                Fore.GREEN
-            )
-            game_state.turns += 1
-            if game_state.turns >= game_state.max_turns:
-                print_sleep(
-                    "⏳ Time runs out! The forest's magic fades.",
-                    Fore.RED
-                )
-                print_sleep(
-                    "You're lost in the woods forever. You lose! 😢",
-                    Fore.RED
-                )
-                return False, game_state.score, game_state.turns
-            result, game_state.score = handle_final_path(game_state.score)
-            if result:
-                game_state.achievements.add("Forest Explorer")
-            return result, game_state.score, game_state.turns
-        return result, game_state.score, game_state.turns
-    elif choice == "2":
-        game_state.score += 10
-        print_sleep(
-            "You cautiously approach the rustling bushes.",
-            Fore.GREEN
-        )
-        encounter = random.choice(["friend", "monster"])
-        if encounter == "friend":
-            print_sleep(
-                "The bushes part to reveal a friendly creature!",
-                Fore.GREEN
-            )
-            result, game_state.score = handle_squirrel_encounter(
-                game_state.score
-            )
-            if result:
-                game_state.achievements.add("Friend of the Forest")
-            return result, game_state.score, game_state.turns
-        else:
-            print_sleep(
-                "A terrifying roar echoes from the bushes!",
-                Fore.RED
-            )
-            result, game_state.score = handle_monster_encounter(
-                game_state.score
-            )
-            if result:
-                game_state.achievements.add("Monster Slayer")
-            return result, game_state.score, game_state.turns
-    else:
-        game_state.score += 10
-        print_sleep(
-            "You follow the faint trail, curious about its secrets.",
-            Fore.GREEN
+    if journal is not None:
+        journal.record(game_state)
+    if log is not None:
+        log.write(
+            seed, policy.choices, game_state, result, score, turns, max_turns
         )
-        encounter = random.choice(["vault", "ghost"])
-        if encounter == "vault":
-            print_sleep(
-                "The trail leads to a mysterious structure!",
-                Fore.GREEN
-            )
-            result, game_state.score = handle_treasure_vault(
-                game_state.score
-            )
-            if result:
-                game_state.achievements.add("Treasure Hunter")
-            return result, game_state.score, game_state.turns
-        else:
-            print_sleep(
-                "A chill runs down your spine as the air grows cold.",
-                Fore.CYAN
-            )
-            result, game_state.score = handle_ghostly_encounter(
-                game_state.score
-            )
-            if result:
-                game_state.achievements.add("Ghost Whisperer")
-            return result, game_state.score, game_state.turns
+    show_map_routes(game_state)
+    return result, game_state.score, game_state.turns
 
 
-def main():
-    """Control the game loop, managing score and replay functionality.
+def world_policy(game_state):
+    """Return the world-mode policy: asks for moves and encounter choices.
 
-    This function initializes the player's score, runs the game, displays the
-    outcome (win or loss with the final score), and prompts for replay. The
-    replay input is validated to accept only 'yes' or 'no'. If the player
-    chooses to replay, the score is reset to 0, and a decorative separator is
-    displayed. The game continues until the player chooses not to replay.
+    Args:
+        game_state (GameState): The state being played.
+
+    Returns:
+        callable: A policy(scene_name, options) function for explore().
+    """
+    encounter_policy = player_policy(game_state)
+
+    def choose(scene_name, options):
+        if scene_name != MOVE_SCENE:
+            return encounter_policy(scene_name, options)
+        while True:
+            choice = read_input(Fore.MAGENTA + MOVE_PROMPT + Style.RESET_ALL)
+            if choice in options:
+                return choice
+            print_sleep(MOVE_RETRY, Fore.RED)
+
+    return choose
+
+
+def play_world(score, turns, world, log=None, seed=None, journal=None):
+    """Run a world-mode game through the procedural forest.
+
+    Args:
+        score (int): The player's current score.
+        turns (int): The current number of turns taken.
+        world (World): The world to explore; its max_turns is the turn limit.
+        log (SessionLog): Optional log to record the game in for replay.
+        seed (int): Seed for the encounters' outcomes; fresh by default.
+        journal (SaveJournal): Optional journal to autosave every turn to.
+
+    Returns:
+        tuple: (game_won, updated_score, updated_turns), as for play_game.
+    """
+    game_state = GameState()
+    game_state.score = score
+    game_state.turns = turns
+    game_state.max_turns = world.max_turns
+
+    if seed is None:
+        seed = new_seed()
+    policy = RecordingPolicy(world_policy(game_state))
+    display_welcome()
+    result = explore(
+        game_state,
+        world,
+        policy,
+        random.Random(seed),
+        render_line,
+        trace=game_trace(game_state, journal)
+    )
+    if journal is not None:
+        journal.record(game_state)
+    if log is not None:
+        log.write(
+            seed, policy.choices, game_state, result, score, turns,
+            world.max_turns, world.seed
+        )
+    show_map_routes(game_state)
+    return result, game_state.score, game_state.turns
+
+
+def run_session(store=None, player="player", slot=1, leaderboard=None,
+                leaderboard_path="leaderboard.json", log=None, seeds=None,
+                results=None, world=None, snapshot_interval=60.0,
+                save_path="save_game.json", journal=None, binary=False):
+    """Play from the welcome message until the player saves or quits.
+
+    Args:
+        store (SaveStore): Save store to use instead of save_game.json.
+        player (str): The player's name, for the save store and leaderboard.
+        slot (int): The save store slot to load from and save to.
+        leaderboard (Leaderboard): The leaderboard finished games go on.
+        leaderboard_path (str): File the leaderboard is snapshotted to, or
+                                None to keep it in memory only.
+        log (SessionLog): Optional log to record each game in for replay.
+        seeds (random.Random): Source of game seeds; fresh seeds by default.
+        results (callable): Called as results(game_won, game_state, seed)
+                            after each game.
+        world (World): Play world-mode games in this world instead of the
+                       fixed forest.
+        snapshot_interval (float): Seconds between leaderboard snapshots;
+                                   the caller snapshots once more at exit.
+        save_path (str): Save file to use when there is no save store.
+        journal (SaveJournal): Journal of save_path to autosave every turn
+                               to, or None to save only when asked.
+        binary (bool): Write save_path in the compact binary format instead
+                       of JSON.
     """
+    if leaderboard is None:
+        leaderboard = Leaderboard()
+
     print_sleep("Welcome to Epic Adventure Quest! 🎮", Fore.YELLOW)
     
     # Check for existing save file
-    game_state = GameState.load()
+    if store:
+        game_state = store.load(player, slot)
+    else:
+        game_state = GameState.load(save_path)
     if game_state:
         print_sleep(
             "A saved game was found. Would you like to load it? (yes/no): ",
             Fore.YELLOW
         )
-        load_choice = input().lower()
+        load_choice = read_input().lower()
         if load_choice == "yes":
             print_sleep("Game loaded successfully! 🎮", Fore.GREEN)
         else:
@@ -987,11 +610,22 @@ def main():
         print_sleep("Starting a new game! 🎮", Fore.GREEN)
     
     while True:
-        result, game_state.score, game_state.turns = play_game(
-            game_state.score, 
-            game_state.turns, 
-            game_state.max_turns
-        )
+        seed = seeds.getrandbits(64) if seeds else new_seed()
+        if world is not None:
+            result, game_state.score, game_state.turns = play_world(
+                game_state.score, game_state.turns, world, log, seed, journal
+            )
+        else:
+            result, game_state.score, game_state.turns = play_game(
+                game_state.score, 
+                game_state.turns, 
+                game_state.max_turns,
+                log,
+                seed,
+                journal
+            )
+        if results:
+            results(result, game_state, seed)
         
         # Display the game outcome
         print_sleep(
@@ -1000,6 +634,18 @@ def main():
             Fore.YELLOW
         )
         
+        # Rank the score against earlier games, then add it to the board
+        if leaderboard.count:
+            print_sleep(
+                f"🏆 Your score beats "
+                f"{leaderboard.percentile_rank(game_state.score):.0f}% "
+                f"of recorded games.",
+                Fore.CYAN
+            )
+        leaderboard.record(player, game_state.score)
+        if leaderboard_path:
+            leaderboard.snapshot_if_due(leaderboard_path, snapshot_interval)
+        
         # Display inventory and achievements
         if game_state.inventory.items:
             print_sleep("\nInventory:", Fore.CYAN)
@@ -1018,7 +664,7 @@ def main():
         print_sleep("3️⃣ Quit", Fore.CYAN)
         
         while True:
-            choice = input(
+            choice = read_input(
                 Fore.MAGENTA + "Choose (1/2/3): " + Style.RESET_ALL
             )
             if choice in ["1", "2", "3"]:
@@ -1030,7 +676,10 @@ def main():
             print_sleep("\n" + "🌟" * 15 + "\n", Fore.YELLOW)
             print_sleep("A new quest awaits you!", Fore.YELLOW)
         elif choice == "2":
-            game_state.save()
+            if store:
+                store.save(player, game_state, slot)
+            else:
+                game_state.save(save_path, binary)
             print_sleep("Game saved successfully! 💾", Fore.GREEN)
             print_sleep(
                 "Thanks for playing! Come back for another adventure! 👋",
@@ -1045,5 +694,293 @@ def main():
             break
 
 
+def main(argv=None):
+    """Control the game loop, managing score and replay functionality.
+
+    This function initializes the player's score, runs the game, displays the
+    outcome (win or loss with the final score), and prompts for replay. The
+    replay input is validated to accept only 'yes' or 'no'. If the player
+    chooses to replay, the score is reset to 0, and a decorative separator is
+    displayed. The game continues until the player chooses not to replay.
+
+    Every finished game is recorded on the leaderboard, and the player is
+    told what share of earlier games their score beats. With --save-db, saves
+    go to a slot of the SQLite save store instead of save_game.json, so
+    several players can keep several saves each. --save-format binary
+    writes the save file in the compact binary layout; either is loaded.
+
+    With --metrics, rendering, prompts, scenes and saves are timed and
+    per-scene counters kept, with snapshots written periodically and at
+    exit; without it nothing is instrumented.
+
+    With --telemetry, every outcome drawn and every game and encounter
+    result is queued as an event and written by a background thread, so
+    logging never waits on disk.
+
+    With --hints, each prompt is preceded by every option's chance to win
+    and expected points, looked up in a table solved at startup or loaded
+    from --hints-cache. The table is solved for the fixed forest, so hints
+    are not offered in world mode.
+
+    With --autosave, the game is journaled to the save file at every turn,
+    and a session that ends without saving resumes from the journal.
+
+    With --world, games take place in an endless procedural forest built
+    from --world-seed instead of the fixed one.
+
+    With --script, answers are read in bulk from a file or stdin with no
+    story text, prompts or pauses, whole sessions (including the save and
+    quit menu) repeat back to back until the input runs out, and each game
+    prints one JSON result line, for load and soak testing. Driver mode
+    never touches the player's files: saves go to a temporary directory
+    that starts empty, so a script plays the same games from any directory,
+    and the leaderboard is kept in memory unless --leaderboard is given.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(description="Play Arcane Echoes.")
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="story text speed multiplier (2 is twice as fast)"
+    )
+    parser.add_argument(
+        "--no-delay", action="store_true",
+        help="print story text instantly"
+    )
+    parser.add_argument(
+        "--save-db", metavar="PATH", default=None,
+        help="keep saves in this SQLite database instead of save_game.json"
+    )
+    parser.add_argument(
+        "--save", metavar="PATH", default=None,
+        help="save file to use; defaults to save_game.json, or to a fresh "
+             "temporary file in driver mode"
+    )
+    parser.add_argument(
+        "--save-format", choices=("json", "binary"), default="json",
+        help="format to write the save file in; either is read back"
+    )
+    parser.add_argument(
+        "--autosave", action="store_true",
+        help="journal the game to the save file at every turn, so a crash "
+             "or quit loses at most the scene in progress"
+    )
+    parser.add_argument("--player", default="player")
+    parser.add_argument("--slot", type=int, default=1)
+    parser.add_argument(
+        "--leaderboard", metavar="PATH", default=None,
+        help="file the leaderboard of finished games is kept in; defaults "
+             "to leaderboard.json, or to none in driver mode"
+    )
+    parser.add_argument(
+        "--leaderboard-interval", type=float, default=60.0,
+        help="seconds between leaderboard snapshots; it is also written at "
+             "exit"
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", default=None,
+        help="append each game's seed and choices to this log for replay.py"
+    )
+    parser.add_argument(
+        "--script", metavar="PATH", nargs="?", const="-", default=None,
+        help="driver mode: read every answer from PATH (default stdin), show "
+             "no story text or prompts, and print one JSON line per game "
+             "until the input ends"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="seed the sequence of games so a run can be repeated exactly"
+    )
+    parser.add_argument(
+        "--metrics", metavar="PATH", default=None,
+        help="collect timings and counters and snapshot them to this file"
+    )
+    parser.add_argument(
+        "--metrics-format", choices=("json", "prometheus"), default="json"
+    )
+    parser.add_argument("--metrics-interval", type=float, default=10.0)
+    parser.add_argument(
+        "--hints", action="store_true",
+        help="show each option's win chance and expected points at prompts"
+    )
+    parser.add_argument(
+        "--hints-cache", metavar="PATH", default=None,
+        help="load the hint table from this file, solving and saving it if "
+             "it is missing or out of date"
+    )
+    parser.add_argument(
+        "--map-landmarks", metavar="PATH", default="map_landmarks.bin",
+        help="file the monster's map keeps its landmark tables in; they "
+             "are computed and saved the first time the map is won"
+    )
+    parser.add_argument(
+        "--world", action="store_true",
+        help="explore an endless procedural forest instead of the fixed one"
+    )
+    parser.add_argument(
+        "--world-seed", type=int, default=None,
+        help="seed the world's layout; a random world by default"
+    )
+    parser.add_argument("--world-turns", type=int, default=30)
+    parser.add_argument(
+        "--world-cache", type=int, default=256,
+        help="how many generated regions to keep in memory"
+    )
+    parser.add_argument(
+        "--telemetry", metavar="PATH", default=None,
+        help="stream gameplay events to this file, rotating it as it grows"
+    )
+    parser.add_argument(
+        "--telemetry-format", choices=("jsonl", "binary"), default="jsonl"
+    )
+    parser.add_argument(
+        "--telemetry-rotate-mb", type=float, default=64.0,
+        help="start a new telemetry file once the current one reaches this"
+    )
+    args = parser.parse_args(argv)
+    if args.hints and args.world:
+        # The hint table is solved for the fixed forest's scoring; world
+        # encounters score and end differently, so its numbers would lie
+        parser.error("--hints cannot be used with --world")
+    if args.autosave and args.save_db:
+        parser.error("--autosave journals a save file and cannot be used "
+                     "with --save-db")
+    pacer.speed = 0 if args.no_delay else args.speed
+    seeds = random.Random(args.seed) if args.seed is not None else None
+    results = None
+    save_path = args.save or "save_game.json"
+    leaderboard_path = args.leaderboard or "leaderboard.json"
+
+    # Everything opened below is closed, flushed or written out here, in
+    # reverse order, however the session ends
+    with contextlib.ExitStack() as cleanup:
+        if args.script:
+            # Driver mode plays from a clean slate and leaves the player's
+            # saves and leaderboard alone unless they are named explicitly
+            import tempfile
+            if args.save is None:
+                save_directory = cleanup.enter_context(
+                    tempfile.TemporaryDirectory()
+                )
+                save_path = os.path.join(save_directory, "save_game.json")
+            leaderboard_path = args.leaderboard
+            pacer.speed = 0
+            cleanup.callback(setattr, pacer, "output", pacer.output)
+            pacer.output = cleanup.enter_context(open(os.devnull, "w"))
+            if args.script != "-":
+                cleanup.callback(
+                    setattr, pacer, "input_stream", pacer.input_stream
+                )
+                pacer.input_stream = cleanup.enter_context(
+                    open(args.script, "r")
+                )
+            games = itertools.count(1)
+
+            def print_result(result, game_state, seed):
+                print(json.dumps({
+                    "game": next(games),
+                    "seed": seed,
+                    "won": bool(result),
+                    "score": game_state.score,
+                    "turns": game_state.turns
+                }))
+
+            results = print_result
+        # Let any queued story text finish printing before exiting
+        cleanup.callback(pacer.drain)
+
+        binary = args.save_format == "binary"
+        journal = None
+        if args.autosave:
+            journal = SaveJournal(save_path, binary=binary)
+            cleanup.callback(journal.close)
+        store = None
+        if args.save_db:
+            # Imported here so sqlite3 is only loaded for a save store
+            from savestore import SaveStore
+            store = SaveStore(args.save_db)
+            cleanup.callback(store.close)
+
+        leaderboard = Leaderboard()
+        if leaderboard_path:
+            leaderboard = Leaderboard.restore(leaderboard_path) or leaderboard
+            cleanup.callback(leaderboard.snapshot, leaderboard_path)
+        log = None
+        if args.record:
+            log = SessionLog(args.record)
+            cleanup.callback(log.close)
+        if args.metrics:
+            metrics = Metrics()
+            uninstall_metrics = install_metrics(
+                metrics, sys.modules[__name__]
+            )
+            metrics.start_snapshots(
+                args.metrics, args.metrics_interval, args.metrics_format
+            )
+            cleanup.callback(
+                metrics.write_snapshot, args.metrics, args.metrics_format
+            )
+            cleanup.callback(metrics.stop_snapshots)
+            cleanup.callback(uninstall_metrics)
+        world = None
+        if args.world:
+            world = World(
+                new_seed() if args.world_seed is None else args.world_seed,
+                args.world_cache,
+                args.world_turns
+            )
+
+        global hint_table
+        if args.hints:
+            if args.hints_cache:
+                hint_table = HintTable.load(args.hints_cache)
+            else:
+                hint_table = HintTable.build()
+
+        global map_landmarks
+        if not args.script:
+            # Driver mode shows no story text, so it never routes the map
+            map_landmarks = args.map_landmarks
+            observers.append(start_map_routes)
+            cleanup.callback(observers.remove, start_map_routes)
+
+        if args.telemetry:
+            telemetry = EventStream(
+                args.telemetry,
+                args.telemetry_format,
+                rotate_bytes=int(args.telemetry_rotate_mb * 1024 * 1024)
+            )
+            cleanup.callback(telemetry.close)
+            cleanup.callback(
+                install_telemetry(telemetry, sys.modules[__name__])
+            )
+        session_options = {
+            "store": store,
+            "player": args.player,
+            "slot": args.slot,
+            "leaderboard": leaderboard,
+            "leaderboard_path": leaderboard_path,
+            "log": log,
+            "seeds": seeds,
+            "results": results,
+            "world": world,
+            "snapshot_interval": args.leaderboard_interval,
+            "save_path": save_path,
+            "journal": journal,
+            "binary": binary
+        }
+
+        try:
+            if args.script:
+                # Driver mode: run whole sessions back to back until input
+                # ends
+                while True:
+                    run_session(**session_options)
+            run_session(**session_options)
+        except EOFError:
+            pass
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: The player's game state and inventory, with JSON or binary saves
+#          and journaled autosaves.
+
+# Standard library imports
+import os
+from datetime import datetime
+
+# Local imports
+from achievements import AchievementSet
+from savefile import encode, read_save_data
+from savejournal import (
+    journal_path, last_sequence, replay, reset_journal, write_atomic
+)
+
+
+class Inventory:
+    def __init__(self):
+        self.items = {}
+        self.capacity = 10
+    
+    def add_item(self, item_name, quantity=1):
+        if len(self.items) >= self.capacity:
+            return False
+        if item_name in self.items:
+            self.items[item_name] += quantity
+        else:
+            self.items[item_name] = quantity
+        return True
+    
+    def remove_item(self, item_name, quantity=1):
+        if item_name in self.items:
+            if self.items[item_name] >= quantity:
+                self.items[item_name] -= quantity
+                if self.items[item_name] == 0:
+                    del self.items[item_name]
+                return True
+        return False
+    
+    def has_item(self, item_name):
+        return item_name in self.items
+    
+    def get_items(self):
+        return self.items.copy()
+
+
+class GameState:
+    def __init__(self):
+        self.score = 0
+        self.turns = 0
+        self.max_turns = 10
+        self.inventory = Inventory()
+        self.achievements = AchievementSet()
+        self.character_stats = {
+            "health": 100,
+            "strength": 10,
+            "magic": 5,
+            "luck": 5
+        }
+    
+    def to_save_data(self):
+        return {
+            "score": self.score,
+            "turns": self.turns,
+            "max_turns": self.max_turns,
+            "inventory": dict(self.inventory.items),
+            "achievements": list(self.achievements),
+            "character_stats": dict(self.character_stats),
+            "save_date": datetime.now().isoformat()
+        }
+    
+    @classmethod
+    def from_save_data(cls, save_data):
+        game_state = cls()
+        game_state.score = save_data["score"]
+        game_state.turns = save_data["turns"]
+        game_state.max_turns = save_data["max_turns"]
+        game_state.inventory.items = save_data["inventory"]
+        game_state.achievements = AchievementSet(save_data["achievements"])
+        game_state.character_stats = save_data["character_stats"]
+        return game_state
+    
+    def save(self, filename="save_game.json", binary=False):
+        save_data = self.to_save_data()
+        # Journal entries up to this sequence number are already included
+        save_data["journal_seq"] = last_sequence(filename)
+        # Write the snapshot atomically, then drop the journal it absorbed
+        write_atomic(filename, encode(save_data, binary))
+        reset_journal(filename)
+    
+    @classmethod
+    def load(cls, filename="save_game.json"):
+        if os.path.exists(filename):
+            # JSON or binary, detected from the file's header
+            save_data = read_save_data(filename)
+        elif os.path.exists(journal_path(filename)):
+            # Autosaved but never compacted: replay onto a fresh game
+            save_data = cls().to_save_data()
+        else:
+            return None
+        replay(save_data, filename)
+        return cls.from_save_data(save_data)
@@ -0,0 +1,160 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Win-probability and expected-score hints for each option at a
+#          prompt, looked up from the solver's precomputed decision table.
+
+# Standard library imports
+import json
+import zlib
+
+# Local imports
+from savejournal import write_atomic
+from scenes import GRAPH
+from solver import solve
+
+
+CACHE_VERSION = 1
+
+
+def fingerprint(graph=GRAPH):
+    """Return a digest of everything in a scene graph that affects values.
+
+    A cached table is only reused when the scene graph still has the same
+    fingerprint, so editing scenes.py never serves stale hints.
+    """
+    parts = []
+    for scene in graph.by_id:
+        parts.append((scene.name, scene.tick, scene.keys))
+        for choice, outcomes in sorted(
+                scene.choices.items(), key=lambda item: item[0] or ""):
+            parts.append((choice, [
+                (outcome.probability, outcome.score, outcome.won,
+                 outcome.next.name if outcome.next else None)
+                for outcome in outcomes
+            ]))
+    return f"{zlib.crc32(repr(parts).encode()):08x}"
+
+
+class HintTable:
+    """Per-option (expected_score, win_probability) for every prompt.
+
+    Values assume the rest of the game is played to maximize expected score,
+    and expected_score is the change in score from the prompt onwards.
+    """
+
+    def __init__(self, values, max_turns=10):
+        # (scene_name, turns) -> {option: (expected_score, win_probability)}
+        self.values = values
+        self.max_turns = max_turns
+
+    @classmethod
+    def build(cls, graph=GRAPH, max_turns=10):
+        """Solve the scene graph and keep its decision table."""
+        return cls(solve(graph, max_turns).values, max_turns)
+
+    @classmethod
+    def load(cls, filename, graph=GRAPH, max_turns=10):
+        """Load a cached table, or build and cache one if it is missing or
+        was made for a different scene graph or turn limit.
+
+        Args:
+            filename (str): The cache file.
+            graph (SceneGraph): The compiled scene graph. Defaults to GRAPH.
+            max_turns (int): The maximum number of turns allowed.
+
+        Returns:
+            HintTable: The table for this graph and turn limit.
+        """
+        digest = fingerprint(graph)
+        try:
+            with open(filename, "r") as f:
+                data = json.load(f)
+            if (data.get("version") == CACHE_VERSION
+                    and data.get("fingerprint") == digest
+                    and data.get("max_turns") == max_turns):
+                return cls({
+                    (scene_name, turns): {
+                        option: tuple(value)
+                        for option, value in options.items()
+                    }
+                    for scene_name, turns, options in data["values"]
+                }, max_turns)
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            pass
+
+        table = cls.build(graph, max_turns)
+        write_atomic(filename, json.dumps({
+            "version": CACHE_VERSION,
+            "fingerprint": digest,
+            "max_turns": max_turns,
+            "values": [
+                [scene_name, turns, options]
+                for (scene_name, turns), options in table.values.items()
+            ],
+        }).encode())
+        return table
+
+    def lookup(self, scene_name, turns):
+        """Return {option: (expected_score, win_probability)} for a prompt,
+        or None if the table has no entry for it."""
+        return self.values.get((scene_name, turns))
+
+    def lines(self, scene_name, turns, max_turns=None):
+        """Return hint text for a prompt, one line per option.
+
+        Args:
+            scene_name (str): The prompting scene.
+            turns (int): Turns taken so far, as play() counts them.
+            max_turns (int): The game's turn limit; no hints are given if it
+                             differs from the one the table was solved for.
+
+        Returns:
+            list: Hint lines, empty when no hint applies.
+        """
+        if max_turns is not None and max_turns != self.max_turns:
+            return []
+        options = self.lookup(scene_name, turns)
+        if not options:
+            return []
+        return [
+            f"💡 {option}: {win:.0%} chance to win, "
+            f"{expected:+.0f} expected points"
+            for option, (expected, win) in options.items()
+        ]
+
+    def wrap_policy(self, policy, game_state, show):
+        """Wrap a play() policy so hints are shown before each prompt.
+
+        Args:
+            policy (callable): A policy(scene_name, options) function.
+            game_state (GameState): The state being played, for its turns.
+            show (callable): Called with each hint line.
+
+        Returns:
+            callable: The wrapped policy.
+        """
+        def choose(scene_name, options):
+            for line in self.lines(
+                    scene_name, game_state.turns, game_state.max_turns):
+                show(line)
+            return policy(scene_name, options)
+
+        return choose
@@ -0,0 +1,234 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Leaderboard fed by completed games: an incremental top-K table and
+#          a streaming quantile sketch for percentile ranks in bounded memory.
+
+# Standard library imports
+import heapq
+import json
+import math
+import os
+import random
+import time
+from bisect import bisect_left, bisect_right
+
+# Local imports
+from savejournal import write_atomic
+
+
+SNAPSHOT_VERSION = 1
+
+
+class QuantileSketch:
+    """KLL streaming quantile sketch.
+
+    Values are kept in a stack of compactors; level h holds items that each
+    stand for 2**h recorded values. When the sketch reaches its capacity the
+    lowest full level is sorted and every other item is promoted to the next
+    level, so memory stays around 3k items however many values arrive, and
+    ranks are accurate to about 1.7/k of the count.
+    """
+
+    def __init__(self, k=200, rng=None):
+        self.k = k
+        self.rng = rng or random.Random()
+        self.levels = [[]]
+        self.count = 0
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, height):
+        depth = len(self.levels) - height - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def update(self, value):
+        """Record one value."""
+        self.levels[0].append(value)
+        self.count += 1
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self):
+        for height, level in enumerate(self.levels):
+            if len(level) >= self._capacity(height):
+                if height + 1 == len(self.levels):
+                    self.levels.append([])
+                level.sort()
+                # An odd item out stays behind; the rest are halved
+                keep = level[:len(level) % 2]
+                offset = len(keep) + (self.rng.random() < 0.5)
+                self.levels[height + 1].extend(level[offset::2])
+                self.levels[height] = keep
+                break
+        self._size = sum(len(level) for level in self.levels)
+        self._max_size = sum(
+            self._capacity(height) for height in range(len(self.levels))
+        )
+
+    def rank(self, value, inclusive=False):
+        """Estimate how many recorded values are below (or at) value."""
+        search = bisect_right if inclusive else bisect_left
+        total = 0
+        for height, level in enumerate(self.levels):
+            level.sort()
+            total += search(level, value) << height
+        return total
+
+    def percentile_rank(self, value):
+        """Estimate the percentage (0-100) of recorded values below value."""
+        if not self.count:
+            return 0.0
+        return 100.0 * self.rank(value) / self.count
+
+    def quantile(self, fraction):
+        """Estimate the value at a fraction (0-1) of the way through the data.
+
+        Returns:
+            The estimated quantile, or None if nothing has been recorded.
+        """
+        weighted = sorted(
+            (value, 1 << height)
+            for height, level in enumerate(self.levels)
+            for value in level
+        )
+        if not weighted:
+            return None
+        target = fraction * sum(weight for _, weight in weighted)
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self):
+        return {"k": self.k, "count": self.count, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data, rng=None):
+        sketch = cls(data["k"], rng)
+        sketch.levels = [list(level) for level in data["levels"]] or [[]]
+        sketch.count = data["count"]
+        sketch._size = sum(len(level) for level in sketch.levels)
+        sketch._max_size = sum(
+            sketch._capacity(height) for height in range(len(sketch.levels))
+        )
+        return sketch
+
+
+class Leaderboard:
+    """Best scores and score percentiles across every recorded game.
+
+    The top table is a min-heap capped at top_size entries, so recording a
+    game costs O(log top_size) and a game that does not place is rejected in
+    O(1). Percentile ranks come from a QuantileSketch over all scores. Ties
+    on score go to whoever got there first.
+    """
+
+    def __init__(self, top_size=100, sketch_k=200, rng=None):
+        self.top_size = top_size
+        self.sketch = QuantileSketch(sketch_k, rng)
+        self.sequence = 0
+        self._heap = []
+        self._snapshot_time = time.monotonic()
+
+    @property
+    def count(self):
+        """Number of games recorded."""
+        return self.sketch.count
+
+    def record(self, player, score):
+        """Record a finished game.
+
+        Args:
+            player (str): The player's name.
+            score (int): The game's final score.
+        """
+        self.sketch.update(score)
+        self.sequence += 1
+        entry = (score, -self.sequence, player)
+        if len(self._heap) < self.top_size:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def top(self, k=10):
+        """Return the k best games as (player, score) pairs, best first."""
+        return [
+            (player, score)
+            for score, _, player in heapq.nlargest(k, self._heap)
+        ]
+
+    def percentile_rank(self, score):
+        """Return the percentage (0-100) of recorded games below score."""
+        return self.sketch.percentile_rank(score)
+
+    def quantile(self, fraction):
+        """Return the estimated score at a fraction (0-1) of all games."""
+        return self.sketch.quantile(fraction)
+
+    def snapshot(self, filename="leaderboard.json"):
+        """Write the leaderboard to disk atomically."""
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "top_size": self.top_size,
+            "sequence": self.sequence,
+            "top": self._heap,
+            "sketch": self.sketch.to_dict(),
+        }
+        write_atomic(filename, json.dumps(data).encode())
+        self._snapshot_time = time.monotonic()
+
+    def snapshot_if_due(self, filename="leaderboard.json", interval=60.0):
+        """Snapshot the leaderboard if interval seconds have passed since the
+        last snapshot, so callers can check after every game without paying
+        for an atomic write each time.
+
+        Returns:
+            bool: True if a snapshot was written.
+        """
+        if time.monotonic() - self._snapshot_time < interval:
+            return False
+        self.snapshot(filename)
+        return True
+
+    @classmethod
+    def restore(cls, filename="leaderboard.json", rng=None):
+        """Load a leaderboard written by snapshot(), or None if there is none.
+
+        Raises:
+            ValueError: If the snapshot's version is newer than this code.
+        """
+        if not os.path.exists(filename):
+            return None
+        with open(filename, "r") as f:
+            data = json.load(f)
+        if data["version"] > SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported leaderboard version {data['version']}"
+            )
+        leaderboard = cls(data["top_size"], data["sketch"]["k"], rng)
+        leaderboard.sketch = QuantileSketch.from_dict(data["sketch"], rng)
+        leaderboard.sequence = data["sequence"]
+        leaderboard._heap = [tuple(entry) for entry in data["top"]]
+        heapq.heapify(leaderboard._heap)
+        return leaderboard
@@ -0,0 +1,248 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Opt-in instrumentation: latency histograms and counters around
+#          rendering, prompts, scenes and saves, exported as JSON or
+#          Prometheus text snapshots.
+
+# Standard library imports
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+
+# Local imports
+from savejournal import write_atomic
+
+
+# Histogram bucket upper bounds in seconds, from render calls (microseconds)
+# to a player thinking over a prompt (minutes)
+BUCKETS = (
+    1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5,
+    1.0, 5.0, 10.0, 60.0, float("inf")
+)
+
+PREFIX = "arcane_"
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class Metrics:
+    """Counters and latency histograms keyed by metric name and labels.
+
+    Labels are a tuple of (name, value) pairs. Metrics are recorded from the
+    game thread; snapshots copy each table in one step, which the GIL makes
+    safe to do from the snapshot thread.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self._snapshot_thread = None
+        self._stop = threading.Event()
+
+    def inc(self, name, labels=(), amount=1):
+        """Add to a counter."""
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, labels=()):
+        """Record one latency sample in a histogram."""
+        key = (name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+    def timed(self, function, name, labels=()):
+        """Wrap a function so every call's duration is observed."""
+        perf_counter = time.perf_counter
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.observe(name, perf_counter() - start, labels)
+
+        return wrapper
+
+    def trace(self, scene, choice, outcome, seconds):
+        """Interpreter trace callback: time the scene and count visits,
+        choices and results."""
+        labels = (("scene", scene.name),)
+        self.observe("scene_seconds", seconds, labels)
+        self.inc("scene_visits_total", labels)
+        if choice is not None:
+            self.inc("scene_choices_total", labels + (("choice", choice),))
+        if outcome.next is None:
+            result = "win" if outcome.won else "loss"
+            self.inc("scene_results_total", labels + (("result", result),))
+
+    def to_dict(self):
+        """Return every metric as a JSON-serializable dict."""
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in list(self.counters.items())
+        ]
+        histograms = [
+            {
+                "name": name,
+                "labels": dict(labels),
+                "count": histogram.count,
+                "sum": histogram.sum,
+                "buckets": dict(zip(
+                    (str(bound) for bound in BUCKETS), list(histogram.counts)
+                )),
+            }
+            for (name, labels), histogram in list(self.histograms.items())
+        ]
+        return {
+            "timestamp": time.time(),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def to_prometheus(self):
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(list(self.counters.items())):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {PREFIX}{name} counter")
+            lines.append(f"{PREFIX}{name}{_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(
+            list(self.histograms.items()), key=lambda item: item[0]
+        ):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {PREFIX}{name} histogram")
+            cumulative = 0
+            for bound, count in zip(BUCKETS, list(histogram.counts)):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f"{PREFIX}{name}_bucket"
+                    f"{_labels(labels + (('le', le),))} {cumulative}"
+                )
+            lines.append(f"{PREFIX}{name}_sum{_labels(labels)} {histogram.sum}")
+            lines.append(
+                f"{PREFIX}{name}_count{_labels(labels)} {histogram.count}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, filename, fmt="json"):
+        """Atomically write a snapshot as "json" or "prometheus" text."""
+        if fmt == "prometheus":
+            data = self.to_prometheus()
+        else:
+            data = json.dumps(self.to_dict())
+        write_atomic(filename, data.encode())
+
+    def start_snapshots(self, filename, interval=10.0, fmt="json"):
+        """Write a snapshot every interval seconds from a daemon thread."""
+        def run():
+            while not self._stop.wait(interval):
+                self.write_snapshot(filename, fmt)
+
+        self._stop.clear()
+        self._snapshot_thread = threading.Thread(target=run, daemon=True)
+        self._snapshot_thread.start()
+
+    def stop_snapshots(self):
+        """Stop periodic snapshots."""
+        self._stop.set()
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+
+
+def _labels(labels):
+    """Format labels as {name="value",...}, or nothing when there are none."""
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def install(metrics, game_module):
+    """Instrument the game module; nothing is wrapped until this is called.
+
+    Wraps print_sleep and render_line (render time), read_input (time spent
+    waiting for the player) and GameState.save/load with latency histograms,
+    and registers metrics.trace as an interpreter observer for per-scene
+    latency and visit, choice and win/loss counters. Scenes are timed by the
+    interpreter itself, so every way of playing is covered.
+
+    Args:
+        metrics (Metrics): Where to record.
+        game_module (module): The game module to instrument.
+
+    Returns:
+        callable: Removes the instrumentation again.
+    """
+    game_state = game_module.GameState
+    originals = {
+        "print_sleep": game_module.print_sleep,
+        "render_line": game_module.render_line,
+        "read_input": game_module.read_input,
+    }
+    saved_methods = game_state.__dict__["save"], game_state.__dict__["load"]
+
+    game_module.print_sleep = metrics.timed(
+        originals["print_sleep"], "render_seconds"
+    )
+    game_module.render_line = metrics.timed(
+        originals["render_line"], "render_seconds"
+    )
+    game_module.read_input = metrics.timed(
+        originals["read_input"], "input_wait_seconds"
+    )
+    game_state.save = metrics.timed(saved_methods[0], "save_seconds")
+    game_state.load = classmethod(
+        metrics.timed(saved_methods[1].__func__, "load_seconds")
+    )
+    game_module.observers.append(metrics.trace)
+
+    def uninstall():
+        for name, function in originals.items():
+            setattr(game_module, name, function)
+        game_state.save, game_state.load = saved_methods
+        game_module.observers.remove(metrics.trace)
+
+    return uninstall
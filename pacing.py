@@ -0,0 +1,173 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Non-blocking pacing of story text, with skip-to-end, a speed
+#          multiplier, a zero-delay mode, and type-ahead input.
+
+# Standard library imports
+import queue
+import sys
+import threading
+from collections import deque
+
+# Local imports
+from render import BufferedRenderer
+
+
+class Pacer:
+    """Owns queued output lines and renders them on a schedule.
+
+    Lines are written by a background thread that waits between them, so the
+    game logic never blocks on pacing. A separate thread reads player input
+    as soon as it is typed: any line entered while text is still printing
+    skips straight to the end of the queued text, and a non-empty line is
+    also kept as the answer to the next prompt (type-ahead).
+    """
+
+    def __init__(self, speed=1.0, output=None, input_stream=None):
+        self.speed = speed
+        # In zero-delay mode lines are buffered and written once per scene
+        self.buffer = BufferedRenderer(output or sys.stdout)
+        self.input_stream = input_stream or sys.stdin
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._skip = threading.Event()
+        self._answers = queue.Queue()
+        self._renderer = None
+        self._reader = None
+
+    @property
+    def output(self):
+        """The stream story text and prompts are written to."""
+        return self.buffer.stream
+
+    @output.setter
+    def output(self, stream):
+        self.buffer.flush()
+        self.buffer.stream = stream
+
+    @property
+    def zero_delay(self):
+        """True when lines are written immediately with no pacing at all."""
+        return self.speed <= 0
+
+    def emit(self, text, delay=0.5):
+        """Queue a line of output followed by a pause.
+
+        Args:
+            text (str): The fully formatted line (without a newline).
+            delay (float): Seconds to pause after the line at speed 1.0.
+        """
+        if self.zero_delay:
+            self.buffer.write(text)
+            return
+        with self._condition:
+            self._pending.append((text, delay))
+            self._condition.notify_all()
+        if self._renderer is None:
+            self._renderer = threading.Thread(
+                target=self._render_loop, daemon=True
+            )
+            self._renderer.start()
+
+    def skip(self):
+        """Print whatever is still queued without waiting."""
+        with self._condition:
+            if self._pending:
+                self._skip.set()
+
+    def drain(self):
+        """Block until every queued line has been written."""
+        self.buffer.flush()
+        with self._condition:
+            while self._pending:
+                self._condition.wait()
+
+    def read(self, prompt=""):
+        """Show a prompt once pending text is out, then return the answer.
+
+        Answers typed ahead while text was printing are returned right away
+        and echoed after the prompt.
+
+        Args:
+            prompt (str): The prompt text to display.
+
+        Returns:
+            str: The player's input line, without the trailing newline.
+
+        Raises:
+            EOFError: When input is exhausted, as input() would.
+        """
+        if self.zero_delay:
+            if self.input_stream is sys.stdin and self.output is sys.stdout:
+                self.buffer.flush()
+                return input(prompt)
+            self.buffer.flush(prompt)
+            line = self.input_stream.readline()
+            if not line:
+                raise EOFError
+            return line.rstrip("\r\n")
+        if self._reader is None:
+            self._reader = threading.Thread(
+                target=self._read_loop, daemon=True
+            )
+            self._reader.start()
+        self.drain()
+        typed_ahead = not self._answers.empty()
+        self.output.write(prompt)
+        self.output.flush()
+        answer = self._answers.get()
+        if answer is None:
+            self._answers.put(None)
+            raise EOFError
+        if typed_ahead:
+            self.output.write(answer + "\n")
+        return answer
+
+    def _render_loop(self):
+        """Background thread: write queued lines, pausing between them."""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                text, delay = self._pending[0]
+            self.output.write(text + "\n")
+            self.output.flush()
+            if delay > 0 and self.speed > 0:
+                self._skip.wait(delay / self.speed)
+            with self._condition:
+                self._pending.popleft()
+                if not self._pending:
+                    self._skip.clear()
+                    self._condition.notify_all()
+
+    def _read_loop(self):
+        """Background thread: collect input lines as soon as they arrive."""
+        for line in iter(self.input_stream.readline, ""):
+            line = line.rstrip("\r\n")
+            with self._condition:
+                if self._pending:
+                    # A keypress while text is printing skips to the end; a
+                    # bare Enter is only a skip, anything else is type-ahead.
+                    self._skip.set()
+                    if not line.strip():
+                        continue
+            self._answers.put(line)
+        self._answers.put(None)
@@ -0,0 +1,184 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Pre-colored, interned scene text and a buffered writer that flushes
+#          once per scene, for modes that render large volumes of text.
+
+# Standard library imports
+import sys
+
+# Third-party imports
+from colorama import Fore, Style
+
+# Local imports
+from scenes import GRAPH, TIMEOUT_LINES
+
+
+# Dynamic lines (e.g. turns remaining) are colored on demand; cap how many of
+# them are remembered so the cache cannot grow without bound.
+MAX_DYNAMIC_ENTRIES = 1024
+
+
+class ColorCache:
+    """Colored versions of every static line in a scene graph, built once.
+
+    Static scene text is colored and interned up front, so rendering a line
+    is a single dictionary lookup instead of a string concatenation per call.
+    """
+
+    def __init__(self, graph=GRAPH, color=True):
+        self.color = color
+        self._strings = {}
+        self._bytes = {}
+        self._dynamic = 0
+        for scene in graph.by_id:
+            self._add_lines(scene.lines)
+            for outcomes in scene.choices.values():
+                for outcome in outcomes:
+                    self._add_lines(outcome.lines)
+            if scene.retry:
+                self._store("RED", scene.retry)
+        for color_name, text in TIMEOUT_LINES:
+            self._store(color_name, text)
+
+    def _add_lines(self, lines):
+        for color_name, text, is_template in lines:
+            if not is_template:
+                self._store(color_name, text)
+
+    def _store(self, color_name, text):
+        if self.color:
+            colored = getattr(Fore, color_name) + text + Style.RESET_ALL
+        else:
+            colored = text
+        self._strings[(color_name, text)] = sys.intern(colored)
+        return colored
+
+    def colored(self, color_name, text):
+        """Return the line in its color, from the cache when possible.
+
+        Args:
+            color_name (str): Name of a colorama Fore attribute.
+            text (str): The line's text.
+
+        Returns:
+            str: The colored line, without a trailing newline.
+        """
+        colored = self._strings.get((color_name, text))
+        if colored is None:
+            if self._dynamic >= MAX_DYNAMIC_ENTRIES:
+                if not self.color:
+                    return text
+                return getattr(Fore, color_name) + text + Style.RESET_ALL
+            self._dynamic += 1
+            colored = self._store(color_name, text)
+        return colored
+
+    def line_bytes(self, color_name, text, newline="\r\n"):
+        """Return the colored line encoded as UTF-8 with a line ending.
+
+        Args:
+            color_name (str): Name of a colorama Fore attribute.
+            text (str): The line's text.
+            newline (str): Line ending to append. Defaults to "\\r\\n".
+
+        Returns:
+            bytes: The encoded line, cached for static text.
+        """
+        key = (color_name, text, newline)
+        encoded = self._bytes.get(key)
+        if encoded is None:
+            encoded = (self.colored(color_name, text) + newline).encode()
+            if (color_name, text) in self._strings:
+                self._bytes[key] = encoded
+        return encoded
+
+
+class BufferedRenderer:
+    """A play() render callback that writes once per scene, not per line.
+
+    Lines accumulate in memory and are written with a single write() when
+    flush() is called. wrap_policy() flushes right before each prompt, which
+    is exactly once per scene when walking the scene graph. write() buffers
+    a line that is already colored, for text that is not scene text.
+    """
+
+    def __init__(self, stream=None, cache=None):
+        self.stream = stream or sys.stdout
+        self._cache = cache
+        self.writes = 0
+        self._buffer = []
+
+    @property
+    def cache(self):
+        """The ColorCache lines are colored from, built on first use."""
+        if self._cache is None:
+            self._cache = default_cache()
+        return self._cache
+
+    def __call__(self, color_name, text):
+        self._buffer.append(self.cache.colored(color_name, text))
+
+    def write(self, text):
+        """Buffer one already-colored line."""
+        self._buffer.append(text)
+
+    def flush(self, suffix=""):
+        """Write every buffered line, then suffix, in one call and flush.
+
+        Args:
+            suffix (str): Text to write after the lines in the same call,
+                          e.g. a prompt.
+        """
+        if not self._buffer:
+            if suffix:
+                self.stream.write(suffix)
+                self.stream.flush()
+            return
+        self._buffer.append(suffix)
+        self.stream.write("\n".join(self._buffer))
+        self.stream.flush()
+        self._buffer.clear()
+        self.writes += 1
+
+    def wrap_policy(self, policy):
+        """Wrap a play() policy so pending text is flushed before each prompt.
+
+        Args:
+            policy (callable): A policy(scene_name, options) function.
+
+        Returns:
+            callable: The wrapped policy.
+        """
+        def choose(scene_name, options):
+            self.flush()
+            return policy(scene_name, options)
+
+        return choose
+
+
+_CACHES = {}
+
+
+def default_cache(color=True):
+    """Return the shared ColorCache for the game's scene graph."""
+    if color not in _CACHES:
+        _CACHES[color] = ColorCache(GRAPH, color)
+    return _CACHES[color]
@@ -0,0 +1,152 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Replay recorded games at full speed, with no rendering, and check
+#          that their recorded results still hold.
+
+# Standard library imports
+import argparse
+import random
+import sys
+import time
+
+# Local imports
+from gamestate import GameState
+from scenes import play
+from sessionlog import read_log
+from world import World, explore
+
+
+class ReplayError(Exception):
+    pass
+
+
+class ReplayPolicy:
+    """A play() policy that answers from a recorded list of choices."""
+
+    def __init__(self, choices):
+        self.choices = iter(choices)
+
+    def __call__(self, scene_name, options):
+        choice = next(self.choices, None)
+        if choice not in options:
+            raise ReplayError(
+                f"Recorded choice {choice!r} is not an option at '{scene_name}'"
+            )
+        return choice
+
+
+def replay_record(record):
+    """Re-run a recorded game headlessly.
+
+    Args:
+        record (dict): A record written by SessionLog; world-mode records
+                       are replayed in a world rebuilt from their seed.
+
+    Returns:
+        dict: The replayed game's won, score, turns and achievements, in the
+              same layout as the record.
+
+    Raises:
+        ReplayError: If the recorded choices no longer fit the scene graph.
+    """
+    game_state = GameState()
+    if "start" in record:
+        game_state.score, game_state.turns, game_state.max_turns = (
+            record["start"]
+        )
+    policy = ReplayPolicy(record["choices"])
+    rng = random.Random(record["seed"])
+    if "world" in record:
+        world = World(record["world"], max_turns=game_state.max_turns)
+        won = explore(game_state, world, policy, rng)
+    else:
+        won = play(game_state, policy, rng)
+    if next(policy.choices, None) is not None:
+        raise ReplayError("The game ended before every choice was used")
+    return {
+        "won": bool(won),
+        "score": game_state.score,
+        "turns": game_state.turns,
+        "achievements": sorted(game_state.achievements),
+    }
+
+
+def verify(records):
+    """Replay records and compare each result with the recorded one.
+
+    Args:
+        records (iterable): (label, record) pairs, e.g. from read_log.
+
+    Returns:
+        dict: "games" replayed and "mismatches", a list of
+              (label, expected, actual) where actual is the replayed result
+              or the ReplayError message.
+    """
+    games = 0
+    mismatches = []
+    for label, record in records:
+        games += 1
+        expected = {
+            key: record[key]
+            for key in ("won", "score", "turns", "achievements")
+        }
+        try:
+            actual = replay_record(record)
+        except ReplayError as exc:
+            actual = str(exc)
+        if actual != expected:
+            mismatches.append((label, expected, actual))
+    return {"games": games, "mismatches": mismatches}
+
+
+def main():
+    """Replay session logs from the command line; exit 1 on any mismatch."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded games and check their results."
+    )
+    parser.add_argument("logs", nargs="+", help="session log files")
+    parser.add_argument(
+        "--show", type=int, default=10,
+        help="how many mismatches to print"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = verify(
+        (f"{filename}:{line_number}", record)
+        for filename in args.logs
+        for line_number, record in read_log(filename)
+    )
+    elapsed = time.perf_counter() - start
+
+    mismatches = result["mismatches"]
+    for label, expected, actual in mismatches[:args.show]:
+        print(f"{label}: expected {expected}, replayed {actual}")
+    print(
+        f"Replayed {result['games']:,} games, {len(mismatches):,} mismatches "
+        f"in {elapsed:.3f}s "
+        f"({result['games'] / max(elapsed, 1e-9):,.0f} games/sec)"
+    )
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Save file encoding: the original JSON layout plus a compact,
+#          versioned binary layout, detected automatically when reading.
+
+# Standard library imports
+import functools
+import itertools
+import json
+import struct
+from datetime import datetime
+
+
+MAGIC = b"AESV"
+VERSION = 2
+
+# Interned names for items, achievements and stats. IDs are part of the file
+# format: only ever append to this tuple, never reorder or remove.
+NAMES = (
+    "amulet",
+    "Riddle Master",
+    "Forest Explorer",
+    "Friend of the Forest",
+    "Monster Slayer",
+    "Treasure Hunter",
+    "Ghost Whisperer",
+    "map",
+    "health",
+    "strength",
+    "magic",
+    "luck",
+)
+NAME_IDS = {name: index for index, name in enumerate(NAMES)}
+
+# Names missing from NAMES are written to a block of NUL-separated UTF-8
+# after the records; the first gets the ID after the writer's last interned
+# name, the next one the ID after that, and so on
+MAX_NAME_ID = 0xFFFF
+NAME_SEPARATOR = "\0"
+
+# magic, version, score, turns, max_turns, journal_seq, save_date (Unix
+# time), how many names the writer had interned, the item, achievement,
+# integer stat and float stat counts, and the size of the inline name block
+HEADER = struct.Struct("<4sBiHHIdHHHHHI")
+
+
+@functools.lru_cache(maxsize=256)
+def _records(items, achievements, int_stats, float_stats):
+    """Return the Struct for a save's records, so they decode in one call.
+
+    The name IDs of every item, achievement, integer stat and float stat
+    come first, then the item quantities, the integer stat values and the
+    float stat values.
+    """
+    names = items + achievements + int_stats + float_stats
+    return struct.Struct(
+        f"<{names}H{items}i{int_stats}q{float_stats}d"
+    )
+
+
+def is_binary(data):
+    """Return True if the bytes start with the binary save header."""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def encode_binary(save_data):
+    """Encode save data in the binary layout.
+
+    Args:
+        save_data (dict): Save data in the GameState.save layout.
+
+    Returns:
+        bytes: The encoded save.
+
+    Raises:
+        ValueError: If a value does not fit the layout: a non-integer score,
+                    turn count or item quantity, a non-numeric stat, a value
+                    out of range, a name containing NUL, or too many names.
+    """
+    inline = []
+    inline_ids = {}
+
+    def name_id(name):
+        interned = NAME_IDS.get(name)
+        if interned is not None:
+            return interned
+        if name not in inline_ids:
+            if not isinstance(name, str) or NAME_SEPARATOR in name:
+                raise ValueError(
+                    f"Name cannot be stored in a binary save: {name!r}"
+                )
+            inline_ids[name] = len(NAMES) + len(inline)
+            inline.append(name)
+        return inline_ids[name]
+
+    inventory = save_data["inventory"]
+    achievements = save_data["achievements"]
+    int_stats = {}
+    float_stats = {}
+    for name, value in save_data["character_stats"].items():
+        if isinstance(value, int) and not isinstance(value, bool):
+            int_stats[name] = value
+        elif isinstance(value, float):
+            float_stats[name] = value
+        else:
+            raise ValueError(
+                f"Stat cannot be stored in a binary save: {name}={value!r}"
+            )
+    ids = [name_id(name) for name in itertools.chain(
+        inventory, achievements, int_stats, float_stats
+    )]
+    if ids and max(ids) > MAX_NAME_ID:
+        raise ValueError("Too many distinct names for a binary save")
+    names = NAME_SEPARATOR.join(inline).encode()
+    save_date = save_data.get("save_date")
+    try:
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            save_data["score"],
+            save_data["turns"],
+            save_data["max_turns"],
+            save_data.get("journal_seq", 0),
+            datetime.fromisoformat(save_date).timestamp()
+            if save_date else 0.0,
+            len(NAMES),
+            len(inventory),
+            len(achievements),
+            len(int_stats),
+            len(float_stats),
+            len(names),
+        )
+        records = _records(
+            len(inventory), len(achievements), len(int_stats),
+            len(float_stats)
+        )
+        body = records.pack(
+            *ids,
+            *inventory.values(),
+            *int_stats.values(),
+            *float_stats.values(),
+        )
+    except struct.error as error:
+        raise ValueError(f"Save data does not fit a binary save: {error}")
+    return header + body + names
+
+
+def decode_binary(data):
+    """Decode a binary save into save data.
+
+    Args:
+        data (bytes): The file contents.
+
+    Returns:
+        dict: Save data in the GameState.save layout.
+
+    Raises:
+        ValueError: If the data is not a binary save, is truncated or
+                    corrupt, or has a version this code does not understand.
+    """
+    if not is_binary(data):
+        raise ValueError("Not a binary save file")
+    if len(data) == len(MAGIC):
+        raise ValueError("Truncated binary save file")
+    version = data[len(MAGIC)]
+    if version == 1:
+        return _decode_version1(data)
+    if version != VERSION:
+        raise ValueError(f"Unsupported save file version {version}")
+    if len(data) < HEADER.size:
+        raise ValueError("Truncated binary save file")
+    (_, _, score, turns, max_turns, journal_seq, save_date, interned,
+     item_count, achievement_count, int_stat_count, float_stat_count,
+     names_size) = HEADER.unpack_from(data)
+
+    records = _records(
+        item_count, achievement_count, int_stat_count, float_stat_count
+    )
+    offset = HEADER.size + records.size
+    if len(data) < offset + names_size:
+        raise ValueError("Truncated binary save file")
+    if interned > len(NAMES):
+        raise ValueError("Binary save file uses names this code lacks")
+    values = records.unpack_from(data, HEADER.size)
+    table = NAMES if interned == len(NAMES) else NAMES[:interned]
+    if names_size:
+        try:
+            table += tuple(
+                data[offset:offset + names_size].decode()
+                .split(NAME_SEPARATOR)
+            )
+        except UnicodeDecodeError as error:
+            raise ValueError(f"Corrupt binary save file: {error}")
+
+    # Names, then values, in the order _records lays them out
+    achievements_at = item_count
+    stats_at = achievements_at + achievement_count
+    values_at = stats_at + int_stat_count + float_stat_count
+    try:
+        names = [table[name_id] for name_id in values[:values_at]]
+    except IndexError:
+        raise ValueError("Corrupt binary save file: unknown name ID")
+    inventory = dict(zip(names, values[values_at:values_at + item_count]))
+    stats = dict(zip(names[stats_at:], values[values_at + item_count:]))
+
+    if save_date:
+        save_date = datetime.fromtimestamp(save_date).isoformat()
+    return {
+        "score": score,
+        "turns": turns,
+        "max_turns": max_turns,
+        "inventory": inventory,
+        "achievements": names[achievements_at:stats_at],
+        "character_stats": stats,
+        "save_date": save_date or None,
+        "journal_seq": journal_seq,
+    }
+
+
+# Version 1 layout: the four built-in stats inline in the header as int32,
+# and names as a uint16 ID or INLINE_NAME, a length byte and UTF-8 bytes
+HEADER_V1 = struct.Struct("<4sBiHHId4iHHB")
+NAME_ID_V1 = struct.Struct("<H")
+NAME_LENGTH_V1 = struct.Struct("<B")
+COUNT_V1 = struct.Struct("<i")
+INLINE_NAME_V1 = 0xFFFF
+STATS_V1 = ("health", "strength", "magic", "luck")
+
+
+def _unpack_name_v1(data, offset):
+    (name_id,) = NAME_ID_V1.unpack_from(data, offset)
+    offset += NAME_ID_V1.size
+    if name_id != INLINE_NAME_V1:
+        return NAMES[name_id], offset
+    (length,) = NAME_LENGTH_V1.unpack_from(data, offset)
+    offset += NAME_LENGTH_V1.size
+    if len(data) < offset + length:
+        raise ValueError("Truncated binary save file")
+    return data[offset:offset + length].decode(), offset + length
+
+
+def _decode_version1(data):
+    """Decode a save written in the version 1 layout."""
+    try:
+        (_, _, score, turns, max_turns, journal_seq, save_date,
+         *stat_values, item_count, achievement_count,
+         extra_count) = HEADER_V1.unpack_from(data)
+        offset = HEADER_V1.size
+        inventory = {}
+        for _ in range(item_count):
+            item, offset = _unpack_name_v1(data, offset)
+            (inventory[item],) = COUNT_V1.unpack_from(data, offset)
+            offset += COUNT_V1.size
+        achievements = []
+        for _ in range(achievement_count):
+            achievement, offset = _unpack_name_v1(data, offset)
+            achievements.append(achievement)
+        stats = dict(zip(STATS_V1, stat_values))
+        for _ in range(extra_count):
+            name, offset = _unpack_name_v1(data, offset)
+            (stats[name],) = COUNT_V1.unpack_from(data, offset)
+            offset += COUNT_V1.size
+    except struct.error:
+        raise ValueError("Truncated binary save file")
+    except (IndexError, UnicodeDecodeError) as error:
+        raise ValueError(f"Corrupt binary save file: {error}")
+
+    if save_date:
+        save_date = datetime.fromtimestamp(save_date).isoformat()
+    return {
+        "score": score,
+        "turns": turns,
+        "max_turns": max_turns,
+        "inventory": inventory,
+        "achievements": achievements,
+        "character_stats": stats,
+        "save_date": save_date or None,
+        "journal_seq": journal_seq,
+    }
+
+
+def encode(save_data, binary=False):
+    """Encode save data as JSON, or in the binary layout if binary is True."""
+    if binary:
+        return encode_binary(save_data)
+    return json.dumps(save_data).encode()
+
+
+def decode(data):
+    """Decode a save file's contents, detecting the format from the header.
+
+    Args:
+        data (bytes): The file contents.
+
+    Returns:
+        dict: Save data in the GameState.save layout.
+    """
+    if is_binary(data):
+        return decode_binary(data)
+    return json.loads(data)
+
+
+def read_save_data(filename):
+    """Read and decode a save file of either format.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(filename, "rb") as f:
+        return decode(f.read())
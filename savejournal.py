@@ -0,0 +1,311 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Crash-safe saves: atomic rename-based snapshots plus an append-only
+#          journal of state deltas that is replayed on load and compacted.
+
+# Standard library imports
+import json
+import os
+import tempfile
+
+# Local imports
+from savefile import decode, is_binary
+
+
+JOURNAL_SUFFIX = ".journal"
+
+# mkstemp creates files readable by their owner only; atomic writes give the
+# replacement the permissions a plain open() would have
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def journal_path(filename):
+    """Return the journal file that belongs to a save file."""
+    return filename + JOURNAL_SUFFIX
+
+
+def write_atomic(filename, data):
+    """Replace a file's contents so readers see either all or none of it.
+
+    The data is written and fsynced to a uniquely named temporary file in
+    the same directory, which is then renamed over the target. A crash at
+    any point leaves the previous file intact, and concurrent writers never
+    share a temporary file: the last rename wins.
+
+    Args:
+        filename (str): The file to replace.
+        data (bytes): The complete new contents.
+    """
+    directory = os.path.dirname(filename) or "."
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=os.path.basename(filename) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temporary, 0o666 & ~_UMASK)
+        os.replace(temporary, filename)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+    try:
+        directory = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory)
+    except OSError:
+        pass
+    finally:
+        os.close(directory)
+
+
+def read_journal(filename):
+    """Read the journal entries recorded for a save file.
+
+    Reading stops at the first incomplete or unreadable line, which is what
+    a crash in the middle of an append leaves behind.
+
+    Args:
+        filename (str): The save file whose journal should be read.
+
+    Returns:
+        list: Entry dicts in the order they were appended.
+    """
+    entries = []
+    try:
+        with open(journal_path(filename), "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def last_sequence(filename):
+    """Return the sequence number of the last journal entry, or 0."""
+    entries = read_journal(filename)
+    return entries[-1]["seq"] if entries else 0
+
+
+def reset_journal(filename):
+    """Empty a save file's journal once a snapshot has absorbed it.
+
+    The file is truncated in place rather than replaced, so a SaveJournal
+    that still has it open keeps appending to the live journal. A crash
+    part-way through is harmless: the snapshot's journal_seq already makes
+    replay skip every entry it absorbed.
+    """
+    try:
+        with open(journal_path(filename), "r+b") as f:
+            f.truncate(0)
+            f.flush()
+            os.fsync(f.fileno())
+    except FileNotFoundError:
+        pass
+
+
+def apply_entry(save_data, entry):
+    """Apply one journal entry to a save-data dict in place.
+
+    Entries hold absolute values rather than increments, so applying one
+    twice is harmless.
+
+    Args:
+        save_data (dict): Save data in the GameState.save layout.
+        entry (dict): A journal entry as written by SaveJournal.record.
+    """
+    for key in ("score", "turns", "max_turns", "character_stats"):
+        if key in entry:
+            save_data[key] = entry[key]
+    if "inventory" in entry:
+        inventory = save_data["inventory"]
+        for item, quantity in entry["inventory"].items():
+            if quantity:
+                inventory[item] = quantity
+            else:
+                inventory.pop(item, None)
+    if "achievements" in entry:
+        save_data["achievements"] = list(entry["achievements"])
+    elif "achievements_added" in entry:
+        save_data["achievements"] = (
+            list(save_data["achievements"]) + entry["achievements_added"]
+        )
+
+
+def replay(save_data, filename):
+    """Apply every journal entry newer than the snapshot's journal_seq.
+
+    Args:
+        save_data (dict): The snapshot's save data, updated in place.
+        filename (str): The save file whose journal should be replayed.
+
+    Returns:
+        dict: The same save_data, for convenience.
+    """
+    applied = save_data.get("journal_seq", 0)
+    for entry in read_journal(filename):
+        if entry["seq"] > applied:
+            apply_entry(save_data, entry)
+            applied = entry["seq"]
+    save_data["journal_seq"] = applied
+    return save_data
+
+
+class SaveJournal:
+    """Cheap autosaves: append a small delta per call, compact periodically.
+
+    Every record() appends one JSON line holding only what changed since the
+    previous record(). After compact_every entries the journal is folded into
+    a fresh snapshot with GameState.save, which writes the snapshot
+    atomically and then empties the journal. The snapshot keeps its JSON or
+    binary format unless binary is given.
+
+    A snapshot written by anyone else (a GameState.save when the player
+    saves) also empties the journal. The next record() notices and appends
+    the full state, since a delta against what was recorded before the
+    snapshot would miss whatever the snapshot overwrote.
+    """
+
+    def __init__(self, filename="save_game.json", compact_every=100,
+                 fsync=False, binary=None):
+        self.filename = filename
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.sequence = last_sequence(filename)
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+            self.sequence = max(
+                self.sequence, decode(data).get("journal_seq", 0)
+            )
+        except (FileNotFoundError, ValueError):
+            data = b""
+        # Compact into the snapshot's existing format unless told otherwise
+        self.binary = is_binary(data) if binary is None else binary
+        self.entries = 0
+        self._last = None
+        self._file = None
+        self._size = 0
+
+    def record(self, game_state):
+        """Append the changes since the previous record() to the journal.
+
+        Args:
+            game_state (GameState): The state to autosave.
+        """
+        current = {
+            "score": game_state.score,
+            "turns": game_state.turns,
+            "max_turns": game_state.max_turns,
+            "character_stats": dict(game_state.character_stats),
+            "inventory": dict(game_state.inventory.items),
+            "achievements": set(game_state.achievements),
+        }
+        if self._file is not None and (
+            os.fstat(self._file.fileno()).st_size < self._size
+        ):
+            # A snapshot absorbed the journal since the last record()
+            self._last = None
+        entry = _delta(self._last, current)
+        self._last = current
+        if entry is None:
+            return
+
+        self.sequence += 1
+        entry["seq"] = self.sequence
+        if self._file is None:
+            self._file = open(journal_path(self.filename), "ab")
+        self._file.write(
+            json.dumps(entry, separators=(",", ":")).encode() + b"\n"
+        )
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._size = self._file.tell()
+
+        self.entries += 1
+        if self.entries >= self.compact_every:
+            self.compact(game_state)
+
+    def compact(self, game_state):
+        """Fold the journal into a new snapshot and start it afresh."""
+        game_state.save(self.filename, self.binary)
+        # The snapshot holds exactly what was last recorded, so later
+        # records can stay deltas against it
+        self._size = 0
+        self.entries = 0
+
+    def close(self):
+        """Close the journal file; the next record() reopens it.
+
+        The next record() after a close appends the full state, since the
+        journal may have been compacted by someone else in the meantime.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._last = None
+        self._size = 0
+
+
+def _delta(previous, current):
+    """Build a journal entry for what changed, or None if nothing did."""
+    if previous is None:
+        entry = dict(current)
+        entry["achievements"] = sorted(current["achievements"])
+        return entry
+
+    entry = {}
+    for key in ("score", "turns", "max_turns", "character_stats"):
+        if current[key] != previous[key]:
+            entry[key] = current[key]
+
+    changed = {
+        item: quantity
+        for item, quantity in current["inventory"].items()
+        if previous["inventory"].get(item) != quantity
+    }
+    for item in previous["inventory"]:
+        if item not in current["inventory"]:
+            changed[item] = 0
+    if changed:
+        entry["inventory"] = changed
+
+    if current["achievements"] != previous["achievements"]:
+        if previous["achievements"] <= current["achievements"]:
+            entry["achievements_added"] = sorted(
+                current["achievements"] - previous["achievements"]
+            )
+        else:
+            entry["achievements"] = sorted(current["achievements"])
+    return entry or None
@@ -0,0 +1,163 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: SQLite save store holding many players and save slots in one
+#          database, with indexed latest-save and top-score queries.
+
+# Standard library imports
+import sqlite3
+
+# Local imports
+from gamestate import GameState
+from savefile import decode_binary, encode_binary
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    player TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    save_date TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (player, slot)
+);
+CREATE INDEX IF NOT EXISTS saves_player_date ON saves (player, save_date);
+CREATE INDEX IF NOT EXISTS saves_score ON saves (score);
+CREATE INDEX IF NOT EXISTS saves_date ON saves (save_date);
+"""
+
+UPSERT = """
+INSERT INTO saves (player, slot, score, turns, save_date, data)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (player, slot) DO UPDATE SET
+    score = excluded.score,
+    turns = excluded.turns,
+    save_date = excluded.save_date,
+    data = excluded.data
+"""
+
+
+class SaveStore:
+    """Saves for many players and slots in a single SQLite database.
+
+    Each save is one row keyed by (player, slot) holding the binary save
+    encoding, with score and save_date copied into indexed columns so the
+    latest save for a player and the top scores are index lookups.
+    """
+
+    def __init__(self, path="saves.db"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    @staticmethod
+    def _row(player, slot, game_state):
+        save_data = game_state.to_save_data()
+        return (
+            player,
+            slot,
+            save_data["score"],
+            save_data["turns"],
+            save_data["save_date"],
+            encode_binary(save_data),
+        )
+
+    def save(self, player, game_state, slot=1):
+        """Save a game to a player's slot, replacing what was there.
+
+        Args:
+            player (str): The player's name.
+            game_state (GameState): The state to save.
+            slot (int): The save slot. Defaults to 1.
+        """
+        with self.connection:
+            self.connection.execute(
+                UPSERT, self._row(player, slot, game_state)
+            )
+
+    def save_many(self, saves):
+        """Save many games in a single transaction, e.g. for bulk autosaves.
+
+        Args:
+            saves (iterable): (player, slot, game_state) tuples.
+        """
+        with self.connection:
+            self.connection.executemany(UPSERT, (
+                self._row(player, slot, game_state)
+                for player, slot, game_state in saves
+            ))
+
+    def load(self, player, slot=1):
+        """Load a player's save from a slot, or None if the slot is empty."""
+        row = self.connection.execute(
+            "SELECT data FROM saves WHERE player = ? AND slot = ?",
+            (player, slot)
+        ).fetchone()
+        if row is None:
+            return None
+        return GameState.from_save_data(decode_binary(row[0]))
+
+    def latest(self, player):
+        """Return (slot, GameState) for a player's newest save, or None."""
+        row = self.connection.execute(
+            "SELECT slot, data FROM saves WHERE player = ? "
+            "ORDER BY save_date DESC LIMIT 1",
+            (player,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], GameState.from_save_data(decode_binary(row[1]))
+
+    def slots(self, player):
+        """Return (slot, score, turns, save_date) rows for a player's saves."""
+        return self.connection.execute(
+            "SELECT slot, score, turns, save_date FROM saves "
+            "WHERE player = ? ORDER BY slot",
+            (player,)
+        ).fetchall()
+
+    def top_scores(self, limit=10):
+        """Return the highest-scoring saves as (player, slot, score, date)."""
+        return self.connection.execute(
+            "SELECT player, slot, score, save_date FROM saves "
+            "ORDER BY score DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+
+    def delete(self, player, slot=1):
+        """Delete a player's save in a slot, if any."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM saves WHERE player = ? AND slot = ?",
+                (player, slot)
+            )
@@ -0,0 +1,860 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: The forest's scenes as a table-driven graph, compiled once and
+#          walked by a single interpreter loop.
+
+# Standard library imports
+import random
+import time
+
+# Local imports
+from achievements import ENGINE
+
+
+# Lines are (color, text) pairs; colors name colorama Fore attributes so this
+# module stays free of terminal dependencies.
+WELCOME_LINES = [
+    ("YELLOW", "🌟 Welcome to Arcane Echoes! 🌟"),
+    ("GREEN", "You wake up in a mystical forest 🌲🌳, the air shimmering with "
+              "magic ✨."),
+    ("GREEN", "A glow in the distance catches your eye, but you hear "
+              "rustling nearby 🐾."),
+    ("YELLOW", "Your adventure begins now. Choose wisely!"),
+]
+
+TIMEOUT_LINES = [
+    ("RED", "⏳ Time runs out! The forest's magic fades."),
+    ("RED", "You're lost in the woods forever. You lose! 😢"),
+]
+
+# Each scene may consume a turn on entry ("tick"), shows its lines, then either
+# prompts for one of its "choices" or resolves its "outcomes" automatically.
+# An outcome list holds weighted alternatives; each alternative adjusts the
+# score, grants items, shows its lines, and then moves to "next" or ends the
+# game with "won". Achievements are granted by the rules in achievements.py.
+SCENES = {
+    "start": {
+        "lines": WELCOME_LINES + [
+            ("YELLOW", "⏳ You have {remaining} turns remaining."),
+            ("CYAN", "1️⃣ Follow the glowing light to the west 🌅."),
+            ("CYAN", "2️⃣ Investigate the rustling in the bushes to the "
+                     "east 🐿️."),
+            ("CYAN", "3️⃣ Explore a faint trail to the north 🛤️."),
+        ],
+        "prompt": "What will you do? (1/2/3): ",
+        "choices": {
+            "1": [{"next": "west"}],
+            "2": [{"next": "east"}],
+            "3": [{"next": "north"}],
+        },
+    },
+    "west": {
+        "tick": True,
+        "outcomes": [
+            {
+                "score": 10,
+                "lines": [
+                    ("GREEN", "You head toward the glowing light, feeling "
+                              "drawn to it."),
+                ],
+                "next": "riddle",
+            },
+        ],
+    },
+    "east": {
+        "tick": True,
+        "outcomes": [
+            {
+                "score": 10,
+                "lines": [
+                    ("GREEN", "You cautiously approach the rustling bushes."),
+                    ("GREEN", "The bushes part to reveal a friendly "
+                              "creature!"),
+                ],
+                "next": "squirrel",
+            },
+            {
+                "score": 10,
+                "lines": [
+                    ("GREEN", "You cautiously approach the rustling bushes."),
+                    ("RED", "A terrifying roar echoes from the bushes!"),
+                ],
+                "next": "monster",
+            },
+        ],
+    },
+    "north": {
+        "tick": True,
+        "outcomes": [
+            {
+                "score": 10,
+                "lines": [
+                    ("GREEN", "You follow the faint trail, curious about its "
+                              "secrets."),
+                    ("GREEN", "The trail leads to a mysterious structure!"),
+                ],
+                "next": "vault",
+            },
+            {
+                "score": 10,
+                "lines": [
+                    ("GREEN", "You follow the faint trail, curious about its "
+                              "secrets."),
+                    ("CYAN", "A chill runs down your spine as the air grows "
+                             "cold."),
+                ],
+                "next": "ghost",
+            },
+        ],
+    },
+    "riddle": {
+        "lines": [
+            ("GREEN", "You follow the glowing light to a magical clearing 🌼."),
+            ("GREEN", "A wise old wizard 🧙‍♂️ appears, his eyes twinkling "
+                      "with mischief."),
+            ("GREEN", "He says, 'Solve my riddle to gain a magical "
+                      "artifact! 🪄'"),
+            ("YELLOW", "Riddle: 'I speak without a mouth and hear without "
+                       "ears. I have no body, but I come alive with wind. "
+                       "What am I?'"),
+            ("CYAN", "1️⃣ Answer: A ghost 👻."),
+            ("CYAN", "2️⃣ Answer: An echo 🗣️."),
+            ("CYAN", "3️⃣ Answer: A bird 🐦."),
+        ],
+        "prompt": "Answer? (1/2/3): ",
+        "choices": {
+            "1": "wrong",
+            "2": [
+                {
+                    "score": 50,
+                    "lines": [
+                        ("GREEN", "'Correct!' the wizard exclaims, handing "
+                                  "you a glowing amulet 💎."),
+                        ("GREEN", "The amulet pulses with power, making you "
+                                  "feel invincible."),
+                        ("GREEN", "You thank the wizard and prepare to "
+                                  "continue your quest."),
+                    ],
+                    "items": ["amulet"],
+                    "next": "amulet",
+                },
+            ],
+            "3": "wrong",
+            "wrong": [
+                {
+                    "score": -20,
+                    "lines": [
+                        ("RED", "'Wrong!' the wizard says, his voice cold. "
+                                "The clearing fades."),
+                        ("RED", "Shadow creatures attack from the "
+                                "darkness 🌑!"),
+                        ("RED", "You barely escape, wounded and defeated. "
+                                "You lose! 😢"),
+                    ],
+                    "won": False,
+                },
+            ],
+        },
+    },
+    "amulet": {
+        "outcomes": [
+            {
+                "score": 20,
+                "lines": [
+                    ("GREEN", "The amulet guides you to a final challenge."),
+                ],
+                "next": "final_path",
+            },
+        ],
+    },
+    "final_path": {
+        "tick": True,
+        "lines": [
+            ("GREEN", "With the amulet's power, you venture deeper into the "
+                      "forest."),
+            ("GREEN", "The path splits, presenting a crucial choice:"),
+            ("CYAN", "1️⃣ A rickety bridge over a roaring river 🌉."),
+            ("CYAN", "2️⃣ A narrow trail leading to a towering mountain ⛰️."),
+        ],
+        "prompt": "Which path? (1/2): ",
+        "choices": {
+            "1": [
+                {
+                    "score": 50,
+                    "lines": [
+                        ("GREEN", "You carefully cross the bridge, which "
+                                  "holds strong."),
+                        ("GREEN", "Beyond lies a grand kingdom, its gates "
+                                  "open wide! 🏰"),
+                        ("GREEN", "The king rewards your bravery. You win! 🎊"),
+                    ],
+                    "won": True,
+                },
+                {
+                    "score": -40,
+                    "lines": [
+                        ("RED", "The bridge creaks and snaps beneath you!"),
+                        ("RED", "You fall into the raging river below. 🌊"),
+                        ("RED", "You're swept away, defeated. You lose! 😢"),
+                    ],
+                    "won": False,
+                },
+            ],
+            "2": [
+                {
+                    "score": 60,
+                    "lines": [
+                        ("GREEN", "You climb the steep trail, reaching a "
+                                  "dragon's lair! 🐉"),
+                        ("GREEN", "The dragon, awed by your amulet, bows "
+                                  "respectfully."),
+                        ("GREEN", "It offers you a hoard of treasure. You "
+                                  "win! 💰🎉"),
+                    ],
+                    "won": True,
+                },
+            ],
+        },
+    },
+    "squirrel": {
+        "lines": [
+            ("GREEN", "A friendly squirrel 🐿️ pops out, chattering "
+                      "excitedly."),
+            ("GREEN", "It seems to offer guidance through the forest."),
+            ("CYAN", "1️⃣ Follow the squirrel to a sunny meadow 🌞."),
+            ("CYAN", "2️⃣ Head toward a creepy cave nearby 🕸️."),
+            ("CYAN", "3️⃣ Decline and explore a riverbank instead 🌊."),
+        ],
+        "prompt": "What do you do? (1/2/3): ",
+        "choices": {
+            "1": [
+                {
+                    "score": 50,
+                    "lines": [
+                        ("GREEN", "The squirrel leads you to a meadow bathed "
+                                  "in sunlight."),
+                        ("GREEN", "You find a hidden treasure chest filled "
+                                  "with riches! 🎁"),
+                        ("GREEN", "Gold coins and jewels sparkle in your "
+                                  "hands. You win! 🎉"),
+                    ],
+                    "won": True,
+                },
+            ],
+            "2": [
+                {
+                    "score": -30,
+                    "lines": [
+                        ("RED", "The cave is dark, with eerie whispers "
+                                "echoing around 👻."),
+                        ("RED", "You stumble in the darkness and fall into a "
+                                "deep pit."),
+                        ("RED", "You lose consciousness. You lose! 😱"),
+                    ],
+                    "won": False,
+                },
+            ],
+            "3": [
+                {
+                    "score": 40,
+                    "lines": [
+                        ("GREEN", "At the riverbank, you find a sturdy boat "
+                                  "waiting 🚤."),
+                        ("GREEN", "You sail down the river, arriving at a "
+                                  "peaceful village."),
+                        ("GREEN", "The villagers welcome you warmly. You "
+                                  "win! 🥳"),
+                    ],
+                    "won": True,
+                },
+            ],
+        },
+    },
+    "monster": {
+        "lines": [
+            ("RED", "A monster 🐺 bursts from the bushes, growling fiercely!"),
+            ("RED", "Its eyes glow with menace as it charges toward you!"),
+            ("CYAN", "1️⃣ Fight the monster with a nearby stick 🪵."),
+            ("CYAN", "2️⃣ Run away as fast as you can 🏃‍♂️."),
+            ("CYAN", "3️⃣ Try to hide behind a tree 🌳."),
+        ],
+        "prompt": "What do you do? (1/2/3): ",
+        "choices": {
+            "1": [
+                {
+                    "score": 60,
+                    "lines": [
+                        ("GREEN", "You swing the stick with all your might!"),
+                        ("GREEN", "The monster falls, defeated by your "
+                                  "bravery! 💪"),
+                        ("GREEN", "You find a map 🗺️ on the monster, leading "
+                                  "to a castle."),
+                        ("GREEN", "At the castle, you're crowned a hero! You "
+                                  "win! 👑"),
+                    ],
+                    "items": ["map"],
+                    "won": True,
+                },
+                {
+                    "score": -40,
+                    "lines": [
+                        ("RED", "The monster overpowers you, its claws "
+                                "slashing."),
+                        ("RED", "You collapse, defeated. You lose! 😵"),
+                    ],
+                    "won": False,
+                },
+            ],
+            "2": [
+                {
+                    "score": 30,
+                    "lines": [
+                        ("GREEN", "You sprint away, heart pounding, and "
+                                  "escape! 🏃‍♂️💨"),
+                        ("GREEN", "You stumble upon a friendly village, safe "
+                                  "at last."),
+                        ("GREEN", "The villagers offer you shelter. You win! "
+                                  "🏡"),
+                    ],
+                    "won": True,
+                },
+            ],
+            "3": [
+                {
+                    "score": 30,
+                    "lines": [
+                        ("GREEN", "You hide silently behind the tree, holding "
+                                  "your breath."),
+                        ("GREEN", "The monster leaves, and you find a safe "
+                                  "path."),
+                        ("GREEN", "You reach a village and are welcomed. You "
+                                  "win! 🥰"),
+                    ],
+                    "won": True,
+                },
+                {
+                    "score": -30,
+                    "lines": [
+                        ("RED", "The monster sniffs you out and attacks! 😱"),
+                        ("RED", "You try to flee but are overwhelmed. You "
+                                "lose!"),
+                    ],
+                    "won": False,
+                },
+            ],
+        },
+    },
+    "vault": {
+        "lines": [
+            ("GREEN", "You stumble upon a hidden vault, its door glowing with "
+                      "runes."),
+            ("GREEN", "A magical lock bars your entry, pulsing with energy."),
+            ("CYAN", "1️⃣ Try to pick the lock with your skills 🔓."),
+            ("CYAN", "2️⃣ Search the area for a hidden key 🗝️."),
+            ("CYAN", "3️⃣ Attempt to cast a spell to unlock it 🪄."),
+        ],
+        "prompt": "What do you do? (1/2/3): ",
+        "choices": {
+            "1": [
+                {
+                    "score": 70,
+                    "lines": [
+                        ("GREEN", "Your nimble fingers unlock the vault with "
+                                  "a click!"),
+                        ("GREEN", "Inside, you find piles of gold and gems! "
+                                  "💎"),
+                        ("GREEN", "You're now a legend of wealth. You win! 🎉"),
+                    ],
+                    "won": True,
+                },
+                {
+                    "score": -50,
+                    "lines": [
+                        ("RED", "A trap springs! Darts shoot from the walls! "
+                                "🏹"),
+                        ("RED", "You're wounded and retreat in defeat. You "
+                                "lose! 😢"),
+                    ],
+                    "won": False,
+                },
+            ],
+            "2": [
+                {
+                    "score": 60,
+                    "lines": [
+                        ("GREEN", "You search carefully and find a golden key "
+                                  "hidden nearby."),
+                        ("GREEN", "The key unlocks the vault, revealing "
+                                  "treasures galore!"),
+                        ("GREEN", "You claim the riches and win! 💰"),
+                    ],
+                    "won": True,
+                },
+            ],
+            "3": [
+                {
+                    "score": 80,
+                    "lines": [
+                        ("GREEN", "Your spell glows brightly, and the lock "
+                                  "melts away!"),
+                        ("GREEN", "The vault opens, filled with magical "
+                                  "artifacts! 🪄"),
+                        ("GREEN", "You're hailed as a master mage. You win! "
+                                  "🎉"),
+                    ],
+                    "won": True,
+                },
+                {
+                    "score": -40,
+                    "lines": [
+                        ("RED", "The spell backfires, zapping you with "
+                                "energy! ⚡"),
+                        ("RED", "You collapse, defeated by your own magic. "
+                                "You lose!"),
+                    ],
+                    "won": False,
+                },
+            ],
+        },
+    },
+    "ghost": {
+        "lines": [
+            ("CYAN", "A ghostly figure 👻 materializes, its voice echoing "
+                     "eerily."),
+            ("CYAN", "It offers a challenge to prove your worth."),
+            ("CYAN", "1️⃣ Answer its cryptic question."),
+            ("CYAN", "2️⃣ Offer a tribute to appease it."),
+            ("CYAN", "3️⃣ Flee from the ghostly presence."),
+        ],
+        "prompt": "What do you do? (1/2/3): ",
+        "choices": {
+            "1": [
+                {
+                    "score": 65,
+                    "lines": [
+                        ("GREEN", "You answer wisely: 'The moon guides the "
+                                  "lost.'"),
+                        ("GREEN", "The ghost nods and grants you passage to a "
+                                  "shrine."),
+                        ("GREEN", "You're blessed with wisdom. You win! 🌟"),
+                    ],
+                    "won": True,
+                },
+                {
+                    "score": -45,
+                    "lines": [
+                        ("RED", "Your answer falters, angering the ghost!"),
+                        ("RED", "It curses you, draining your strength. You "
+                                "lose! 😢"),
+                    ],
+                    "won": False,
+                },
+            ],
+            "2": [
+                {
+                    "score": 55,
+                    "lines": [
+                        ("GREEN", "You offer a shiny trinket, and the ghost "
+                                  "accepts."),
+                        ("GREEN", "It vanishes, leaving a path to a sacred "
+                                  "grove."),
+                        ("GREEN", "You're honored as a peacemaker. You win! "
+                                  "🌿"),
+                    ],
+                    "won": True,
+                },
+            ],
+            "3": [
+                {
+                    "score": 35,
+                    "lines": [
+                        ("GREEN", "You run swiftly, evading the ghost's "
+                                  "grasp!"),
+                        ("GREEN", "You find a safe haven in a nearby "
+                                  "village."),
+                        ("GREEN", "You're safe at last. You win! 🏡"),
+                    ],
+                    "won": True,
+                },
+                {
+                    "score": -35,
+                    "lines": [
+                        ("RED", "The ghost catches you, its touch freezing!"),
+                        ("RED", "You're trapped in its realm. You lose! 👻"),
+                    ],
+                    "won": False,
+                },
+            ],
+        },
+    },
+}
+
+
+class Outcome:
+    __slots__ = (
+        "probability", "threshold", "score", "lines", "encounter_lines",
+        "items", "achievements", "won", "next"
+    )
+
+
+class Scene:
+    __slots__ = (
+        "id", "name", "tick", "lines", "prompt", "retry", "keys", "choices"
+    )
+
+
+class SceneGraph:
+    __slots__ = ("start", "scenes", "by_id")
+
+    def __getitem__(self, name):
+        return self.scenes[name]
+
+
+def _compile_lines(lines):
+    """Freeze (color, text) pairs into (color, text, is_template) triples."""
+    return tuple((color, text, "{" in text) for color, text in lines)
+
+
+def _without_verdict(text):
+    """Cut the closing "You win!" from a line, for an encounter won in the
+    middle of a game that goes on (e.g. in world mode)."""
+    for verdict in (" You win!", " and win!"):
+        cut = text.find(verdict)
+        if cut >= 0:
+            text = text[:cut]
+            return text if text.endswith(("!", ".")) else text + "."
+    return text
+
+
+def _retry_message(keys):
+    """Build the invalid-input message shown for a prompt's options."""
+    if len(keys) == 2:
+        return f"Please enter {keys[0]} or {keys[1]}."
+    return "Please enter " + ", ".join(keys[:-1]) + f", or {keys[-1]}."
+
+
+def compile_scenes(scenes, start="start", engine=ENGINE):
+    """Compile a raw scene table into a linked, immutable SceneGraph.
+
+    Choice keys may alias another entry of the same choices table by name
+    (e.g. the riddle's wrong answers share one "wrong" outcome list); aliased
+    entries that are not digits are not offered to the player. Outcome
+    weights are normalised into cumulative thresholds so the interpreter can
+    pick an alternative with a single rng.random() draw.
+
+    An outcome event is fully determined by the outcome itself, so the
+    achievement engine's outcome rules are evaluated here, once, and their
+    achievements stored on the outcome alongside any listed in the table.
+
+    Args:
+        scenes (dict): Scene table in the format of SCENES.
+        start (str): Name of the scene the game begins in. Defaults to "start".
+        engine (AchievementEngine): Rules granting achievements. Defaults to
+                                    the game's rules.
+
+    Returns:
+        SceneGraph: Compiled graph whose scenes reference each other directly.
+
+    Raises:
+        ValueError: If an outcome refers to an unknown scene, a choice alias
+                    is unknown, an outcome neither continues nor ends, or
+                    it lists an achievement no rule grants.
+    """
+    graph = SceneGraph()
+    graph.scenes = {}
+    graph.by_id = []
+    for name in scenes:
+        scene = Scene()
+        scene.id = len(graph.by_id)
+        scene.name = name
+        graph.scenes[name] = scene
+        graph.by_id.append(scene)
+
+    for name, raw in scenes.items():
+        scene = graph.scenes[name]
+        scene.tick = raw.get("tick", False)
+        scene.lines = _compile_lines(raw.get("lines", ()))
+        scene.prompt = raw.get("prompt")
+        if "outcomes" in raw:
+            raw_choices = {None: raw["outcomes"]}
+            scene.keys = ()
+        else:
+            raw_choices = raw["choices"]
+            scene.keys = tuple(key for key in raw_choices if key.isdigit())
+        scene.retry = _retry_message(scene.keys) if scene.keys else None
+
+        compiled = {}
+        for key, alternatives in raw_choices.items():
+            if isinstance(alternatives, str):
+                if alternatives not in raw_choices:
+                    raise ValueError(
+                        f"Scene '{name}' choice '{key}' aliases unknown "
+                        f"choice '{alternatives}'"
+                    )
+                alternatives = raw_choices[alternatives]
+            total = sum(alt.get("weight", 1) for alt in alternatives)
+            outcomes = []
+            cumulative = 0
+            for alt in alternatives:
+                cumulative += alt.get("weight", 1)
+                outcome = Outcome()
+                outcome.probability = alt.get("weight", 1) / total
+                outcome.threshold = cumulative / total
+                outcome.score = alt.get("score", 0)
+                outcome.lines = _compile_lines(alt.get("lines", ()))
+                outcome.encounter_lines = outcome.lines
+                if alt.get("won"):
+                    outcome.encounter_lines = tuple(
+                        (color, _without_verdict(text), is_template)
+                        for color, text, is_template in outcome.lines
+                    )
+                outcome.items = tuple(alt.get("items", ()))
+                outcome.won = alt.get("won")
+                target = alt.get("next")
+                unlocked = engine.names_of(engine.fire(
+                    "outcome", scene=name, choice=key, won=outcome.won,
+                    next=target
+                ))
+                listed = tuple(alt.get("achievements", ()))
+                for achievement in listed:
+                    if achievement not in engine.bits:
+                        raise ValueError(
+                            f"Scene '{name}' lists unknown achievement "
+                            f"'{achievement}'"
+                        )
+                outcome.achievements = tuple(dict.fromkeys(listed + unlocked))
+                if target is None:
+                    if outcome.won is None:
+                        raise ValueError(
+                            f"Scene '{name}' has an outcome with neither "
+                            f"'next' nor 'won'"
+                        )
+                    outcome.next = None
+                elif target in graph.scenes:
+                    outcome.next = graph.scenes[target]
+                else:
+                    raise ValueError(
+                        f"Scene '{name}' leads to unknown scene '{target}'"
+                    )
+                outcomes.append(outcome)
+            compiled[key] = tuple(outcomes)
+        scene.choices = compiled
+
+    graph.start = graph.scenes[start]
+    return graph
+
+
+GRAPH = compile_scenes(SCENES)
+_TIMEOUT = _compile_lines(TIMEOUT_LINES)
+
+
+def _render_lines(render, lines, state):
+    """Send compiled lines to a render callback, filling in templates."""
+    for color, text, is_template in lines:
+        if is_template:
+            text = text.format(remaining=state.max_turns - state.turns)
+        render(color, text)
+
+
+def game_over(state, won):
+    """Fire the game_over event and grant what it unlocks; return won.
+
+    The interpreter calls this when a game ends, unless it is told the
+    game goes on after the encounter, in which case the caller calls it
+    once the game really ends.
+    """
+    unlocked = ENGINE.fire(
+        "game_over", won=won, score=state.score, turns=state.turns
+    )
+    if unlocked:
+        for achievement in ENGINE.names_of(unlocked):
+            state.achievements.add(achievement)
+    return won
+
+
+def _steps(state, scene, rng, render, trace, single, ending=True):
+    """The interpreter loop, as a generator driven by play() and Session.
+
+    Yields each scene that prompts the player and expects the chosen option
+    to be sent back. Turn costs, outcome draws, score deltas, items,
+    achievements and rendering all happen here, so every way of playing
+    the game follows exactly the same rules.
+
+    With ending False, a scene that resolves the encounter does not end the
+    game: game_over is left to the caller and won encounters are rendered
+    without their "You win!".
+
+    Returns:
+        bool: Through StopIteration, True if the game (or, with single, the
+              scene) was won.
+    """
+    perf_counter = time.perf_counter
+    while True:
+        # Scenes are only timed for a trace callback; headless runs skip it
+        if trace is not None:
+            entered = perf_counter()
+        if scene.tick:
+            state.turns += 1
+            if state.turns >= state.max_turns:
+                if render is not None:
+                    _render_lines(render, _TIMEOUT, state)
+                return game_over(state, False) if ending else False
+        if render is not None:
+            _render_lines(render, scene.lines, state)
+
+        if scene.keys:
+            choice = yield scene
+        else:
+            choice = None
+        outcomes = scene.choices[choice]
+        outcome = outcomes[0]
+        if len(outcomes) > 1:
+            roll = rng.random()
+            for outcome in outcomes:
+                if roll < outcome.threshold:
+                    break
+        if trace is not None:
+            trace(scene, choice, outcome, perf_counter() - entered)
+
+        state.score += outcome.score
+        for item in outcome.items:
+            state.inventory.add_item(item)
+        for achievement in outcome.achievements:
+            state.achievements.add(achievement)
+        if render is not None:
+            _render_lines(
+                render, outcome.lines if ending else outcome.encounter_lines,
+                state
+            )
+
+        scene = outcome.next
+        if scene is None:
+            return game_over(state, outcome.won) if ending else outcome.won
+        if single:
+            return True
+
+
+def play(state, policy, rng=random, render=None, scene=None, single=False,
+         trace=None, ending=True):
+    """Walk the scene graph from a scene until the game (or scene) resolves.
+
+    This is the one interpreter for every encounter. Turn costs, score deltas,
+    items and achievements are applied to the given state; text is sent to the
+    render callback only when one is provided, so headless runs skip rendering
+    entirely.
+
+    Args:
+        state (GameState): Game state to update; needs score, turns,
+                           max_turns, inventory.add_item and achievements.add.
+        policy (callable): Called as policy(scene_name, options) whenever a
+                           scene prompts the player; returns an option key.
+        rng (random.Random): Source of weighted outcome draws. Defaults to the
+                             global random module.
+        render (callable): Optional render(color, text) callback for output.
+        scene (Scene): Scene to start from. Defaults to GRAPH.start.
+        single (bool): Stop once the starting scene resolves instead of
+                       following it to the end of the game.
+        trace (callable): Optional trace(scene, choice, outcome, seconds)
+                          callback, called for every outcome drawn; choice
+                          is None for automatic scenes, and seconds is the
+                          time from entering the scene to the draw,
+                          including its text and the wait for the player.
+        ending (bool): Whether resolving the scene ends the game. Pass False
+                       when the game goes on afterwards: the game_over event
+                       is then left to the caller and a won encounter's
+                       "You win!" is not shown.
+
+    Returns:
+        bool: True if the game (or, with single, the scene) was won. A scene
+              that continues to another scene counts as won.
+    """
+    steps = _steps(
+        state, GRAPH.start if scene is None else scene, rng, render, trace,
+        single, ending
+    )
+    send = steps.send
+    try:
+        scene = next(steps)
+        while True:
+            scene = send(policy(scene.name, scene.keys))
+    except StopIteration as stop:
+        return stop.value
+
+
+class Session:
+    """A game walked one prompt at a time, for servers that cannot block.
+
+    advance() runs the interpreter up to the next prompt (or the end of the
+    game) and returns the lines to show; the caller then collects the
+    player's choice however it likes and passes it to the next advance().
+    An optional trace callback sees every outcome drawn, as with play().
+    Both drive the same interpreter loop, so they cannot drift apart.
+    """
+
+    __slots__ = ("state", "scene", "finished", "won", "_steps", "_lines")
+
+    def __init__(self, state, rng=random, scene=None, trace=None):
+        self.state = state
+        self.scene = None
+        self.finished = False
+        self.won = False
+        self._lines = []
+        self._steps = _steps(
+            state, GRAPH.start if scene is None else scene, rng,
+            self._render, trace, False
+        )
+
+    def _render(self, color, text):
+        self._lines.append((color, text))
+
+    @property
+    def options(self):
+        """The option keys the current prompt accepts (empty once over)."""
+        return () if self.finished else self.scene.keys
+
+    def advance(self, choice=None):
+        """Apply a choice and play on until the next prompt or the end.
+
+        Args:
+            choice (str): The player's option for the current prompt. Omit it
+                          on the first call to enter the starting scene.
+
+        Returns:
+            list: (color, text) lines to show, in order.
+
+        Raises:
+            ValueError: If the game is over, or choice is not one of the
+                        current scene's options.
+        """
+        if self.finished:
+            raise ValueError("The game is over")
+        if self.scene is not None and choice not in self.scene.keys:
+            raise ValueError(self.scene.retry)
+        self._lines = lines = []
+        try:
+            if self.scene is None:
+                self.scene = next(self._steps)
+            else:
+                self.scene = self._steps.send(choice)
+        except StopIteration as stop:
+            self.finished = True
+            self.won = stop.value
+        return lines
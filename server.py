@@ -0,0 +1,314 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Asyncio game server running many concurrent player sessions in one
+#          event loop over TCP or Unix sockets.
+
+# Standard library imports
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import deque
+
+# Third-party imports
+from colorama import Fore, Style
+
+# Local imports
+from compact import CompactGameState
+from leaderboard import Leaderboard
+from render import default_cache
+from scenes import Session
+from sessionlog import SessionLog
+
+
+class LatencyStats:
+    def __init__(self, size=10000):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, percent):
+        """Return a percentile (0-100) of the recent samples, in seconds."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[index]
+
+
+class GameServer:
+    def __init__(self, delay=0.5, color=True, idle_timeout=300.0, rng=None,
+                 leaderboard=None, log=None):
+        self.delay = delay
+        self.color = color
+        self.colors = default_cache(color)
+        self.idle_timeout = idle_timeout
+        self.rng = rng or random.Random()
+        self.latency = LatencyStats()
+        self.leaderboard = leaderboard
+        self.log = log
+        self.active_sessions = 0
+        self.total_sessions = 0
+
+    def format_line(self, color, text):
+        """Encode one line of output, colored unless color is disabled."""
+        return self.colors.line_bytes(color, text)
+
+    async def send_lines(self, writer, lines, started=None):
+        """Write lines to a client, pacing them with non-blocking sleeps.
+
+        Without a pacing delay the whole batch goes out in a single write.
+
+        Args:
+            writer (asyncio.StreamWriter): The client connection.
+            lines (list): (color, text) pairs to send.
+            started (float): perf_counter() time the triggering choice
+                             arrived; when given, the latency to the first
+                             line is recorded.
+        """
+        if not self.delay:
+            writer.write(b"".join(
+                self.format_line(color, text) for color, text in lines
+            ))
+            await writer.drain()
+            if started is not None:
+                self.latency.record(time.perf_counter() - started)
+            return
+        for color, text in lines:
+            writer.write(self.format_line(color, text))
+            if started is not None:
+                await writer.drain()
+                self.latency.record(time.perf_counter() - started)
+                started = None
+            await writer.drain()
+            await asyncio.sleep(self.delay)
+
+    async def read_line(self, reader):
+        """Read one line from a client, or None on disconnect or idle timeout."""
+        try:
+            data = await asyncio.wait_for(
+                reader.readline(), self.idle_timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+        if not data:
+            return None
+        return data.decode(errors="replace").strip()
+
+    async def prompt(self, reader, writer, text):
+        """Show a prompt and return the player's answer, or None if gone."""
+        prompt = Fore.MAGENTA + text + Style.RESET_ALL if self.color else text
+        writer.write(prompt.encode())
+        await writer.drain()
+        return await self.read_line(reader)
+
+    async def play_session(self, reader, writer):
+        """Play one game over a connection; return False if it dropped."""
+        game_state = CompactGameState()
+        # A per-game seed makes the session reproducible from the log
+        seed = self.rng.getrandbits(64)
+        session = Session(game_state, random.Random(seed))
+        choices = []
+        await self.send_lines(writer, session.advance())
+        while not session.finished:
+            choice = await self.prompt(reader, writer, session.scene.prompt)
+            if choice is None:
+                return False
+            started = time.perf_counter()
+            try:
+                lines = session.advance(choice)
+                choices.append(choice)
+            except ValueError as exc:
+                lines = [("RED", str(exc))]
+            await self.send_lines(writer, lines, started)
+        if self.log is not None:
+            self.log.write(seed, choices, game_state, session.won)
+
+        summary = [(
+            "YELLOW",
+            f"🎮 Game Over! You {'won 🎉' if session.won else 'lost 😢'}. "
+            f"Your score: {game_state.score}, "
+            f"Turns taken: {game_state.turns}"
+        )]
+        if self.leaderboard is not None:
+            if self.leaderboard.count:
+                percentile = self.leaderboard.percentile_rank(game_state.score)
+                summary.append((
+                    "CYAN",
+                    f"🏆 Your score beats {percentile:.0f}% of recorded games."
+                ))
+            self.leaderboard.record("guest", game_state.score)
+        if game_state.inventory.items:
+            summary.append(("CYAN", "Inventory:"))
+            for item, quantity in game_state.inventory.items.items():
+                summary.append(("CYAN", f"- {item}: {quantity}"))
+        if game_state.achievements:
+            summary.append(("YELLOW", "Achievements:"))
+            for achievement in sorted(game_state.achievements):
+                summary.append(("YELLOW", f"- {achievement}"))
+        await self.send_lines(writer, summary)
+        return True
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection: play games until the player stops."""
+        self.active_sessions += 1
+        self.total_sessions += 1
+        try:
+            await self.send_lines(
+                writer, [("YELLOW", "Welcome to Epic Adventure Quest! 🎮")]
+            )
+            while await self.play_session(reader, writer):
+                answer = await self.prompt(
+                    reader, writer, "Play again? (yes/no): "
+                )
+                if answer is None or answer.lower() != "yes":
+                    await self.send_lines(writer, [(
+                        "YELLOW",
+                        "Thanks for playing! Come back for another "
+                        "adventure! 👋"
+                    )])
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def report_stats(self, interval):
+        """Periodically print session counts and choice latency to stderr."""
+        while True:
+            await asyncio.sleep(interval)
+            print(
+                f"sessions active={self.active_sessions} "
+                f"total={self.total_sessions} "
+                f"latency p50={self.latency.percentile(50) * 1000:.2f}ms "
+                f"p99={self.latency.percentile(99) * 1000:.2f}ms",
+                file=sys.stderr
+            )
+
+
+async def snapshot_leaderboard(leaderboard, filename, interval):
+    """Periodically write the leaderboard to disk."""
+    while True:
+        await asyncio.sleep(interval)
+        leaderboard.snapshot(filename)
+
+
+async def serve(game_server, host="127.0.0.1", port=8765, unix_path=None,
+                stats_interval=0, backlog=1024, leaderboard_path=None,
+                snapshot_interval=60.0):
+    """Run a GameServer until cancelled.
+
+    Args:
+        game_server (GameServer): The server holding the session logic.
+        host (str): TCP host to bind. Defaults to "127.0.0.1".
+        port (int): TCP port to bind. Defaults to 8765.
+        unix_path (str): Bind a Unix socket at this path instead of TCP.
+        stats_interval (float): Seconds between stats reports; 0 disables.
+        backlog (int): Pending-connection queue size, sized for bursts of
+                       thousands of players connecting at once.
+        leaderboard_path (str): Snapshot the server's leaderboard to this
+                                file every snapshot_interval seconds.
+        snapshot_interval (float): Seconds between leaderboard snapshots.
+    """
+    if unix_path:
+        server = await asyncio.start_unix_server(
+            game_server.handle_client, path=unix_path, backlog=backlog
+        )
+    else:
+        server = await asyncio.start_server(
+            game_server.handle_client, host, port, backlog=backlog
+        )
+    # Keep the background tasks so they can be cancelled on shutdown
+    tasks = []
+    if stats_interval:
+        tasks.append(asyncio.ensure_future(
+            game_server.report_stats(stats_interval)
+        ))
+    if leaderboard_path and game_server.leaderboard is not None:
+        tasks.append(asyncio.ensure_future(snapshot_leaderboard(
+            game_server.leaderboard, leaderboard_path, snapshot_interval
+        )))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    """Start the game server from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Serve Arcane Echoes to many players at once."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", default=None)
+    parser.add_argument(
+        "--delay", type=float, default=0.5,
+        help="seconds between lines of story text"
+    )
+    parser.add_argument("--idle-timeout", type=float, default=300.0)
+    parser.add_argument("--no-color", action="store_true")
+    parser.add_argument("--stats-interval", type=float, default=0)
+    parser.add_argument(
+        "--leaderboard", metavar="PATH", default="leaderboard.json",
+        help="file the leaderboard is restored from and snapshotted to"
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", default=None,
+        help="append each game's seed and choices to this log for replay.py"
+    )
+    args = parser.parse_args()
+
+    leaderboard = Leaderboard.restore(args.leaderboard) or Leaderboard()
+    game_server = GameServer(
+        delay=args.delay,
+        color=not args.no_color,
+        idle_timeout=args.idle_timeout,
+        leaderboard=leaderboard,
+        log=SessionLog(args.record) if args.record else None
+    )
+    try:
+        asyncio.run(serve(
+            game_server, args.host, args.port, args.unix, args.stats_interval,
+            leaderboard_path=args.leaderboard
+        ))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        leaderboard.snapshot(args.leaderboard)
+        if game_server.log is not None:
+            game_server.log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Compact per-game logs of the RNG seed and the choices made, so any
+#          recorded game can be replayed exactly.
+
+# Standard library imports
+import json
+import secrets
+
+
+def new_seed():
+    """Return a fresh 64-bit seed for one game's random.Random."""
+    return secrets.randbits(64)
+
+
+class RecordingPolicy:
+    """Wraps a play() policy and remembers every choice it makes."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.choices = []
+
+    def __call__(self, scene_name, options):
+        choice = self.policy(scene_name, options)
+        self.choices.append(choice)
+        return choice
+
+
+def make_record(seed, choices, game_state, won, score=0, turns=0,
+                max_turns=10, world_seed=None):
+    """Build the log record for one finished game.
+
+    Choices are stored as one string when every option is a single
+    character, which holds for the whole scene graph and world mode's
+    moves, and the starting score and turns are only stored when the game
+    did not start fresh.
+
+    Args:
+        seed (int): The seed of the game's random.Random.
+        choices (list): The options chosen, in order.
+        game_state (GameState): The state after the game.
+        won (bool): Whether the game was won.
+        score (int): The score the game started with.
+        turns (int): The turns taken before the game started.
+        max_turns (int): The game's turn limit.
+        world_seed (int): The world's seed, for a world-mode game.
+
+    Returns:
+        dict: The JSON-serializable record.
+    """
+    record = {"seed": seed}
+    if world_seed is not None:
+        record["world"] = world_seed
+    if score or turns or max_turns != 10:
+        record["start"] = [score, turns, max_turns]
+    if all(len(choice) == 1 for choice in choices):
+        record["choices"] = "".join(choices)
+    else:
+        record["choices"] = list(choices)
+    record["won"] = bool(won)
+    record["score"] = game_state.score
+    record["turns"] = game_state.turns
+    record["achievements"] = sorted(game_state.achievements)
+    return record
+
+
+class SessionLog:
+    """Appends one JSON line per finished game to a log file."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, "a")
+
+    def write(self, seed, choices, game_state, won, score=0, turns=0,
+              max_turns=10, world_seed=None):
+        """Record a finished game; see make_record for the arguments."""
+        record = make_record(
+            seed, choices, game_state, won, score, turns, max_turns,
+            world_seed
+        )
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def close(self):
+        """Close the log file."""
+        self._file.close()
+
+
+def read_log(filename):
+    """Yield (line_number, record) for every record in a log file."""
+    with open(filename, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                yield line_number, json.loads(line)
@@ -0,0 +1,268 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Headless batch simulation of Arcane Echoes for balancing encounter
+#          scores, with no rendering, prompts, or pacing delays.
+
+# Standard library imports
+import argparse
+import os
+import random
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# Local imports
+from achievements import ENGINE
+from gamestate import GameState
+from scenes import GRAPH, play
+
+
+# Structured outcome of a single headless playthrough
+GameResult = namedtuple(
+    "GameResult", ["won", "score", "turns", "achievements", "inventory"]
+)
+
+# Decision points a policy may be asked about, with their valid options
+SCENE_OPTIONS = {scene.name: scene.keys for scene in GRAPH.by_id if scene.keys}
+
+
+class RandomPolicy:
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def __call__(self, scene, options):
+        return options[int(self.rng.random() * len(options))]
+
+
+class FixedPolicy:
+    def __init__(self, choices, default="1"):
+        self.choices = dict(choices)
+        self.default = default
+
+    def __call__(self, scene, options):
+        return self.choices.get(scene, self.default)
+
+
+def play_headless(policy, rng=random, score=0, turns=0, max_turns=10):
+    """Play one game of Arcane Echoes with no I/O or sleeping.
+
+    Walks the same scene graph as play_game in game.py, but without a render
+    callback, so no text is formatted, printed, or paced.
+
+    Args:
+        policy (callable): Called as policy(scene, options) and must return one
+                           of the option strings (e.g. "1").
+        rng (random.Random): Source of the random encounter outcomes. Defaults
+                             to the global random module.
+        score (int): The player's starting score. Defaults to 0.
+        turns (int): The starting number of turns taken. Defaults to 0.
+        max_turns (int): The maximum number of turns allowed. Defaults to 10.
+
+    Returns:
+        GameResult: The outcome, final score and turns, achievements earned
+                    (frozenset) and inventory items (dict).
+    """
+    game_state = GameState()
+    game_state.score = score
+    game_state.turns = turns
+    game_state.max_turns = max_turns
+    won = play(game_state, policy, rng)
+    return GameResult(
+        won,
+        game_state.score,
+        game_state.turns,
+        frozenset(game_state.achievements),
+        game_state.inventory.items
+    )
+
+
+def run_batch(games, policy=None, rng=None, max_turns=10):
+    """Play a batch of headless games and aggregate the results.
+
+    Args:
+        games (int): Number of games to play.
+        policy (callable): Choice policy; defaults to a RandomPolicy sharing
+                           the batch's rng.
+        rng (random.Random): Random generator for the batch. Defaults to a new
+                             unseeded random.Random.
+        max_turns (int): The maximum number of turns allowed per game.
+
+    Returns:
+        dict: Keys "games", "wins", "total_score", "scores" (Counter of final
+              scores), "turns" (Counter of turns taken) and "achievements"
+              (Counter of achievement names).
+    """
+    rng = rng or random.Random()
+    policy = policy or RandomPolicy(rng)
+    wins = 0
+    total_score = 0
+    scores = Counter()
+    turns = Counter()
+    # Games are tallied by achievement bitset and expanded to names once
+    masks = Counter()
+    for _ in range(games):
+        game_state = GameState()
+        game_state.max_turns = max_turns
+        won = play(game_state, policy, rng)
+        wins += won
+        total_score += game_state.score
+        scores[game_state.score] += 1
+        turns[game_state.turns] += 1
+        masks[game_state.achievements.mask] += 1
+    return {
+        "games": games,
+        "wins": wins,
+        "total_score": total_score,
+        "scores": scores,
+        "turns": turns,
+        "achievements": ENGINE.counts(masks),
+    }
+
+
+def batch_seeds(games, master_seed, batch_size):
+    """Split a run into batches, each with its own seed from a master seed.
+
+    Seeds are drawn in batch order from a generator seeded with master_seed,
+    so the stream each batch sees depends only on the master seed and the
+    batch size, never on how many workers share the work.
+
+    Args:
+        games (int): Total number of games in the run.
+        master_seed (int): Seed every batch seed is derived from.
+        batch_size (int): Maximum number of games per batch.
+
+    Returns:
+        list: (games_in_batch, batch_seed) tuples.
+    """
+    seeder = random.Random(master_seed)
+    batches = []
+    remaining = games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        batches.append((size, seeder.getrandbits(64)))
+        remaining -= size
+    return batches
+
+
+def _run_seeded_batch(args):
+    """Process-pool worker: play one batch on its own seeded RNG stream."""
+    games, seed, policy, max_turns = args
+    return run_batch(games, policy, random.Random(seed), max_turns)
+
+
+def merge_stats(results):
+    """Merge run_batch results into a single aggregate.
+
+    Args:
+        results (iterable): Dicts as returned by run_batch.
+
+    Returns:
+        dict: Totals and merged histograms in the run_batch format.
+    """
+    merged = {
+        "games": 0,
+        "wins": 0,
+        "total_score": 0,
+        "scores": Counter(),
+        "turns": Counter(),
+        "achievements": Counter(),
+    }
+    for stats in results:
+        merged["games"] += stats["games"]
+        merged["wins"] += stats["wins"]
+        merged["total_score"] += stats["total_score"]
+        merged["scores"].update(stats["scores"])
+        merged["turns"].update(stats["turns"])
+        merged["achievements"].update(stats["achievements"])
+    return merged
+
+
+def run_parallel(games, master_seed=None, workers=None, batch_size=50000,
+                 policy=None, max_turns=10):
+    """Play games across a process pool and merge the histograms.
+
+    Each batch runs on a random.Random seeded from the master seed, so the
+    merged result is identical for a given master seed and batch size no
+    matter how many workers are used.
+
+    Args:
+        games (int): Total number of games to play.
+        master_seed (int): Seed for the whole run. Defaults to a fresh random
+                           seed, which is reported back in the result.
+        workers (int): Number of worker processes. Defaults to os.cpu_count().
+        batch_size (int): Games per batch. Defaults to 50000.
+        policy (callable): A picklable choice policy (e.g. FixedPolicy).
+                           Defaults to choosing uniformly at random from each
+                           batch's own RNG stream.
+        max_turns (int): The maximum number of turns allowed per game.
+
+    Returns:
+        dict: Merged totals and histograms in the run_batch format, plus
+              "master_seed".
+    """
+    if master_seed is None:
+        master_seed = random.SystemRandom().getrandbits(64)
+    workers = workers or os.cpu_count() or 1
+    jobs = [
+        (size, seed, policy, max_turns)
+        for size, seed in batch_seeds(games, master_seed, batch_size)
+    ]
+    if workers == 1:
+        results = map(_run_seeded_batch, jobs)
+        merged = merge_stats(results)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            merged = merge_stats(executor.map(_run_seeded_batch, jobs))
+    merged["master_seed"] = master_seed
+    return merged
+
+
+def main():
+    """Run a headless batch from the command line and print a summary."""
+    parser = argparse.ArgumentParser(
+        description="Run headless Arcane Echoes playthroughs."
+    )
+    parser.add_argument("-n", "--games", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="worker processes; 0 uses every CPU core"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = run_parallel(args.games, args.seed, args.workers or None)
+    elapsed = time.perf_counter() - start
+
+    print(f"Games: {stats['games']} (seed {stats['master_seed']})")
+    if stats["games"]:
+        print(f"Win rate: {stats['wins'] / stats['games']:.4f}")
+        print(f"Mean score: {stats['total_score'] / stats['games']:.2f}")
+    for name, count in stats["achievements"].most_common():
+        print(f"- {name}: {count}")
+    print(
+        f"Elapsed: {elapsed:.3f}s "
+        f"({stats['games'] / max(elapsed, 1e-9):,.0f} games/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
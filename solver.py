@@ -0,0 +1,192 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Exact expected-score and win-probability solver for the scene graph,
+#          producing a per-decision value table and the optimal policy.
+
+# Standard library imports
+import argparse
+import time
+
+# Local imports
+from scenes import GRAPH
+
+
+OBJECTIVES = ("score", "win")
+
+
+class Solution:
+    def __init__(self, graph, max_turns, objective):
+        self.graph = graph
+        self.max_turns = max_turns
+        self.objective = objective
+        # (scene_name, turns) -> {option: (expected_score, win_probability)}
+        self.values = {}
+        # (scene_name, turns) -> best option
+        self.policy = {}
+
+    def value(self, turns=0):
+        """Return (expected_score, win_probability) of a game played optimally.
+
+        Args:
+            turns (int): Turns already taken when the game starts.
+
+        Returns:
+            tuple: (expected_score, win_probability), where expected_score is
+                   the expected change in score from this point on.
+        """
+        return _scene_value(self, self.graph.start, turns, {})
+
+    def policy_for(self, game_state):
+        """Build a play() policy that follows the optimal table for a state.
+
+        The returned callable reads game_state.turns at each prompt, so it
+        stays correct for games resumed from a save part-way through.
+
+        Args:
+            game_state (GameState): The state the policy will be played on.
+
+        Returns:
+            callable: A policy(scene_name, options) function.
+        """
+        policy = self.policy
+
+        def choose(scene_name, options):
+            return policy[(scene_name, game_state.turns)]
+
+        return choose
+
+
+def _better(candidate, best, objective):
+    """Compare two (expected_score, win_probability) pairs for an objective."""
+    if objective == "win":
+        return (candidate[1], candidate[0]) > (best[1], best[0])
+    return candidate > best
+
+
+def _outcomes_value(solution, outcomes, turns, memo):
+    """Expected (score, win) over a weighted list of outcomes."""
+    expected = 0.0
+    win = 0.0
+    for outcome in outcomes:
+        if outcome.next is None:
+            future = (0.0, 1.0 if outcome.won else 0.0)
+        else:
+            future = _scene_value(solution, outcome.next, turns, memo)
+        expected += outcome.probability * (outcome.score + future[0])
+        win += outcome.probability * future[1]
+    return expected, win
+
+
+def _scene_value(solution, scene, turns, memo):
+    """Memoized optimal (score, win) value of entering a scene."""
+    key = (scene.id, turns)
+    if key in memo:
+        return memo[key]
+
+    if scene.tick:
+        turns += 1
+        if turns >= solution.max_turns:
+            memo[key] = (0.0, 0.0)
+            return memo[key]
+
+    if not scene.keys:
+        result = _outcomes_value(solution, scene.choices[None], turns, memo)
+    else:
+        options = {}
+        best_option = None
+        result = None
+        for option in scene.keys:
+            options[option] = _outcomes_value(
+                solution, scene.choices[option], turns, memo
+            )
+            if result is None or _better(
+                options[option], result, solution.objective
+            ):
+                best_option = option
+                result = options[option]
+        solution.values[(scene.name, turns)] = options
+        solution.policy[(scene.name, turns)] = best_option
+
+    memo[key] = result
+    return result
+
+
+def solve(graph=GRAPH, max_turns=10, objective="score"):
+    """Solve the whole game tree exactly by memoized dynamic programming.
+
+    Every prompting scene is evaluated at every turn count from 0 up to
+    max_turns, so the table covers games resumed from a save as well as fresh
+    ones. Because score deltas are additive and outcome probabilities are
+    fixed, a decision's value depends only on the scene and the turns taken.
+
+    Args:
+        graph (SceneGraph): The compiled scene graph. Defaults to GRAPH.
+        max_turns (int): The maximum number of turns allowed. Defaults to 10.
+        objective (str): "score" to maximize expected score (ties broken by
+                         win probability) or "win" to maximize win
+                         probability (ties broken by expected score).
+
+    Returns:
+        Solution: The per-decision value table and optimal policy.
+
+    Raises:
+        ValueError: If objective is not one of OBJECTIVES.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(
+            f"Unknown objective '{objective}'; expected one of {OBJECTIVES}"
+        )
+    solution = Solution(graph, max_turns, objective)
+    memo = {}
+    for scene in graph.by_id:
+        for turns in range(max_turns + 1):
+            _scene_value(solution, scene, turns, memo)
+    return solution
+
+
+def main():
+    """Solve the game from the command line and print the decision table."""
+    parser = argparse.ArgumentParser(
+        description="Compute exact expected scores and the optimal policy."
+    )
+    parser.add_argument("--max-turns", type=int, default=10)
+    parser.add_argument("--objective", choices=OBJECTIVES, default="score")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    solution = solve(max_turns=args.max_turns, objective=args.objective)
+    elapsed = time.perf_counter() - start
+
+    expected, win = solution.value()
+    print(f"Optimal game: expected score {expected:.2f}, win rate {win:.4f}")
+    for (scene_name, turns), options in sorted(solution.values.items()):
+        best = solution.policy[(scene_name, turns)]
+        cells = ", ".join(
+            f"{option}{'*' if option == best else ''}: "
+            f"{ev:+.2f} / {p:.3f}"
+            for option, (ev, p) in options.items()
+        )
+        print(f"{scene_name:<10} turns={turns:<2} {cells}")
+    print(f"Solved in {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Buffered telemetry: gameplay events are queued in memory and
+#          batch-written by a background thread as JSONL or binary records,
+#          with size/time-based file rotation.
+
+# Standard library imports
+import functools
+import json
+import os
+import queue
+import struct
+import threading
+import time
+
+# Local imports
+from scenes import GRAPH
+
+
+MAGIC = b"AETL"
+VERSION = 2
+
+# Version 1 files tagged results with the function that returned them
+# instead of a scene; the index is the ID their binary records store
+LEGACY_SOURCES = (
+    "play_game",
+    "handle_riddle",
+    "handle_squirrel_encounter",
+    "handle_monster_encounter",
+    "handle_final_path",
+    "handle_treasure_vault",
+    "handle_ghostly_encounter",
+)
+
+# Functions whose results are recorded: (won, score, turns) for a game,
+# (won, score) for a single encounter
+RESULT_FUNCTIONS = ("play_game", "run_encounter", "play_world")
+
+# Scene ID stored when a result has no scene: it timed out on entry, or a
+# world-mode game lasted until nightfall
+NO_SCENE = 255
+
+# Binary records: a type byte, then a fixed layout per type.
+# outcome: time, scene ID, choice (0 for automatic scenes), index of the
+#          alternative drawn, score change
+# result:  time, ID of the scene the game or encounter ended in, won,
+#          score, turns (0 for a single encounter)
+OUTCOME = 1
+RESULT = 2
+RECORDS = {
+    OUTCOME: struct.Struct("<dBBBh"),
+    RESULT: struct.Struct("<dB?iH"),
+}
+FILE_HEADER = struct.Struct("<4sB")
+
+
+class EventStream:
+    """Queues events in memory and writes them in batches on a thread.
+
+    emit() only appends a tuple to a bounded queue, so the game never waits
+    on disk. When the queue is full, events are dropped and counted
+    (on_full="drop", which keeps gameplay latency flat) or the game waits
+    for room (on_full="block", which never loses events).
+
+    The active file is rotated once it reaches rotate_bytes or has been
+    open for rotate_seconds: it is renamed to "<filename>.<n>" and a new
+    file started.
+    """
+
+    def __init__(self, filename, fmt="jsonl", max_queue=65536,
+                 batch_size=1024, flush_interval=1.0,
+                 rotate_bytes=64 * 1024 * 1024, rotate_seconds=None,
+                 on_full="drop"):
+        if fmt not in ("jsonl", "binary"):
+            raise ValueError(f"Unknown telemetry format: {fmt}")
+        self.filename = filename
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.block = on_full == "block"
+        self.dropped = 0
+        self.written = 0
+        self.rotations = 0
+        self._queue = queue.Queue(max_queue)
+        # Scene the current game ends in if it stops now, from the trace
+        self._scene = None
+        self._file = None
+        self._opened = 0.0
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def emit(self, event):
+        """Queue one event tuple: (type, time, *fields)."""
+        try:
+            self._queue.put(event, self.block)
+        except queue.Full:
+            self.dropped += 1
+
+    def outcome(self, scene, choice, outcome, seconds):
+        """Interpreter trace callback: queue an outcome event.
+
+        Also notes where the game stands, so the next result is tagged with
+        the scene it ended in: this one if the outcome ends the game, else
+        the next one, where it would end if it ran out of turns.
+        """
+        self._scene = scene if outcome.next is None else outcome.next
+        self.emit((
+            OUTCOME, time.time(), scene.id, choice,
+            scene.choices[choice].index(outcome), outcome.score
+        ))
+
+    def clear_scene(self):
+        """Forget the scene seen last, so the next result is untagged.
+
+        For games that end outside the scene graph, such as a world game
+        won at nightfall out in the forest.
+        """
+        self._scene = None
+
+    def result(self, won, score, turns):
+        """Queue the result of a game or encounter, tagged with the scene
+        the interpreter last saw it end in."""
+        scene, self._scene = self._scene, None
+        self.emit((
+            RESULT, time.time(), None if scene is None else scene.id, won,
+            score, turns
+        ))
+
+    def close(self):
+        """Write everything still queued and close the file."""
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_loop(self):
+        """Background thread: batch queued events into the file."""
+        while True:
+            try:
+                event = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._maybe_rotate()
+                continue
+            batch = []
+            while event is not None:
+                batch.append(event)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+            if event is None:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _open(self):
+        self._file = open(self.filename, "ab")
+        self._opened = time.monotonic()
+        if self.fmt == "binary" and self._file.tell() == 0:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+    def _maybe_rotate(self):
+        if self._file is None:
+            return
+        too_big = self._file.tell() >= self.rotate_bytes
+        too_old = (
+            self.rotate_seconds is not None
+            and time.monotonic() - self._opened >= self.rotate_seconds
+        )
+        if too_big or too_old:
+            self._file.close()
+            self._file = None
+            self.rotations += 1
+            os.replace(self.filename, _rotated_name(self.filename))
+
+    def _write_batch(self, batch):
+        if self._file is None:
+            self._open()
+        encode = _encode_binary if self.fmt == "binary" else _encode_json
+        self._file.write(b"".join(encode(event) for event in batch))
+        self._file.flush()
+        self.written += len(batch)
+        self._maybe_rotate()
+
+
+def _rotated_name(filename):
+    """Return the first unused "<filename>.<n>" name."""
+    number = 1
+    while os.path.exists(f"{filename}.{number}"):
+        number += 1
+    return f"{filename}.{number}"
+
+
+def _encode_json(event):
+    if event[0] == OUTCOME:
+        _, timestamp, scene_id, choice, index, score = event
+        record = {
+            "type": "outcome", "t": timestamp,
+            "scene": GRAPH.by_id[scene_id].name, "choice": choice,
+            "outcome": index, "score": score,
+        }
+    else:
+        _, timestamp, scene_id, won, score, turns = event
+        record = {
+            "type": "result", "t": timestamp,
+            "scene": None if scene_id is None else GRAPH.by_id[scene_id].name,
+            "won": bool(won), "score": score, "turns": turns,
+        }
+    return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+
+def _encode_binary(event):
+    if event[0] == OUTCOME:
+        _, timestamp, scene_id, choice, index, score = event
+        return bytes((OUTCOME,)) + RECORDS[OUTCOME].pack(
+            timestamp, scene_id, int(choice) if choice else 0, index, score
+        )
+    _, timestamp, scene_id, won, score, turns = event
+    return bytes((RESULT,)) + RECORDS[RESULT].pack(
+        timestamp, NO_SCENE if scene_id is None else scene_id, bool(won),
+        score, turns
+    )
+
+
+def iter_binary(data, offset=FILE_HEADER.size, end=None):
+    """Yield raw (kind, *fields) tuples from binary telemetry data.
+
+    Works on bytes or an mmap. A record cut short by a crash mid-write ends
+    the iteration.
+
+    Args:
+        data (bytes): The file contents, header included.
+        offset (int): Where the first record starts. Defaults to just after
+                      the header.
+        end (int): Where to stop. Defaults to the end of the data.
+    """
+    end = len(data) if end is None else end
+    outcome_size = RECORDS[OUTCOME].size
+    result_size = RECORDS[RESULT].size
+    unpack_outcome = RECORDS[OUTCOME].unpack_from
+    unpack_result = RECORDS[RESULT].unpack_from
+    while offset < end:
+        kind = data[offset]
+        if kind == OUTCOME:
+            if offset + 1 + outcome_size > end:
+                return
+            yield (OUTCOME,) + unpack_outcome(data, offset + 1)
+            offset += 1 + outcome_size
+        else:
+            if offset + 1 + result_size > end:
+                return
+            yield (RESULT,) + unpack_result(data, offset + 1)
+            offset += 1 + result_size
+
+
+def check_header(data):
+    """Check that data starts with a supported binary header.
+
+    Returns:
+        int: The file's format version.
+
+    Raises:
+        ValueError: If the header is missing or newer than this code.
+    """
+    magic, version = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC or version > VERSION:
+        raise ValueError("Not a supported binary telemetry file")
+    return version
+
+
+def result_tag(version, tag_id):
+    """Return the field name and value a binary result record is tagged
+    with: its scene, or for version 1 files the function it came from."""
+    if version == 1:
+        return "source", LEGACY_SOURCES[tag_id]
+    if tag_id == NO_SCENE:
+        return "scene", None
+    return "scene", GRAPH.by_id[tag_id].name
+
+
+def decode_binary(data):
+    """Yield events from the contents of a binary telemetry file as dicts.
+
+    Raises:
+        ValueError: If the data does not start with the telemetry header.
+    """
+    version = check_header(data)
+    for kind, *fields in iter_binary(data):
+        if kind == OUTCOME:
+            timestamp, scene_id, choice, index, score = fields
+            yield {
+                "type": "outcome", "t": timestamp,
+                "scene": GRAPH.by_id[scene_id].name,
+                "choice": str(choice) if choice else None,
+                "outcome": index, "score": score,
+            }
+        else:
+            timestamp, tag_id, won, score, turns = fields
+            field, tag = result_tag(version, tag_id)
+            yield {
+                "type": "result", "t": timestamp, field: tag,
+                "won": won, "score": score, "turns": turns,
+            }
+
+
+def read_events(filename):
+    """Yield the events in a telemetry file of either format as dicts."""
+    with open(filename, "rb") as f:
+        data = f.read()
+    if data.startswith(MAGIC):
+        yield from decode_binary(data)
+        return
+    for line in data.splitlines():
+        if line:
+            yield json.loads(line)
+
+
+def install(stream, game_module):
+    """Send the game's outcomes and results to an EventStream.
+
+    Registers stream.outcome as an interpreter observer, and wraps
+    play_game, run_encounter (which every handle_* encounter goes through)
+    and play_world to queue their results, tagged with the scene each
+    ended in.
+
+    Args:
+        stream (EventStream): Where events go.
+        game_module (module): The game module to instrument.
+
+    Returns:
+        callable: Removes the instrumentation again.
+    """
+    originals = {
+        name: getattr(game_module, name) for name in RESULT_FUNCTIONS
+    }
+
+    def recorded(name, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            returned = function(*args, **kwargs)
+            if len(returned) == 3:
+                won, score, turns = returned
+            else:
+                (won, score), turns = returned, 0
+            if won and name == "play_world":
+                # Won at nightfall, out in the forest rather than a scene
+                stream.clear_scene()
+            stream.result(won, score, turns)
+            return returned
+
+        return wrapper
+
+    for name, function in originals.items():
+        setattr(game_module, name, recorded(name, function))
+    game_module.observers.append(stream.outcome)
+
+    def uninstall():
+        for name, function in originals.items():
+            setattr(game_module, name, function)
+        game_module.observers.remove(stream.outcome)
+
+    return uninstall
@@ -0,0 +1,74 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for achievement bitsets: every holder of
+#          achievements shares the achievement engine's bit table.
+
+# Standard library imports
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from achievements import ENGINE, RULES, AchievementSet  # noqa: E402
+from compact import CompactGameState  # noqa: E402
+from gamestate import GameState  # noqa: E402
+from vectorized import GraphArrays  # noqa: E402
+
+
+class BitTableTest(unittest.TestCase):
+    def test_game_states_share_engine_bits(self):
+        names = ["Monster Slayer", "Riddle Master"]
+        game_state = GameState()
+        compact_state = CompactGameState()
+        for name in names:
+            game_state.achievements.add(name)
+            compact_state.achievements.add(name)
+        self.assertEqual(game_state.achievements.mask, ENGINE.mask(names))
+        self.assertEqual(compact_state.achievement_mask, ENGINE.mask(names))
+
+    def test_unknown_names_are_rejected(self):
+        names = ENGINE.names
+        with self.assertRaises(ValueError):
+            AchievementSet(["Found a Save Bonus"])
+        with self.assertRaises(ValueError):
+            CompactGameState().achievements = ["Found a Save Bonus"]
+        self.assertNotIn("Found a Save Bonus", GameState().achievements)
+        self.assertEqual(ENGINE.names, names)
+
+    def test_bits_follow_the_rule_table(self):
+        """Bits depend on RULES alone, never on what a process saw first."""
+        self.assertEqual(
+            ENGINE.names,
+            tuple(dict.fromkeys(rule.achievement for rule in RULES))
+        )
+        for index, name in enumerate(ENGINE.names):
+            self.assertEqual(ENGINE.bit(name), 1 << index)
+
+    def test_vectorized_bits_match_engine(self):
+        arrays = GraphArrays()
+        for name, bit in arrays.achievement_bits.items():
+            self.assertEqual(bit, ENGINE.bits[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
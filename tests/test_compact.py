@@ -0,0 +1,78 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for the compact game state: it must load any save
+#          GameState can write, and its views must write through.
+
+# Standard library imports
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from compact import CompactGameState  # noqa: E402
+from gamestate import GameState  # noqa: E402
+
+
+class CompactGameStateTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "save_game.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_loads_saves_with_extra_stats(self):
+        game_state = GameState()
+        game_state.character_stats["stamina"] = 7
+        game_state.inventory.add_item("sword")
+        game_state.achievements.add("Riddle Master")
+        for binary in (False, True):
+            game_state.save(self.filename, binary=binary)
+            loaded = CompactGameState.load(self.filename)
+            self.assertEqual(
+                dict(loaded.character_stats), game_state.character_stats
+            )
+            self.assertEqual(dict(loaded.inventory.items), {"sword": 1})
+            self.assertEqual(set(loaded.achievements), {"Riddle Master"})
+            # And back again: GameState reads the compact state's save
+            loaded.save(self.filename, binary=binary)
+            self.assertEqual(
+                GameState.load(self.filename).character_stats,
+                game_state.character_stats
+            )
+
+    def test_inventory_items_is_live(self):
+        game_state = CompactGameState()
+        game_state.inventory.items["potion"] = 2
+        self.assertEqual(game_state.inventory.items["potion"], 2)
+        self.assertTrue(game_state.inventory.has_item("potion"))
+        del game_state.inventory.items["potion"]
+        self.assertFalse(game_state.inventory.has_item("potion"))
+        game_state.inventory.items = {"gem": 3}
+        game_state.inventory.items = game_state.inventory.items
+        self.assertEqual(dict(game_state.inventory.items), {"gem": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for driver mode: everything main() opens is
+#          closed and written out however the session ends.
+
+# Standard library imports
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Local imports
+import game  # noqa: E402
+from pacing import Pacer  # noqa: E402
+
+
+class TeardownTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.script = self.path("script.txt")
+        with open(self.script, "w") as f:
+            f.write("1\n3\n")
+        self.pacer = game.pacer
+        game.pacer = Pacer()
+
+    def tearDown(self):
+        game.pacer = self.pacer
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def main(self, *extra):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.main([
+                "--script", self.script, "--seed", "1",
+                "--record", self.path("games.log"),
+                "--leaderboard", self.path("leaderboard.json"),
+                "--metrics", self.path("metrics.json"),
+                "--telemetry", self.path("events.jsonl"),
+                *extra
+            ])
+        return output.getvalue()
+
+    def test_crash_still_tears_everything_down(self):
+        """A non-EOF exception closes and writes out every resource."""
+        output, input_stream = game.pacer.output, game.pacer.input_stream
+        seen = {}
+
+        def crash(**options):
+            seen["output"] = game.pacer.output
+            seen["input"] = game.pacer.input_stream
+            seen["log"] = options["log"]
+            raise RuntimeError("session crashed")
+
+        with mock.patch.object(game, "run_session", side_effect=crash):
+            with self.assertRaises(RuntimeError):
+                self.main()
+
+        self.assertTrue(seen["output"].closed)
+        self.assertTrue(seen["input"].closed)
+        self.assertTrue(seen["log"]._file.closed)
+        self.assertIs(game.pacer.output, output)
+        self.assertIs(game.pacer.input_stream, input_stream)
+        self.assertTrue(os.path.exists(self.path("leaderboard.json")))
+        self.assertTrue(os.path.exists(self.path("metrics.json")))
+        self.assertEqual(game.observers, [])
+
+    def test_games_are_flushed_at_exit(self):
+        """A normal run writes its games to the log and telemetry."""
+        results = self.main().splitlines()
+        self.assertEqual(len(results), 1)
+        with open(self.path("games.log")) as f:
+            self.assertEqual(len(f.readlines()), 1)
+        self.assertGreater(os.path.getsize(self.path("events.jsonl")), 0)
+        self.assertEqual(game.observers, [])
+
+
+
+class ScriptModuleTest(unittest.TestCase):
+    def test_running_game_py_never_imports_it_again(self):
+        """Every module shares __main__'s GameState, observers and pacer."""
+        with tempfile.TemporaryDirectory() as directory:
+            code = (
+                "import runpy, sys\n"
+                "sys.argv = ['game.py', '--script', '--save-db', "
+                f"{os.path.join(directory, 'saves.db')!r}, '--record', "
+                f"{os.path.join(directory, 'games.log')!r}]\n"
+                "runpy.run_path('game.py', run_name='__main__')\n"
+                "print('game' in sys.modules)\n"
+            )
+            finished = subprocess.run(
+                [sys.executable, "-c", code], cwd=ROOT, input="1\n3\n",
+                capture_output=True, text=True, check=True
+            )
+        self.assertEqual(finished.stdout.splitlines()[-1], "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for the monster's map: landmark files, route
+#          summaries and when the game routes it.
+
+# Standard library imports
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import game  # noqa: E402
+from forestmap import ForestMap, directions  # noqa: E402
+from pacing import Pacer  # noqa: E402
+
+
+class LandmarkFileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "landmarks.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_truncated_file_leaves_landmarks_unchanged(self):
+        forest_map = ForestMap(1, 32, 32)
+        forest_map.add_landmarks()
+        forest_map.save_landmarks(self.filename)
+        with open(self.filename, "r+b") as f:
+            f.truncate(os.path.getsize(self.filename) - 8)
+
+        fresh = ForestMap(1, 32, 32)
+        self.assertFalse(fresh.load_landmarks(self.filename))
+        self.assertEqual(fresh.landmarks, {})
+
+    def test_round_trip(self):
+        forest_map = ForestMap(1, 32, 32)
+        forest_map.add_landmarks()
+        forest_map.save_landmarks(self.filename)
+        fresh = ForestMap(1, 32, 32)
+        self.assertTrue(fresh.load_landmarks(self.filename))
+        self.assertEqual(fresh.landmarks, forest_map.landmarks)
+
+
+class DirectionsTest(unittest.TestCase):
+    def test_zigzag_merges_into_one_leg(self):
+        forest_map = ForestMap(1, 32, 32)
+        # Two steps east, one south, repeated: a staircase heading east
+        path = [forest_map.index(0, 0)]
+        x = y = 0
+        for _ in range(8):
+            for dx, dy in ((1, 0), (1, 0), (0, 1)):
+                x += dx
+                y += dy
+                path.append(forest_map.index(x, y))
+        self.assertEqual(directions(forest_map, path), [("east", 24)])
+        self.assertEqual(
+            directions(forest_map, path, stride=1),
+            [("east", 2), ("south", 1), ("east", 2)]
+        )
+
+
+
+class GameMapTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.saved = (
+            game.MAP_SIZE, game.map_landmarks, game.map_route_lines,
+            game.pacer
+        )
+
+    def tearDown(self):
+        (game.MAP_SIZE, game.map_landmarks, game.map_route_lines,
+         game.pacer) = self.saved
+        self.directory.cleanup()
+
+    def test_routes_reuse_saved_landmarks(self):
+        """The landmark tables are computed once, then loaded from disk."""
+        game.MAP_SIZE = 64
+        game.map_landmarks = os.path.join(self.directory.name, "map.bin")
+        game.map_route_lines = None
+        lines = game.load_map_routes()
+        self.assertTrue(os.path.exists(game.map_landmarks))
+
+        game.map_route_lines = None
+        with mock.patch.object(
+            ForestMap, "add_landmarks", side_effect=AssertionError
+        ):
+            self.assertEqual(game.load_map_routes(), lines)
+
+    def test_driver_mode_never_routes_the_map(self):
+        script = os.path.join(self.directory.name, "script.txt")
+        open(script, "w").close()
+        game.pacer = Pacer()
+        game.map_landmarks = None
+        game.main(["--script", script])
+        self.assertIsNone(game.map_landmarks)
+        self.assertNotIn(game.start_map_routes, game.observers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for leaderboard snapshots: the board is written on
+#          a timer rather than after every game.
+
+# Standard library imports
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from leaderboard import Leaderboard  # noqa: E402
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "leaderboard.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_snapshot_waits_for_interval(self):
+        leaderboard = Leaderboard()
+        leaderboard.record("ada", 10)
+        self.assertFalse(leaderboard.snapshot_if_due(self.filename, 60.0))
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_snapshot_when_due(self):
+        leaderboard = Leaderboard()
+        leaderboard.record("ada", 10)
+        self.assertTrue(leaderboard.snapshot_if_due(self.filename, 0.0))
+        restored = Leaderboard.restore(self.filename)
+        self.assertEqual(restored.top(), [("ada", 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for instrumentation: real games must record
+#          per-scene latency, not just counters.
+
+# Standard library imports
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import game  # noqa: E402
+from metrics import Metrics, install  # noqa: E402
+from pacing import Pacer  # noqa: E402
+
+
+class SceneTimingTest(unittest.TestCase):
+    def setUp(self):
+        self.pacer = game.pacer
+        game.pacer = Pacer(0, io.StringIO(), io.StringIO("1\n" * 20))
+        self.metrics = Metrics()
+        self.uninstall = install(self.metrics, game)
+
+    def tearDown(self):
+        self.uninstall()
+        game.pacer = self.pacer
+
+    def test_play_game_times_each_scene(self):
+        game.play_game(0, 0, 10, seed=1)
+        timed = {
+            dict(labels)["scene"]: histogram.count
+            for (name, labels), histogram in self.metrics.histograms.items()
+            if name == "scene_seconds"
+        }
+        visits = {
+            dict(labels)["scene"]: count
+            for (name, labels), count in self.metrics.counters.items()
+            if name == "scene_visits_total"
+        }
+        self.assertIn("start", timed)
+        self.assertEqual(timed, visits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Tests for the save file formats: binary round trips, truncated
+#          and unsupported files, and format detection on load.
+
+# Standard library imports
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from gamestate import GameState  # noqa: E402
+from savefile import (  # noqa: E402
+    HEADER_V1, MAGIC, NAME_ID_V1, decode, decode_binary, encode, is_binary,
+    read_save_data
+)
+
+
+def save_data(**changes):
+    """Return save data in the GameState.save layout, with changes."""
+    data = {
+        "score": 120,
+        "turns": 7,
+        "max_turns": 10,
+        "inventory": {"amulet": 2, "silver key": 1},
+        "achievements": ["Riddle Master", "Found a Secret Door"],
+        "character_stats": {
+            "health": 100, "strength": 10, "magic": 5, "luck": 5
+        },
+        "save_date": "2025-04-01T10:30:00",
+        "journal_seq": 3,
+    }
+    data.update(changes)
+    return data
+
+
+class BinaryRoundTripTest(unittest.TestCase):
+    def assertRoundTrips(self, data):
+        self.assertEqual(decode_binary(encode(data, binary=True)), data)
+
+    def test_interned_and_inline_names(self):
+        self.assertRoundTrips(save_data())
+
+    def test_empty_save(self):
+        self.assertRoundTrips(save_data(
+            inventory={}, achievements=[], character_stats={},
+            save_date=None, journal_seq=0
+        ))
+
+    def test_float_and_extra_stats(self):
+        stats = {"health": 97.5, "strength": 10, "charm": 3, "speed": 1.25}
+        decoded = decode_binary(
+            encode(save_data(character_stats=stats), binary=True)
+        )
+        self.assertEqual(decoded["character_stats"], stats)
+        self.assertIsInstance(decoded["character_stats"]["strength"], int)
+        self.assertIsInstance(decoded["character_stats"]["health"], float)
+
+    def test_long_and_unicode_names(self):
+        self.assertRoundTrips(save_data(
+            inventory={"a" * 1000: 1, "épée": 3},
+            achievements=["Über " * 100]
+        ))
+
+    def test_smaller_than_json(self):
+        data = save_data()
+        self.assertLess(
+            len(encode(data, binary=True)), len(encode(data, binary=False))
+        )
+
+
+class BinaryValidationTest(unittest.TestCase):
+    def test_unstorable_values_raise_value_error(self):
+        for data in (
+            save_data(character_stats={"health": "full"}),
+            save_data(character_stats={"health": None}),
+            save_data(inventory={"amulet": 1.5}),
+            save_data(score=2 ** 40),
+            save_data(turns=-1),
+            save_data(achievements=["Null\0Byte"]),
+        ):
+            with self.assertRaises(ValueError):
+                encode(data, binary=True)
+
+    def test_every_truncation_raises_value_error(self):
+        data = encode(save_data(), binary=True)
+        for length in range(len(data)):
+            with self.assertRaises(ValueError, msg=f"length {length}"):
+                decode_binary(data[:length])
+
+    def test_unknown_version_raises_value_error(self):
+        data = bytearray(encode(save_data(), binary=True))
+        for version in (0, 99):
+            data[len(MAGIC)] = version
+            with self.assertRaises(ValueError):
+                decode_binary(bytes(data))
+
+    def test_version_1_still_loads(self):
+        data = HEADER_V1.pack(
+            MAGIC, 1, 40, 2, 10, 0, 0.0, 90, 10, 5, 5, 1, 0, 0
+        ) + NAME_ID_V1.pack(0) + (3).to_bytes(4, "little")
+        self.assertEqual(decode_binary(data), {
+            "score": 40,
+            "turns": 2,
+            "max_turns": 10,
+            "inventory": {"amulet": 3},
+            "achievements": [],
+            "character_stats": {
+                "health": 90, "strength": 10, "magic": 5, "luck": 5
+            },
+            "save_date": None,
+            "journal_seq": 0,
+        })
+
+    def test_truncated_version_1_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            decode_binary(MAGIC + bytes([1]) + bytes(10))
+
+
+class DetectionTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "save_game.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_decode_detects_format(self):
+        data = save_data()
+        binary = encode(data, binary=True)
+        text = encode(data, binary=False)
+        self.assertTrue(is_binary(binary))
+        self.assertFalse(is_binary(text))
+        self.assertEqual(decode(binary), data)
+        self.assertEqual(decode(text), json.loads(text))
+
+    def test_load_reads_either_format(self):
+        game_state = GameState()
+        game_state.score = 75
+        game_state.inventory.add_item("amulet")
+        for binary in (False, True):
+            game_state.save(self.filename, binary)
+            with open(self.filename, "rb") as f:
+                self.assertEqual(is_binary(f.read()), binary)
+            self.assertEqual(read_save_data(self.filename)["score"], 75)
+            loaded = GameState.load(self.filename)
+            self.assertEqual(loaded.score, 75)
+            self.assertEqual(loaded.inventory.items, {"amulet": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
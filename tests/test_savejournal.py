@@ -0,0 +1,138 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for journaled saves: autosaves recorded after a
+#          full save must survive a reload.
+
+# Standard library imports
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import game  # noqa: E402
+from gamestate import GameState  # noqa: E402
+from pacing import Pacer  # noqa: E402
+from savejournal import SaveJournal, journal_path  # noqa: E402
+
+
+class SaveJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "save_game.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_records_after_save_survive_load(self):
+        """record -> save -> record -> load keeps the later records."""
+        game_state = GameState()
+        journal = SaveJournal(self.filename)
+        game_state.score = 1
+        journal.record(game_state)
+        game_state.save(self.filename)
+        game_state.score = 2
+        journal.record(game_state)
+        game_state.score = 3
+        game_state.inventory.add_item("amulet")
+        journal.record(game_state)
+        journal.close()
+
+        loaded = GameState.load(self.filename)
+        self.assertEqual(loaded.score, 3)
+        self.assertEqual(loaded.inventory.items, {"amulet": 1})
+
+    def test_record_after_save_is_not_a_stale_delta(self):
+        """A change undone by a save is recorded again afterwards."""
+        game_state = GameState()
+        journal = SaveJournal(self.filename)
+        game_state.inventory.add_item("amulet")
+        journal.record(game_state)
+        game_state.inventory.remove_item("amulet")
+        game_state.save(self.filename)
+        game_state.inventory.add_item("amulet")
+        journal.record(game_state)
+        journal.close()
+
+        loaded = GameState.load(self.filename)
+        self.assertEqual(loaded.inventory.items, {"amulet": 1})
+
+    def test_save_empties_journal_in_place(self):
+        """The journal file an open SaveJournal writes to stays the same."""
+        game_state = GameState()
+        journal = SaveJournal(self.filename)
+        journal.record(game_state)
+        inode = os.stat(journal_path(self.filename)).st_ino
+        game_state.save(self.filename)
+        self.assertEqual(os.path.getsize(journal_path(self.filename)), 0)
+        self.assertEqual(os.stat(journal_path(self.filename)).st_ino, inode)
+        journal.close()
+
+    def test_records_after_compaction_survive_load(self):
+        """Compaction through SaveJournal keeps recording afterwards."""
+        game_state = GameState()
+        journal = SaveJournal(self.filename, compact_every=2)
+        for score in range(1, 6):
+            game_state.score = score
+            journal.record(game_state)
+        journal.close()
+        self.assertEqual(GameState.load(self.filename).score, 5)
+
+
+
+class AutosaveTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "save_game.json")
+        self.script = os.path.join(self.directory.name, "script.txt")
+        self.pacer = game.pacer
+        game.pacer = Pacer()
+
+    def tearDown(self):
+        game.pacer = self.pacer
+        self.directory.cleanup()
+
+    def test_quit_without_saving_resumes_from_journal(self):
+        """--autosave keeps a game the player quit without saving."""
+        with open(self.script, "w") as f:
+            # Play one game, then quit from the menu without saving
+            f.write("1\n3\n")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.main([
+                "--script", self.script, "--seed", "1",
+                "--save", self.filename, "--autosave"
+            ])
+        result = json.loads(output.getvalue().splitlines()[0])
+
+        self.assertFalse(os.path.exists(self.filename))
+        loaded = GameState.load(self.filename)
+        self.assertEqual(loaded.score, result["score"])
+        self.assertEqual(loaded.turns, result["turns"])
+
+
+if __name__ == "__main__":
+    unittest.main()
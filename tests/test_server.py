@@ -0,0 +1,84 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for the line-based game server: answers sent
+#          ahead of their prompts still play the whole game.
+
+# Standard library imports
+import asyncio
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from compact import CompactGameState  # noqa: E402
+from scenes import Session  # noqa: E402
+from server import GameServer  # noqa: E402
+
+
+def first_option_choices(seed):
+    """Play a game offline, always taking the first option."""
+    state = CompactGameState()
+    session = Session(state, random.Random(seed))
+    session.advance()
+    choices = []
+    while not session.finished:
+        choices.append(session.options[0])
+        session.advance(choices[-1])
+    return choices, state
+
+
+async def exchange(game_server, payload):
+    """Send raw bytes to a loopback game server and read until it closes."""
+    server = await asyncio.start_server(
+        game_server.handle_client, "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(payload)
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), 10)
+        writer.close()
+        await writer.wait_closed()
+    return data.decode()
+
+
+class PipelineTest(unittest.TestCase):
+    def test_pipelined_answers_play_a_whole_game(self):
+        """Every answer sent in one write is consumed at its own prompt."""
+        game_server = GameServer(delay=0, color=False, rng=random.Random(1))
+        seed = random.Random(1).getrandbits(64)
+        choices, state = first_option_choices(seed)
+        answers = "".join(f"{choice}\n" for choice in choices + ["no"])
+        output = asyncio.run(exchange(game_server, answers.encode()))
+        self.assertIn(
+            f"Your score: {state.score}, Turns taken: {state.turns}", output
+        )
+        self.assertTrue(output.rstrip().endswith("adventure! 👋"))
+        self.assertEqual(game_server.active_sessions, 0)
+        self.assertEqual(game_server.total_sessions, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
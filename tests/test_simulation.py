@@ -0,0 +1,142 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Cross-checks between the headless engines: the vectorized and
+#          scalar simulators, and the solver against simulated play.
+
+# Standard library imports
+import math
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from gamestate import GameState  # noqa: E402
+from scenes import play  # noqa: E402
+from simulation import run_batch  # noqa: E402
+from solver import OBJECTIVES, solve  # noqa: E402
+
+try:
+    import vectorized  # noqa: E402
+except ImportError:  # NumPy is optional
+    vectorized = None
+
+
+def assertClose(test, observed, expected, standard_error, label):
+    """Fail if observed is more than 5 standard errors from expected."""
+    test.assertLessEqual(
+        abs(observed - expected), 5 * standard_error + 1e-9,
+        f"{label}: {observed} vs {expected} (se {standard_error:.4g})"
+    )
+
+
+@unittest.skipIf(vectorized is None, "NumPy is not installed")
+class VectorizedAgreesWithScalarTest(unittest.TestCase):
+    def test_random_play_statistics_agree(self):
+        """Random play gives the same rates in both engines on fixed seeds."""
+        scalar = run_batch(50000, rng=random.Random(1))
+        vector = vectorized.simulate(200000, seed=1)
+        rates = [("win rate", scalar["wins"], vector["wins"])]
+        names = set(scalar["achievements"]) | set(vector["achievements"])
+        rates += [
+            (name, scalar["achievements"][name], vector["achievements"][name])
+            for name in sorted(names)
+        ]
+        for label, scalar_count, vector_count in rates:
+            p = scalar_count / scalar["games"]
+            q = vector_count / vector["games"]
+            pooled = (scalar_count + vector_count) / (
+                scalar["games"] + vector["games"]
+            )
+            standard_error = math.sqrt(pooled * (1 - pooled) * (
+                1 / scalar["games"] + 1 / vector["games"]
+            ))
+            assertClose(self, p, q, standard_error, label)
+
+        mean = scalar["total_score"] / scalar["games"]
+        variance = sum(
+            count * (score - mean) ** 2
+            for score, count in scalar["scores"].items()
+        ) / scalar["games"]
+        assertClose(
+            self,
+            mean,
+            vector["total_score"] / vector["games"],
+            math.sqrt(variance / scalar["games"] + variance / vector["games"]),
+            "mean score"
+        )
+
+
+class SolverMatchesSimulationTest(unittest.TestCase):
+    CASES = [
+        (max_turns, objective)
+        for max_turns in (2, 3, 10) for objective in OBJECTIVES
+    ]
+
+    def check(self, solution, games, won, scores):
+        expected_score, win_probability = solution.value()
+        mean = sum(scores) / games
+        variance = sum((score - mean) ** 2 for score in scores) / games
+        assertClose(
+            self, mean, expected_score, math.sqrt(variance / games),
+            "expected score"
+        )
+        assertClose(
+            self, won / games, win_probability,
+            math.sqrt(win_probability * (1 - win_probability) / games),
+            "win probability"
+        )
+
+    def test_scalar_play_under_the_solver_policy(self):
+        for max_turns, objective in self.CASES:
+            with self.subTest(max_turns=max_turns, objective=objective):
+                solution = solve(max_turns=max_turns, objective=objective)
+                rng = random.Random(1)
+                won = 0
+                scores = []
+                for _ in range(20000):
+                    game_state = GameState()
+                    game_state.max_turns = max_turns
+                    won += play(
+                        game_state, solution.policy_for(game_state), rng
+                    )
+                    scores.append(game_state.score)
+                self.check(solution, 20000, won, scores)
+
+    @unittest.skipIf(vectorized is None, "NumPy is not installed")
+    def test_vectorized_play_under_the_solver_policy(self):
+        for max_turns, objective in self.CASES:
+            with self.subTest(max_turns=max_turns, objective=objective):
+                solution = solve(max_turns=max_turns, objective=objective)
+                result = vectorized.simulate_batch(
+                    100000, vectorized.np.random.default_rng(1),
+                    policy=solution, max_turns=max_turns
+                )
+                self.check(
+                    solution, 100000, int(result["won"].sum()),
+                    result["score"].tolist()
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for telemetry: results are tagged with the scene
+#          the interpreter saw each game end in.
+
+# Standard library imports
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import game  # noqa: E402
+from analytics import aggregate  # noqa: E402
+from pacing import Pacer  # noqa: E402
+from scenes import GRAPH  # noqa: E402
+from telemetry import EventStream, install, read_events  # noqa: E402
+
+
+class ResultSceneTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.pacer = game.pacer
+        answers = "".join(f"{1 + i % 3}\n" for i in range(200))
+        game.pacer = Pacer(0, io.StringIO(), io.StringIO(answers))
+
+    def tearDown(self):
+        game.pacer = self.pacer
+        self.directory.cleanup()
+
+    def play(self, fmt):
+        filename = os.path.join(self.directory.name, f"events.{fmt}")
+        stream = EventStream(filename, fmt)
+        uninstall = install(stream, game)
+        try:
+            for seed in range(20):
+                game.play_game(0, 0, 10, seed=seed)
+            game.handle_riddle(0)
+        finally:
+            uninstall()
+            stream.close()
+        return filename
+
+    def test_results_name_the_ending_scene(self):
+        for fmt in ("jsonl", "binary"):
+            filename = self.play(fmt)
+            ending = None
+            results = 0
+            for event in read_events(filename):
+                if event["type"] == "outcome":
+                    # Where the game ends if it stops now: here, or the next
+                    # scene if it runs out of turns on the way in
+                    scene = GRAPH[event["scene"]]
+                    outcome = scene.choices[event["choice"]][event["outcome"]]
+                    ending = (outcome.next or scene).name
+                else:
+                    results += 1
+                    self.assertEqual(event["scene"], ending)
+            self.assertEqual(results, 21)
+            endings = aggregate([filename]).report()["endings"]
+            self.assertNotIn("play_game", endings)
+            self.assertEqual(
+                sum(ending["games"] for ending in endings.values()), 21
+            )
+
+    def test_cleared_scene_leaves_result_untagged(self):
+        filename = os.path.join(self.directory.name, "events.jsonl")
+        stream = EventStream(filename)
+        scene = GRAPH.start
+        choice, outcomes = next(iter(scene.choices.items()))
+        stream.outcome(scene, choice, outcomes[0], 0.0)
+        stream.clear_scene()
+        stream.result(True, 10, 3)
+        stream.close()
+        result = list(read_events(filename))[-1]
+        self.assertEqual(result["type"], "result")
+        self.assertIsNone(result["scene"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for the HTTP API: pipelined requests are answered
+#          in order over one connection, even when a handler crashes.
+
+# Standard library imports
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from leaderboard import Leaderboard  # noqa: E402
+from webapi import GameApi  # noqa: E402
+
+
+def request(method, path, body=b"", close=False):
+    """Encode one HTTP/1.1 request."""
+    connection = "Connection: close\r\n" if close else ""
+    return (
+        f"{method} {path} HTTP/1.1\r\n"
+        f"Host: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"{connection}"
+        f"\r\n"
+    ).encode() + body
+
+
+def parse_responses(data):
+    """Split a stream of responses into (status, payload) pairs."""
+    responses = []
+    while data:
+        head, _, data = data.partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = dict(line.split(": ", 1) for line in lines[1:])
+        length = int(headers["Content-Length"])
+        body, data = data[:length], data[length:]
+        responses.append(
+            (int(lines[0].split()[1]), json.loads(body) if body else None)
+        )
+    return responses
+
+
+async def exchange(api, payload):
+    """Send raw bytes to a loopback API server and read until it closes."""
+    server = await asyncio.start_server(api.handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(payload)
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), 10)
+        writer.close()
+        await writer.wait_closed()
+    return data
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.api = GameApi(leaderboard=Leaderboard())
+
+    def test_pipelined_requests_answered_in_order(self):
+        """Every request sent in one write gets its response, in order."""
+        data = asyncio.run(exchange(self.api, b"".join([
+            request("POST", "/api/sessions"),
+            request("GET", "/api/nowhere"),
+            request("GET", "/api/sessions/unknown"),
+            request("GET", "/api/leaderboard", close=True),
+        ])))
+        responses = parse_responses(data)
+        self.assertEqual(
+            [status for status, _ in responses], [201, 404, 404, 200]
+        )
+        self.assertFalse(responses[0][1]["finished"])
+        self.assertEqual(responses[3][1]["games"], 0)
+
+    def test_handler_crash_answers_500_and_keeps_connection(self):
+        """A crashing handler answers 500 and later requests still run."""
+        with mock.patch.object(
+            self.api.leaderboard, "top", side_effect=RuntimeError("boom")
+        ), contextlib.redirect_stderr(io.StringIO()) as stderr:
+            data = asyncio.run(exchange(self.api, b"".join([
+                request("GET", "/api/leaderboard"),
+                request("POST", "/api/sessions", close=True),
+            ])))
+        responses = parse_responses(data)
+        self.assertEqual(
+            responses[0], (500, {"error": "Internal server error"})
+        )
+        self.assertEqual(responses[1][0], 201)
+        self.assertIn("RuntimeError: boom", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Regression tests for world mode: encounters do not end the game,
+#          and recorded world games replay exactly.
+
+# Standard library imports
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import world  # noqa: E402
+from gamestate import GameState  # noqa: E402
+from replay import verify  # noqa: E402
+from sessionlog import RecordingPolicy, make_record  # noqa: E402
+
+
+def random_policy(rng):
+    return lambda scene_name, options: rng.choice(options)
+
+
+def play(seed, render=None):
+    game_state = GameState()
+    game_state.max_turns = 30
+    policy = RecordingPolicy(random_policy(random.Random(seed)))
+    won = world.explore(
+        game_state, world.World(7, max_turns=30), policy,
+        random.Random(seed), render
+    )
+    return game_state, policy, won
+
+
+class ExploreTest(unittest.TestCase):
+    def test_game_over_fires_once_at_the_end(self):
+        game_over = world.game_over
+        calls = []
+
+        def count(state, won):
+            calls.append(won)
+            return game_over(state, won)
+
+        world.game_over = count
+        try:
+            for seed in range(50):
+                lines = []
+                _, _, won = play(seed, lambda color, text: lines.append(text))
+                self.assertEqual(calls.pop(), won)
+                self.assertEqual(calls, [])
+                self.assertFalse(any("You win!" in text for text in lines))
+        finally:
+            world.game_over = game_over
+
+    def test_recorded_games_replay(self):
+        records = []
+        for seed in range(50):
+            game_state, policy, won = play(seed)
+            records.append((seed, make_record(
+                seed, policy.choices, game_state, won, max_turns=30,
+                world_seed=7
+            )))
+        self.assertEqual(verify(records)["mismatches"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
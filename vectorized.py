@@ -0,0 +1,336 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: NumPy-vectorized Monte Carlo of whole batches of games, walking the
+#          compiled scene graph with array operations instead of a per-game
+#          Python loop.
+
+# Standard library imports
+import argparse
+import time
+from collections import Counter
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+from achievements import ENGINE
+from scenes import GRAPH
+
+
+class GraphArrays:
+    """The scene graph flattened into NumPy lookup tables.
+
+    Outcomes of every (scene, option) pair are stored contiguously, so a
+    batch of games can resolve their current scene with fancy indexing.
+    """
+
+    def __init__(self, graph=GRAPH):
+        self.graph = graph
+        # Bits come from the achievement engine, so batch masks mean the
+        # same as GameState's and can go straight to ENGINE.counts()
+        self.achievement_bits = {}
+        for scene in graph.by_id:
+            for outcomes in scene.choices.values():
+                for outcome in outcomes:
+                    for achievement in outcome.achievements:
+                        bit = ENGINE.bit(achievement)
+                        if bit >= 1 << 64:
+                            raise ValueError(
+                                f"Achievement '{achievement}' does not fit "
+                                f"in a 64-bit mask"
+                            )
+                        self.achievement_bits[achievement] = bit
+        self.achievement_bits = dict(
+            sorted(self.achievement_bits.items(), key=lambda item: item[1])
+        )
+        self.achievement_names = tuple(self.achievement_bits)
+
+        scene_count = len(graph.by_id)
+        max_options = max(max(len(scene.keys), 1) for scene in graph.by_id)
+        self.start = graph.start.id
+        self.tick = np.array([scene.tick for scene in graph.by_id], dtype=bool)
+        self.option_count = np.array(
+            [len(scene.keys) for scene in graph.by_id], dtype=np.int64
+        )
+        self.offset = np.zeros((scene_count, max_options), dtype=np.int64)
+        self.count = np.zeros((scene_count, max_options), dtype=np.int64)
+
+        thresholds, scores, next_ids, won, masks = [], [], [], [], []
+        for scene in graph.by_id:
+            options = scene.keys or (None,)
+            for index, option in enumerate(options):
+                outcomes = scene.choices[option]
+                self.offset[scene.id, index] = len(scores)
+                self.count[scene.id, index] = len(outcomes)
+                for outcome in outcomes:
+                    thresholds.append(outcome.threshold)
+                    scores.append(outcome.score)
+                    next_ids.append(
+                        -1 if outcome.next is None else outcome.next.id
+                    )
+                    won.append(bool(outcome.won))
+                    mask = 0
+                    for achievement in outcome.achievements:
+                        mask |= self.achievement_bits[achievement]
+                    masks.append(mask)
+        self.max_outcomes = int(self.count.max())
+        # Pad so offset + j never reads past the end for j < max_outcomes.
+        padding = self.max_outcomes
+        self.threshold = np.array(thresholds + [1.0] * padding)
+        self.score = np.array(scores + [0] * padding, dtype=np.int64)
+        self.next = np.array(next_ids + [-1] * padding, dtype=np.int64)
+        self.won = np.array(won + [False] * padding, dtype=bool)
+        self.achievements = np.array(masks + [0] * padding, dtype=np.uint64)
+
+    def policy_table(self, policy, max_turns):
+        """Turn a policy into a (scene, turns) -> option index table.
+
+        Args:
+            policy: None for uniformly random choices, a dict mapping scene
+                    names to option strings (scenes left out are chosen at
+                    random), or a solver Solution.
+            max_turns (int): The maximum number of turns allowed.
+
+        Returns:
+            numpy.ndarray: Option index per scene id and turn count, with -1
+                           meaning "choose uniformly at random".
+        """
+        table = np.full((len(self.graph.by_id), max_turns + 1), -1,
+                        dtype=np.int64)
+        if policy is None:
+            return table
+        for scene in self.graph.by_id:
+            if not scene.keys:
+                continue
+            for turns in range(max_turns + 1):
+                if isinstance(policy, dict):
+                    option = policy.get(scene.name)
+                else:
+                    option = policy.policy.get((scene.name, turns))
+                if option is not None:
+                    table[scene.id, turns] = scene.keys.index(option)
+        return table
+
+
+def draw_outcomes(arrays, scenes, options, rng):
+    """Draw one weighted outcome per game against cumulative thresholds.
+
+    Args:
+        arrays (GraphArrays): Flattened scene graph.
+        scenes (numpy.ndarray): Current scene id of each game.
+        options (numpy.ndarray): Chosen option index of each game (0 for
+                                 scenes that resolve automatically).
+        rng (numpy.random.Generator): Source of the outcome rolls.
+
+    Returns:
+        numpy.ndarray: Index into the flattened outcome arrays per game.
+    """
+    base = arrays.offset[scenes, options]
+    count = arrays.count[scenes, options]
+    roll = rng.random(base.size)
+    outcome = base.copy()
+    for j in range(1, arrays.max_outcomes):
+        outcome += (j < count) & (roll >= arrays.threshold[base + j - 1])
+    return outcome
+
+
+def simulate_batch(games, rng, arrays=None, policy=None, score=0, turns=0,
+                   max_turns=10):
+    """Play a whole batch of games at once with array operations.
+
+    Every live game advances one scene per iteration: turn costs and the
+    max_turns cutoff, the player's option, the weighted outcome draw (the
+    bushes and trail splits and the fight, hide, bridge, lock, spell,
+    question and flee rolls alike), the score delta and the achievement bits
+    are all applied to the batch at once.
+
+    Args:
+        games (int): Number of games in the batch.
+        rng (numpy.random.Generator): Source of the choice and outcome draws.
+        arrays (GraphArrays): Flattened scene graph. Defaults to GRAPH's.
+        policy: None, a dict of scene name to option, or a solver Solution.
+        score (int): Starting score of every game. Defaults to 0.
+        turns (int): Starting turns of every game. Defaults to 0.
+        max_turns (int): The maximum number of turns allowed. Defaults to 10.
+
+    Returns:
+        dict: Arrays "won" (bool), "score" and "turns" (int64) and
+              "achievements" (uint64 bitmasks over the achievement
+              engine's bits).
+    """
+    arrays = arrays or default_arrays()
+    table = arrays.policy_table(policy, max_turns)
+
+    scene = np.full(games, arrays.start, dtype=np.int64)
+    scores = np.full(games, score, dtype=np.int64)
+    turn_counts = np.full(games, turns, dtype=np.int64)
+    won = np.zeros(games, dtype=bool)
+    achievements = np.zeros(games, dtype=np.uint64)
+    live = np.arange(games)
+
+    while live.size:
+        current = scene[live]
+
+        # Turn costs and the max_turns cutoff
+        ticking = arrays.tick[current]
+        turn_counts[live] += ticking
+        timed_out = ticking & (turn_counts[live] >= max_turns)
+        if timed_out.any():
+            keep = ~timed_out
+            live = live[keep]
+            current = current[keep]
+
+        # Player's option: table lookup, or uniform where the table says -1
+        option = table[current, np.minimum(turn_counts[live], max_turns)]
+        options = arrays.option_count[current]
+        uniform = (option < 0) & (options > 0)
+        option[uniform] = (
+            rng.random(int(uniform.sum())) * options[uniform]
+        ).astype(np.int64)
+        option[options == 0] = 0
+
+        outcome = draw_outcomes(arrays, current, option, rng)
+        scores[live] += arrays.score[outcome]
+        achievements[live] |= arrays.achievements[outcome]
+        following = arrays.next[outcome]
+        finished = following < 0
+        won[live[finished]] = arrays.won[outcome[finished]]
+        scene[live] = following
+        live = live[~finished]
+
+    return {
+        "won": won,
+        "score": scores,
+        "turns": turn_counts,
+        "achievements": achievements,
+    }
+
+
+def summarize(result, arrays=None):
+    """Reduce a batch result to totals and histograms like run_batch's.
+
+    Args:
+        result (dict): Arrays as returned by simulate_batch.
+        arrays (GraphArrays): Flattened scene graph used for the batch.
+
+    Returns:
+        dict: Keys "games", "wins", "total_score", "scores", "turns" and
+              "achievements", matching simulation.run_batch.
+    """
+    arrays = arrays or default_arrays()
+    values, counts = np.unique(result["score"], return_counts=True)
+    scores = Counter(dict(zip(values.tolist(), counts.tolist())))
+    values, counts = np.unique(result["turns"], return_counts=True)
+    turns = Counter(dict(zip(values.tolist(), counts.tolist())))
+    achievements = Counter()
+    for name, bit in arrays.achievement_bits.items():
+        bit = np.uint64(bit)
+        unlocked = int(np.count_nonzero(result["achievements"] & bit))
+        if unlocked:
+            achievements[name] = unlocked
+    return {
+        "games": int(result["won"].size),
+        "wins": int(np.count_nonzero(result["won"])),
+        "total_score": int(result["score"].sum()),
+        "scores": scores,
+        "turns": turns,
+        "achievements": achievements,
+    }
+
+
+def simulate(games, seed=None, policy=None, batch_size=1000000,
+             max_turns=10):
+    """Play any number of games in fixed-size vectorized batches.
+
+    Args:
+        games (int): Total number of games to play.
+        seed (int): Seed for numpy.random.default_rng. Defaults to None.
+        policy: None, a dict of scene name to option, or a solver Solution.
+        batch_size (int): Games per batch, bounding peak memory.
+        max_turns (int): The maximum number of turns allowed per game.
+
+    Returns:
+        dict: Merged totals and histograms in the run_batch format.
+    """
+    rng = np.random.default_rng(seed)
+    arrays = default_arrays()
+    total = {
+        "games": 0,
+        "wins": 0,
+        "total_score": 0,
+        "scores": Counter(),
+        "turns": Counter(),
+        "achievements": Counter(),
+    }
+    remaining = games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        stats = summarize(
+            simulate_batch(size, rng, arrays, policy, max_turns=max_turns),
+            arrays
+        )
+        for key in ("games", "wins", "total_score"):
+            total[key] += stats[key]
+        for key in ("scores", "turns", "achievements"):
+            total[key].update(stats[key])
+        remaining -= size
+    return total
+
+
+_ARRAYS = None
+
+
+def default_arrays():
+    """Build (once) and return the flattened tables for GRAPH."""
+    global _ARRAYS
+    if _ARRAYS is None:
+        _ARRAYS = GraphArrays(GRAPH)
+    return _ARRAYS
+
+
+def main():
+    """Run a vectorized simulation from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Run vectorized Arcane Echoes Monte Carlo batches."
+    )
+    parser.add_argument("-n", "--games", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-turns", type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = simulate(args.games, args.seed, max_turns=args.max_turns)
+    elapsed = time.perf_counter() - start
+
+    print(f"Games: {stats['games']}")
+    if stats["games"]:
+        print(f"Win rate: {stats['wins'] / stats['games']:.4f}")
+        print(f"Mean score: {stats['total_score'] / stats['games']:.2f}")
+    for name, count in stats["achievements"].most_common():
+        print(f"- {name}: {count}")
+    print(
+        f"Elapsed: {elapsed:.3f}s "
+        f"({stats['games'] / max(elapsed, 1e-9):,.0f} games/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Lightweight HTTP/JSON backend that drives the Python game logic for
+#          browser sessions such as pages/game.html.
+
+# Standard library imports
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import sys
+import time
+import traceback
+from collections import OrderedDict
+
+# Local imports
+from compact import CompactGameState
+from leaderboard import Leaderboard
+from scenes import Session
+from server import snapshot_leaderboard
+from sessionlog import SessionLog
+
+
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 65536
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class WebSession:
+    __slots__ = ("session", "lines", "expires", "seed", "choices")
+
+    def __init__(self, session, lines, expires, seed=None):
+        self.session = session
+        self.lines = lines
+        self.expires = expires
+        self.seed = seed
+        self.choices = []
+
+
+class SessionStore:
+    """In-memory sessions kept in least-recently-used order.
+
+    Each access refreshes a session's expiry and moves it to the back, so
+    expired sessions always collect at the front and are swept in O(1)
+    amortized time. max_sessions caps memory even under a flood of new
+    sessions by evicting the least recently used one.
+    """
+
+    def __init__(self, ttl=1800.0, max_sessions=100000, rng=None,
+                 clock=time.monotonic):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.sessions = OrderedDict()
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def expire(self):
+        """Drop every session whose time-to-live has run out."""
+        now = self.clock()
+        sessions = self.sessions
+        while sessions:
+            session_id, web_session = next(iter(sessions.items()))
+            if web_session.expires > now:
+                break
+            del sessions[session_id]
+
+    def create(self):
+        """Start a new game; return (session_id, WebSession)."""
+        self.expire()
+        while len(self.sessions) >= self.max_sessions:
+            self.sessions.popitem(last=False)
+        # A per-game seed makes the session reproducible from the log
+        seed = self.rng.getrandbits(64)
+        session = Session(CompactGameState(), random.Random(seed))
+        web_session = WebSession(
+            session, session.advance(), self.clock() + self.ttl, seed
+        )
+        session_id = secrets.token_urlsafe(12)
+        self.sessions[session_id] = web_session
+        return session_id, web_session
+
+    def get(self, session_id):
+        """Look up a live session and refresh its expiry.
+
+        Raises:
+            HttpError: 404 if the session does not exist or has expired.
+        """
+        self.expire()
+        web_session = self.sessions.get(session_id)
+        if web_session is None:
+            raise HttpError(404, "Unknown or expired session")
+        web_session.expires = self.clock() + self.ttl
+        self.sessions.move_to_end(session_id)
+        return web_session
+
+    def delete(self, session_id):
+        """Remove a session if it exists."""
+        self.sessions.pop(session_id, None)
+
+
+def session_view(session_id, web_session):
+    """Build the JSON document describing a session's current scene.
+
+    Args:
+        session_id (str): The session's identifier.
+        web_session (WebSession): The session record.
+
+    Returns:
+        dict: The lines shown since the last choice, the prompt and options
+              awaiting an answer, and the player's score, turns, inventory
+              and achievements.
+    """
+    session = web_session.session
+    state = session.state
+    return {
+        "id": session_id,
+        "lines": [
+            {"color": color, "text": text} for color, text in web_session.lines
+        ],
+        "scene": None if session.finished else session.scene.name,
+        "prompt": None if session.finished else session.scene.prompt,
+        "options": list(session.options),
+        "finished": session.finished,
+        "won": session.won if session.finished else None,
+        "score": state.score,
+        "turns": state.turns,
+        "max_turns": state.max_turns,
+        "inventory": state.inventory.get_items(),
+        "achievements": sorted(state.achievements),
+    }
+
+
+def leaderboard_view(leaderboard, size=10):
+    """Build the JSON document describing the leaderboard.
+
+    Args:
+        leaderboard (Leaderboard): The leaderboard to describe.
+        size (int): How many of the best games to include.
+
+    Returns:
+        dict: The number of recorded games, the best games, and the score
+              quartiles.
+    """
+    return {
+        "games": leaderboard.count,
+        "top": [
+            {"player": player, "score": score}
+            for player, score in leaderboard.top(size)
+        ],
+        "quartiles": [leaderboard.quantile(q) for q in (0.25, 0.5, 0.75)],
+    }
+
+
+class GameApi:
+    def __init__(self, store=None, keepalive_timeout=15.0, leaderboard=None,
+                 log=None):
+        self.store = store or SessionStore()
+        self.keepalive_timeout = keepalive_timeout
+        self.leaderboard = leaderboard
+        self.log = log
+
+    def dispatch(self, method, path, body):
+        """Answer one request, turning a crashed handler into a 500 response.
+
+        A handler bug must not drop the connection: pipelined clients would
+        be left waiting for responses that never come. The traceback goes to
+        stderr and the client gets a JSON error instead.
+
+        Returns:
+            tuple: (status, payload) as returned by route.
+
+        Raises:
+            HttpError: For unknown routes, bad input, or unknown sessions.
+        """
+        try:
+            return self.route(method, path, body)
+        except HttpError:
+            raise
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            return 500, {"error": "Internal server error"}
+
+    def route(self, method, path, body):
+        """Route one request to its handler.
+
+        Routes:
+            POST   /api/sessions              start a game
+            GET    /api/sessions/<id>         current scene
+            POST   /api/sessions/<id>/choice  submit {"choice": "1"}
+            DELETE /api/sessions/<id>         end a session
+            GET    /api/leaderboard           best games and quartiles
+
+        Returns:
+            tuple: (status, payload) where payload is JSON-serializable or
+                   None for an empty response.
+
+        Raises:
+            HttpError: For unknown routes, bad input, or unknown sessions.
+        """
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+        if parts == ["api", "leaderboard"] and self.leaderboard is not None:
+            if method != "GET":
+                raise HttpError(405, "Use GET to read the leaderboard")
+            return 200, leaderboard_view(self.leaderboard)
+        if parts[:2] != ["api", "sessions"] or len(parts) > 4:
+            raise HttpError(404, "Not found")
+
+        if len(parts) == 2:
+            if method != "POST":
+                raise HttpError(405, "Use POST to start a session")
+            session_id, web_session = self.store.create()
+            return 201, session_view(session_id, web_session)
+
+        session_id = parts[2]
+        if len(parts) == 3:
+            if method == "GET":
+                web_session = self.store.get(session_id)
+                return 200, session_view(session_id, web_session)
+            if method == "DELETE":
+                self.store.delete(session_id)
+                return 204, None
+            raise HttpError(405, "Use GET or DELETE on a session")
+
+        if parts[3] != "choice":
+            raise HttpError(404, "Not found")
+        if method != "POST":
+            raise HttpError(405, "Use POST to submit a choice")
+        web_session = self.store.get(session_id)
+        if web_session.session.finished:
+            raise HttpError(409, "The game is over")
+        try:
+            choice = str(json.loads(body or b"{}")["choice"])
+        except (ValueError, KeyError, TypeError):
+            raise HttpError(400, 'Expected a JSON body like {"choice": "1"}')
+        session = web_session.session
+        try:
+            web_session.lines = session.advance(choice)
+        except ValueError as exc:
+            raise HttpError(400, str(exc))
+        web_session.choices.append(choice)
+        if session.finished:
+            if self.leaderboard is not None:
+                self.leaderboard.record("guest", session.state.score)
+            if self.log is not None:
+                self.log.write(
+                    web_session.seed, web_session.choices, session.state,
+                    session.won
+                )
+        return 200, session_view(session_id, web_session)
+
+    async def read_request(self, reader):
+        """Read one request; return (method, path, headers, body) or None.
+
+        Raises:
+            HttpError: If the request is malformed or too large.
+        """
+        try:
+            request_line = await asyncio.wait_for(
+                reader.readline(), self.keepalive_timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+        if not request_line:
+            return None
+        try:
+            method, path, version = request_line.decode("latin-1").split()
+        except ValueError:
+            raise HttpError(400, "Malformed request line")
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError(400, "Too many headers")
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HttpError(400, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        headers[":version"] = version
+        return method.upper(), path, headers, body
+
+    def encode_response(self, status, payload, keep_alive):
+        """Serialize a response with CORS headers for browser front ends."""
+        body = b"" if payload is None else json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Access-Control-Allow-Origin: *\r\n"
+            f"Access-Control-Allow-Methods: GET, POST, DELETE, OPTIONS\r\n"
+            f"Access-Control-Allow-Headers: Content-Type\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"\r\n"
+        )
+        return head.encode() + body
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until it closes.
+
+        Requests are answered strictly in order, so pipelined requests work:
+        each request is parsed straight from the read buffer once the
+        previous response has been queued.
+        """
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self.read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    connection = headers.get("connection", "").lower()
+                    if headers[":version"] == "HTTP/1.0":
+                        keep_alive = connection == "keep-alive"
+                    else:
+                        keep_alive = connection != "close"
+                    if method == "OPTIONS":
+                        status, payload = 204, None
+                    else:
+                        status, payload = self.dispatch(method, path, body)
+                except HttpError as exc:
+                    status, payload = exc.status, {"error": str(exc)}
+                writer.write(self.encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(api, host="127.0.0.1", port=8080, backlog=1024,
+                leaderboard_path=None, snapshot_interval=60.0):
+    """Run the HTTP API until cancelled.
+
+    Args:
+        api (GameApi): The API holding the session store.
+        host (str): Host to bind. Defaults to "127.0.0.1".
+        port (int): Port to bind. Defaults to 8080.
+        backlog (int): Pending-connection queue size.
+        leaderboard_path (str): Snapshot the API's leaderboard to this file
+                                every snapshot_interval seconds.
+        snapshot_interval (float): Seconds between leaderboard snapshots.
+    """
+    server = await asyncio.start_server(
+        api.handle_connection, host, port, backlog=backlog
+    )
+    # Keep the snapshot task so it can be cancelled on shutdown
+    tasks = []
+    if leaderboard_path and api.leaderboard is not None:
+        tasks.append(asyncio.ensure_future(snapshot_leaderboard(
+            api.leaderboard, leaderboard_path, snapshot_interval
+        )))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    """Start the HTTP API from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Serve Arcane Echoes sessions over HTTP/JSON."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--session-ttl", type=float, default=1800.0,
+        help="seconds of inactivity before a session expires"
+    )
+    parser.add_argument("--max-sessions", type=int, default=100000)
+    parser.add_argument(
+        "--leaderboard", metavar="PATH", default="leaderboard.json",
+        help="file the leaderboard is restored from and snapshotted to"
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", default=None,
+        help="append each game's seed and choices to this log for replay.py"
+    )
+    args = parser.parse_args()
+
+    leaderboard = Leaderboard.restore(args.leaderboard) or Leaderboard()
+    api = GameApi(
+        SessionStore(args.session_ttl, args.max_sessions),
+        leaderboard=leaderboard,
+        log=SessionLog(args.record) if args.record else None
+    )
+    try:
+        asyncio.run(serve(
+            api, args.host, args.port, leaderboard_path=args.leaderboard
+        ))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        leaderboard.snapshot(args.leaderboard)
+        if api.log is not None:
+            api.log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# Arcane Echoes
+# Copyright © 2025 Ahmed Shafiq. All rights reserved.
+#
+# Arcane Echoes Proprietary License
+#
+# This software, including all associated code, documentation, and assets, is
+# the exclusive property of Ahmed Shafiq. Only Ahmed Shafiq is permitted to use,
+# execute, or access this software. No other individual, entity, or organization
+# may use, copy, modify, distribute, sublicense, or create derivative works of
+# this software, in whole or in part, without the prior express written
+# permission of Ahmed Shafiq.
+#
+# Any unauthorized use, reproduction, distribution, or modification of this
+# software is strictly prohibited and may result in legal action. All rights not
+# expressly granted herein are reserved by Ahmed Shafiq.
+#
+# For permission requests, contact Ahmed Shafiq directly.
+#
+# Created by: Ahmed Shafiq
+# Date: April 2025
+# Purpose: Procedural world mode: an unbounded forest whose regions are
+#          generated on demand from a seed and their coordinates, using the
+#          existing encounters as templates, with an LRU cache of regions.
+
+# Standard library imports
+import random
+from collections import OrderedDict
+
+# Local imports
+from scenes import GRAPH, game_over, play
+
+
+# Encounter scenes a region can hold. final_path is left out because its
+# text continues the riddle's story.
+TEMPLATES = ("riddle", "squirrel", "monster", "vault", "ghost")
+
+# Chance a region holds an encounter, rising with distance from the start
+BASE_ENCOUNTER_CHANCE = 0.3
+ENCOUNTER_CHANCE_PER_STEP = 0.05
+MAX_ENCOUNTER_CHANCE = 0.8
+
+ADJECTIVES = (
+    "moss-covered", "sun-dappled", "misty", "silent", "tangled", "ancient",
+    "whispering", "moonlit", "overgrown", "frost-touched",
+)
+PLACES = (
+    "hollow 🍂", "grove of oaks 🌳", "clearing 🌼", "thicket 🌿",
+    "ring of mushrooms 🍄", "brook crossing 💧", "ridge ⛰️", "glade 🌲",
+)
+
+# Scene name passed to the policy when the player picks a direction
+MOVE_SCENE = "forest"
+MOVE_PROMPT = "Which way? (1/2/3/4): "
+MOVE_RETRY = "Please enter 1, 2, 3, or 4."
+DIRECTIONS = {
+    "1": ("north", 0, 1),
+    "2": ("east", 1, 0),
+    "3": ("south", 0, -1),
+    "4": ("west", -1, 0),
+}
+MOVE_LINES = [
+    ("CYAN", f"{key}️⃣ Head {name}.")
+    for key, (name, _, _) in DIRECTIONS.items()
+]
+NIGHTFALL_LINES = [
+    ("YELLOW", "🌙 Night falls over the forest and your wandering ends."),
+    ("GREEN", "You made it through alive. You win! 🎉"),
+]
+
+
+class Region:
+    __slots__ = ("x", "y", "name", "encounter")
+
+    def __init__(self, x, y, name, encounter):
+        self.x = x
+        self.y = y
+        self.name = name
+        # Scene name of the region's encounter, or None for a quiet region
+        self.encounter = encounter
+
+
+def generate_region(seed, x, y):
+    """Generate the region at a coordinate; the same inputs give the same
+    region in every run and on every machine.
+
+    Args:
+        seed (int): The world's seed.
+        x (int): East-west coordinate; the start is (0, 0).
+        y (int): North-south coordinate.
+
+    Returns:
+        Region: The generated region.
+    """
+    # String seeds are hashed with SHA-512, independent of PYTHONHASHSEED
+    rng = random.Random(f"{seed}:{x}:{y}")
+    name = f"a {rng.choice(ADJECTIVES)} {rng.choice(PLACES)}"
+    chance = min(
+        MAX_ENCOUNTER_CHANCE,
+        BASE_ENCOUNTER_CHANCE
+        + ENCOUNTER_CHANCE_PER_STEP * (abs(x) + abs(y))
+    )
+    encounter = None
+    if (x, y) != (0, 0) and rng.random() < chance:
+        encounter = rng.choice(TEMPLATES)
+    return Region(x, y, name, encounter)
+
+
+class World:
+    """An unbounded forest of regions generated from a seed on demand.
+
+    At most cache_size regions are kept; the least recently visited is
+    evicted first and simply generated again if the player returns, so
+    memory stays constant however far the world is explored.
+    """
+
+    def __init__(self, seed, cache_size=256, max_turns=30):
+        self.seed = seed
+        self.cache_size = cache_size
+        self.max_turns = max_turns
+        self.hits = 0
+        self.misses = 0
+        self._regions = OrderedDict()
+
+    def __len__(self):
+        return len(self._regions)
+
+    def region(self, x, y):
+        """Return the region at a coordinate, generating it if needed."""
+        key = (x, y)
+        region = self._regions.get(key)
+        if region is not None:
+            self.hits += 1
+            self._regions.move_to_end(key)
+            return region
+        self.misses += 1
+        region = self._regions[key] = generate_region(self.seed, x, y)
+        if len(self._regions) > self.cache_size:
+            self._regions.popitem(last=False)
+        return region
+
+
+def explore(state, world, policy, rng=random, render=None, trace=None):
+    """Play a world-mode game: wander the forest until a loss or nightfall.
+
+    Each move costs a turn. Entering a region with an encounter plays it
+    with the normal interpreter; winning or surviving it clears the region
+    for the rest of the game, and losing it ends the game. Running out of
+    turns ends the game as a win. Encounters are played as part of a game
+    that goes on, so the game_over event fires once, when the game ends.
+
+    Args:
+        state (GameState): Game state to update.
+        world (World): The world to explore.
+        policy (callable): policy(scene_name, options), called with
+                           MOVE_SCENE and the DIRECTIONS keys for moves.
+        rng (random.Random): Source of encounter outcome draws.
+        render (callable): Optional render(color, text) callback.
+        trace (callable): Optional trace callback passed on to play().
+
+    Returns:
+        bool: True if the player survived until nightfall.
+    """
+    x = y = 0
+    cleared = set()
+    while True:
+        region = world.region(x, y)
+        if render is not None:
+            render("GREEN", f"You are in {region.name} at ({x}, {y}).")
+        if region.encounter and (x, y) not in cleared:
+            if not play(state, policy, rng, render, GRAPH[region.encounter],
+                        single=True, trace=trace, ending=False):
+                return game_over(state, False)
+            cleared.add((x, y))
+
+        if render is not None:
+            remaining = state.max_turns - state.turns
+            render("YELLOW", f"⏳ You have {remaining} turns remaining.")
+            for color, text in MOVE_LINES:
+                render(color, text)
+        _, dx, dy = DIRECTIONS[policy(MOVE_SCENE, tuple(DIRECTIONS))]
+        x += dx
+        y += dy
+        state.turns += 1
+        if state.turns >= state.max_turns:
+            if render is not None:
+                for color, text in NIGHTFALL_LINES:
+                    render(color, text)
+            return game_over(state, True)